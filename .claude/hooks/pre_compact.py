@@ -8,14 +8,25 @@ Claude recover context after compaction or in new sessions.
 This hook receives JSON input via stdin with compaction trigger info.
 """
 
+import functools
+import heapq
 import json
 import sys
 import os
 from pathlib import Path
 from datetime import datetime
 
+# Pretty-print JSON output for debugging (PRETTY=1); compact by default
+JSON_INDENT = 2 if os.environ.get("PRETTY") == "1" else None
+JSON_SEPARATORS = None if JSON_INDENT else (',', ':')
+
+def dump_json(data):
+    """Serialize hook output/state as compact JSON (indented when PRETTY=1)"""
+    return json.dumps(data, indent=JSON_INDENT, separators=JSON_SEPARATORS)
+
+@functools.lru_cache(maxsize=1)
 def find_project_root():
-    """Find project root by looking for CLAUDE.md"""
+    """Find project root by looking for CLAUDE.md (cached; cwd is fixed per hook run)"""
     current = Path.cwd()
     while current != current.parent:
         if (current / "CLAUDE.md").exists():
@@ -32,32 +43,58 @@ def scan_active_features():
         return []
 
     active_features = []
-    for feat_dir in features_dir.iterdir():
-        if feat_dir.is_dir() and feat_dir.name.startswith("FEAT-"):
-            # Check if planning is complete
-            has_prd = (feat_dir / "prd.md").exists()
-            has_research = (feat_dir / "research.md").exists()
-            has_architecture = (feat_dir / "architecture.md").exists()
-
-            status = "unknown"
-            if has_architecture:
-                status = "ready_for_implementation"
-            elif has_research:
-                status = "planning"
-            elif has_prd:
-                status = "exploring"
-
-            active_features.append({
-                "id": feat_dir.name,
-                "path": str(feat_dir.relative_to(project_root)),
-                "status": status,
-                "has_prd": has_prd,
-                "has_research": has_research,
-                "has_architecture": has_architecture
-            })
+    with os.scandir(features_dir) as entries:
+        feat_dirs = [
+            entry for entry in entries
+            if entry.name.startswith("FEAT-") and entry.is_dir(follow_symlinks=False)
+        ]
+
+    for feat_dir in feat_dirs:
+        # One directory listing instead of a stat per planning document
+        with os.scandir(feat_dir.path) as it:
+            names = {e.name for e in it if e.is_file(follow_symlinks=False)}
+
+        # Check if planning is complete
+        has_prd = "prd.md" in names
+        has_research = "research.md" in names
+        has_architecture = "architecture.md" in names
+
+        status = "unknown"
+        if has_architecture:
+            status = "ready_for_implementation"
+        elif has_research:
+            status = "planning"
+        elif has_prd:
+            status = "exploring"
+
+        active_features.append({
+            "id": feat_dir.name,
+            "path": os.path.relpath(feat_dir.path, project_root),
+            "status": status,
+            "has_prd": has_prd,
+            "has_research": has_research,
+            "has_architecture": has_architecture
+        })
 
     return active_features
 
+def _walk_md(root):
+    """Yield (path, mtime) for every .md file under root using os.scandir"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.md'):
+                            yield entry.path, entry.stat().st_mtime
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
 def get_recent_changes():
     """Get list of recently modified files in docs/"""
     project_root = find_project_root()
@@ -66,20 +103,15 @@ def get_recent_changes():
     if not docs_dir.exists():
         return []
 
-    recent_files = []
-    for md_file in docs_dir.rglob("*.md"):
-        try:
-            mtime = md_file.stat().st_mtime
-            recent_files.append({
-                "path": str(md_file.relative_to(project_root)),
-                "modified": datetime.fromtimestamp(mtime).isoformat()
-            })
-        except:
-            pass
-
-    # Sort by modification time, most recent first
-    recent_files.sort(key=lambda x: x["modified"], reverse=True)
-    return recent_files[:10]  # Keep top 10
+    # Keep top 10, most recent first; only format timestamps for survivors
+    newest = heapq.nlargest(10, _walk_md(str(docs_dir)), key=lambda item: item[1])
+    return [
+        {
+            "path": os.path.relpath(path, project_root),
+            "modified": datetime.fromtimestamp(mtime).isoformat()
+        }
+        for path, mtime in newest
+    ]
 
 def save_session_state(trigger, instructions, active_features, recent_changes):
     """Save session state to .claude/session-state.json"""
@@ -103,8 +135,20 @@ def save_session_state(trigger, instructions, active_features, recent_changes):
         }
     }
 
-    with open(state_file, 'w') as f:
-        json.dump(state, f, indent=2)
+    # Write to a temp file and rename so an aborted compaction can never
+    # leave a truncated state file behind (no fsync - durability isn't
+    # worth the latency for a hook)
+    payload = dump_json(state).encode()
+    tmp_file = state_file.with_suffix(f".json.{os.getpid()}.tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Buffered write() retries short writes until the payload is out
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, state_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
 
     return state_file
 
@@ -132,7 +176,7 @@ def main():
             "compaction_type": trigger
         }
 
-        print(json.dumps(recovery_msg, indent=2))
+        print(dump_json(recovery_msg))
 
         # Exit 0 = success (allow compaction to proceed)
         sys.exit(0)
@@ -144,7 +188,7 @@ def main():
             "details": str(e),
             "note": "Compaction will proceed anyway"
         }
-        print(json.dumps(error_msg, indent=2), file=sys.stderr)
+        print(dump_json(error_msg), file=sys.stderr)
         sys.exit(0)  # Don't block compaction even if hook fails
 
 if __name__ == "__main__":
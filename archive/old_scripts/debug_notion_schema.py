@@ -15,7 +15,8 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.config.config import VetScrapingConfig
-from notion_client import Client
+from src.integrations.notion_schema import REQUIRED_PROPERTIES, diff_schema, fetch_schema
+from src.integrations.notion_schema_daemon import fetch_schema_via_daemon
 
 def main():
     config = VetScrapingConfig()
@@ -27,8 +28,9 @@ def main():
     print()
 
     try:
-        client = Client(auth=config.notion.api_key)
-        database = client.databases.retrieve(database_id=config.notion.database_id)
+        database = fetch_schema_via_daemon(config.notion.database_id)
+        if database is None:
+            database = fetch_schema(config.notion.database_id, config.notion.api_key)
 
         print(f"Database Title: {database.get('title', [{}])[0].get('plain_text', 'N/A')}")
         print()
@@ -48,25 +50,16 @@ def main():
         print("REQUIRED PROPERTIES FOR FEAT-001:")
         print("-" * 80)
 
-        required = {
-            "Name": "title",
-            "Google Place ID": "rich_text",
-            "Address": "rich_text",
-            "Phone": "phone_number",
-            "Website": "url",
-            "Google Review Count": "number",
-            "Google Rating": "number",
-            "Lead Score": "number",
-            "Status": "select",
-        }
+        required = REQUIRED_PROPERTIES
+
+        diff = diff_schema(required, properties)
+        mismatched = {name: actual for name, _, actual in diff.mismatches}
 
         for name, expected_type in sorted(required.items()):
-            if name in properties:
-                actual_type = properties[name].get("type")
-                if actual_type == expected_type:
-                    print(f"  ✓ {name:30} → {expected_type}")
-                else:
-                    print(f"  ⚠ {name:30} → Expected: {expected_type}, Got: {actual_type}")
+            if name in diff.existing:
+                print(f"  ✓ {name:30} → {expected_type}")
+            elif name in mismatched:
+                print(f"  ⚠ {name:30} → Expected: {expected_type}, Got: {mismatched[name]}")
             else:
                 print(f"  ✗ {name:30} → MISSING (needs {expected_type})")
 
@@ -74,22 +67,16 @@ def main():
         print("=" * 80)
 
         # Summary
-        existing_names = set(properties.keys())
-        required_names = set(required.keys())
-        missing = required_names - existing_names
-
-        if missing:
-            print(f"❌ VALIDATION FAILED: Missing {len(missing)} properties")
-            print(f"   Missing: {sorted(missing)}")
+        if diff.missing:
+            print(f"❌ VALIDATION FAILED: Missing {len(diff.missing)} properties")
+            print(f"   Missing: {sorted(diff.missing)}")
         else:
             print("✓ All required properties exist")
 
-            # Check types
-            type_errors = []
-            for name, expected_type in required.items():
-                actual_type = properties[name].get("type")
-                if actual_type != expected_type:
-                    type_errors.append(f"{name} (expected {expected_type}, got {actual_type})")
+            type_errors = [
+                f"{name} (expected {expected}, got {actual})"
+                for name, expected, actual in diff.mismatches
+            ]
 
             if type_errors:
                 print(f"⚠ Type mismatches: {type_errors}")
@@ -9,50 +9,40 @@ Usage:
     python test_enrichment_pipeline.py
 """
 
+import io
 import sys
 import asyncio
+import contextvars
+import importlib
+import traceback
 from pathlib import Path
 
 
+# Modules checked by test_imports, in pipeline phase order
+IMPORT_CHECKS = (
+    "src.models.enrichment_models",          # Phase 1: Models
+    "src.utils.cost_tracker",                # Phase 1: Utilities
+    "src.enrichment.website_scraper",        # Phase 2: Website scraper
+    "src.enrichment.llm_extractor",          # Phase 3: LLM extractor
+    "src.integrations.notion_enrichment",    # Phase 4: Notion client
+    "src.enrichment.enrichment_orchestrator",  # Phase 5: Orchestrator
+)
+
+
 def test_imports():
     """Test that all modules import correctly."""
     print("Testing imports...")
     print("-" * 60)
 
     try:
-        # Phase 1: Models and utilities
-        from src.models.enrichment_models import (
-            VetPracticeExtraction,
-            DecisionMaker,
-            WebsiteData,
-            EnrichmentResult
-        )
-        print("✅ enrichment_models imported")
-
-        from src.utils.cost_tracker import CostTracker, CostLimitExceeded
-        print("✅ cost_tracker imported")
-
-        # Phase 2: Website scraper
-        from src.enrichment.website_scraper import WebsiteScraper
-        print("✅ website_scraper imported")
-
-        # Phase 3: LLM extractor
-        from src.enrichment.llm_extractor import LLMExtractor
-        print("✅ llm_extractor imported")
-
-        # Phase 4: Notion client
-        from src.integrations.notion_enrichment import NotionEnrichmentClient
-        print("✅ notion_enrichment imported")
-
-        # Phase 5: Orchestrator
-        from src.enrichment.enrichment_orchestrator import EnrichmentOrchestrator
-        print("✅ enrichment_orchestrator imported")
+        for module_name in IMPORT_CHECKS:
+            importlib.import_module(module_name)
+            print(f"✅ {module_name.rsplit('.', 1)[-1]} imported")
 
         return True
 
     except ImportError as e:
         print(f"❌ Import failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -68,7 +58,6 @@ def test_model_validation():
             DecisionMaker,
             WebsiteData
         )
-        from datetime import datetime
 
         # Test DecisionMaker
         dm = DecisionMaker(
@@ -102,7 +91,6 @@ def test_model_validation():
 
     except Exception as e:
         print(f"❌ Model validation failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -143,7 +131,6 @@ def test_cost_tracker():
 
     except Exception as e:
         print(f"❌ CostTracker test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -194,7 +181,6 @@ def test_component_initialization():
 
     except Exception as e:
         print(f"❌ Component initialization failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -222,11 +208,80 @@ async def test_webscraper_init():
 
     except Exception as e:
         print(f"❌ WebsiteScraper test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
+# (name, test) pairs run concurrently once test_imports has passed; sync
+# tests run in worker threads, async ones on the loop
+TESTS = [
+    ("Model Validation", test_model_validation),
+    ("CostTracker", test_cost_tracker),
+    ("Component Initialization", test_component_initialization),
+    ("WebsiteScraper", test_webscraper_init),
+]
+
+
+# Output buffer of the test running in the current task (and its worker
+# thread - asyncio.to_thread copies the context); None = the real stream
+_test_output = contextvars.ContextVar("_test_output", default=None)
+
+
+class _PerTestStream:
+    """sys.stdout/stderr stand-in that writes to the current test's buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        return (_test_output.get() or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
+async def _run_test(test):
+    """Run a single test with its output captured.
+
+    Sync tests are offloaded to a thread.
+
+    Returns:
+        (passed, captured output)
+    """
+    output = io.StringIO()
+    _test_output.set(output)
+    try:
+        if asyncio.iscoroutinefunction(test):
+            passed = await test()
+        else:
+            passed = await asyncio.to_thread(test)
+    except Exception:
+        traceback.print_exc()
+        passed = False
+    return passed is True, output.getvalue()
+
+
+async def run_all_tests():
+    """Run the independent tests concurrently under one event loop.
+
+    Each test's output is printed as one block, in TESTS order, so
+    concurrent tests don't interleave their lines.
+    """
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _PerTestStream(stdout), _PerTestStream(stderr)
+    try:
+        outcomes = await asyncio.gather(*(_run_test(test) for _, test in TESTS))
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+    results = []
+    for (name, _), (passed, output) in zip(TESTS, outcomes):
+        print()
+        print(output, end="")
+        results.append((name, passed))
+    return results
+
+
 def main():
     """Run all validation tests."""
     print("=" * 60)
@@ -234,23 +289,13 @@ def main():
     print("=" * 60)
     print()
 
-    results = []
-
-    # Test 1: Imports
-    results.append(("Imports", test_imports()))
-
-    # Test 2: Model validation
-    results.append(("Model Validation", test_model_validation()))
-
-    # Test 3: CostTracker
-    results.append(("CostTracker", test_cost_tracker()))
-
-    # Test 4: Component initialization
-    results.append(("Component Initialization", test_component_initialization()))
-
-    # Test 5: WebsiteScraper (async)
-    scraper_result = asyncio.run(test_webscraper_init())
-    results.append(("WebsiteScraper", scraper_result))
+    # Imports gate the rest: every other test imports the same modules
+    results = [("Imports", test_imports())]
+    if results[0][1]:
+        results += asyncio.run(run_all_tests())
+    else:
+        results += [(name, False) for name, _ in TESTS]
+        print("\n❌ Skipping remaining tests - fix the imports first")
 
     # Summary
     print("\n" + "=" * 60)
@@ -6,13 +6,19 @@ Usage:
     python3 check_notion_schema.py
 
 This will verify that all required fields exist for lead scoring.
+NOTION_DATABASE_ID may hold several comma-separated IDs; their schemas are
+fetched concurrently over one pooled HTTP connection. If a schema daemon
+(python -m src.integrations.notion_schema_daemon) is running, it is used first.
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
+
+import httpx
 from dotenv import load_dotenv
-from notion_client import Client
 
 # Load environment
 load_dotenv()
@@ -20,133 +26,172 @@ load_dotenv()
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.integrations.notion_schema import SCORING_REQUIRED_PROPERTIES, diff_schema
+from src.integrations.notion_schema_daemon import fetch_schema_via_daemon
+
+# Required fields for scoring (using actual Notion database field names)
+_REQUIRED_FIELDS = MappingProxyType(SCORING_REQUIRED_PROPERTIES)
+_SORTED_FIELDS = tuple(sorted(_REQUIRED_FIELDS.items()))
+
+_WRITE_FIELDS = frozenset({
+    "Lead Score",
+    "Priority Tier",
+    "Score Breakdown",
+    "Confidence Flags",
+    "Scoring Status",
+})
+_READ_FIELDS = frozenset(_REQUIRED_FIELDS.keys() - _WRITE_FIELDS)
+assert _READ_FIELDS | _WRITE_FIELDS == _REQUIRED_FIELDS.keys()
+
+# Notion API type -> label shown in the Notion UI
+_NOTION_TYPE_MAP = MappingProxyType({
+    "number": "Number",
+    "select": "Select",
+    "multi_select": "Multi-select",
+    "checkbox": "Checkbox",
+    "rich_text": "Text",
+    "email": "Email",
+    "url": "URL",
+    "title": "Title",
+})
+
+# Options to create for select fields
+_SELECT_OPTIONS = MappingProxyType({
+    "Priority Tier": "🔥 Hot, 🌡️ Warm, ❄️ Cold, ⛔ Out of Scope, ⏳ Pending Enrichment",
+    "Scoring Status": "Scored, Failed, Not Scored",
+    "Vet Count Confidence": "high, medium, low",
+    "Enrichment Status": "New, In Progress, Completed, Failed, Partial",
+})
+
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+
+
+async def fetch_schemas(api_key, database_ids):
+    """Retrieve several database schemas concurrently on one AsyncClient.
+
+    Returns:
+        List of response dicts (or the raised exception) in database_ids order
+    """
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Notion-Version": NOTION_VERSION,
+    }
+
+    async with httpx.AsyncClient(
+        base_url=NOTION_API_URL, headers=headers, http2=True, timeout=30.0
+    ) as client:
+
+        async def fetch(database_id):
+            response = await client.get(f"/databases/{database_id}")
+            response.raise_for_status()
+            return response.json()
+
+        return await asyncio.gather(
+            *(fetch(database_id) for database_id in database_ids),
+            return_exceptions=True,
+        )
+
+
+def report_schema(properties):
+    """Print the schema check for one database. Returns True if complete."""
+    print("=" * 80)
+    print("NOTION DATABASE SCHEMA CHECK")
+    print("=" * 80)
+
+    diff = diff_schema(_REQUIRED_FIELDS, properties)
+    existing_fields = [field for field in _SORTED_FIELDS if field[0] in diff.existing]
+    missing_fields = [field for field in _SORTED_FIELDS if field[0] in diff.missing]
+    type_mismatches = sorted(diff.mismatches)
+
+    # Print results
+    if existing_fields:
+        print("\n✅ EXISTING FIELDS:")
+        for field_name, field_type in existing_fields:
+            print(f"   {field_name:30s} ({field_type})")
+
+    if type_mismatches:
+        print("\n⚠️  TYPE MISMATCHES:")
+        for field_name, expected, actual in type_mismatches:
+            print(f"   {field_name:30s} Expected: {expected}, Found: {actual}")
+
+    if missing_fields:
+        print("\n❌ MISSING FIELDS:")
+        for field_name, field_type in missing_fields:
+            print(f"   {field_name:30s} ({field_type})")
+
+        print("\n" + "=" * 80)
+        print("HOW TO ADD MISSING FIELDS")
+        print("=" * 80)
+        print("\n1. Open your Notion database in a web browser")
+        print("2. Click the '+' button to add a new property")
+        print("3. Add each missing field with the correct type:")
+
+        for field_name, field_type in missing_fields:
+            notion_type = _NOTION_TYPE_MAP.get(field_type, field_type)
+            print(f"\n   Field: {field_name}")
+            print(f"   Type: {notion_type}")
+
+            # Special instructions for select fields
+            if field_type == "select" and field_name in _SELECT_OPTIONS:
+                print(f"   Options: {_SELECT_OPTIONS[field_name]}")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Total Required: {len(_REQUIRED_FIELDS)}")
+    print(f"✅ Existing: {len(existing_fields)}")
+    print(f"⚠️  Type Mismatches: {len(type_mismatches)}")
+    print(f"❌ Missing: {len(missing_fields)}")
+
+    if missing_fields or type_mismatches:
+        print("\n⚠️  Database schema is INCOMPLETE")
+        print("   Please add/fix the fields listed above before running scoring.")
+        return False
+
+    print("\n✅ Database schema is COMPLETE and ready for scoring!")
+    return True
+
+
 def main():
     # Get credentials
     api_key = os.getenv("NOTION_API_KEY")
-    database_id = os.getenv("NOTION_DATABASE_ID")
+    database_ids = [
+        database_id.strip()
+        for database_id in os.getenv("NOTION_DATABASE_ID", "").split(",")
+        if database_id.strip()
+    ]
 
-    if not api_key or not database_id:
+    if not api_key or not database_ids:
         print("❌ Error: NOTION_API_KEY and NOTION_DATABASE_ID must be set in .env file")
         sys.exit(1)
 
     print(f"Checking Notion database schema...")
-    print(f"Database ID: {database_id}\n")
-
-    client = Client(auth=api_key)
-
-    # Required fields for scoring (using actual Notion database field names)
-    required_fields = {
-        # Fields we READ
-        "Name": "title",
-        "Website": "url",
-        "Google Rating": "number",  # Database has "Google Rating" not "Rating"
-        "Google Review Count": "number",  # Database has "Google Review Count" not "Review Count"
-        "Has Multiple Locations": "checkbox",  # Database has "Has Multiple Locations" not "Multiple Locations"
-        "Vet Count": "number",
-        "Vet Count Confidence": "select",
-        "24/7 Emergency Services": "checkbox",  # Database has "24/7 Emergency Services" not "Emergency 24/7"
-        "Online Booking": "checkbox",
-        "Patient Portal": "checkbox",
-        "Telemedicine": "checkbox",
-        "Specialty Services": "multi_select",
-        "Decision Maker Name": "rich_text",
-        "Decision Maker Email": "email",
-        "Enrichment Status": "select",
-        # Fields we WRITE
-        "Lead Score": "number",
-        "Priority Tier": "select",
-        "Score Breakdown": "rich_text",
-        "Confidence Flags": "multi_select",
-        "Scoring Status": "select",
-    }
 
     try:
-        # Retrieve database schema
-        response = client.databases.retrieve(database_id=database_id)
-        properties = response.get("properties", {})
-
-        print("=" * 80)
-        print("NOTION DATABASE SCHEMA CHECK")
-        print("=" * 80)
-
-        missing_fields = []
-        type_mismatches = []
-        existing_fields = []
-
-        for field_name, expected_type in required_fields.items():
-            if field_name not in properties:
-                missing_fields.append((field_name, expected_type))
-            else:
-                actual_type = properties[field_name]["type"]
-                if actual_type == expected_type:
-                    existing_fields.append((field_name, actual_type))
-                else:
-                    type_mismatches.append((field_name, expected_type, actual_type))
-
-        # Print results
-        if existing_fields:
-            print("\n✅ EXISTING FIELDS:")
-            for field_name, field_type in sorted(existing_fields):
-                print(f"   {field_name:30s} ({field_type})")
-
-        if type_mismatches:
-            print("\n⚠️  TYPE MISMATCHES:")
-            for field_name, expected, actual in sorted(type_mismatches):
-                print(f"   {field_name:30s} Expected: {expected}, Found: {actual}")
-
-        if missing_fields:
-            print("\n❌ MISSING FIELDS:")
-            for field_name, field_type in sorted(missing_fields):
-                print(f"   {field_name:30s} ({field_type})")
-
-            print("\n" + "=" * 80)
-            print("HOW TO ADD MISSING FIELDS")
-            print("=" * 80)
-            print("\n1. Open your Notion database in a web browser")
-            print("2. Click the '+' button to add a new property")
-            print("3. Add each missing field with the correct type:")
-
-            for field_name, field_type in sorted(missing_fields):
-                notion_type_map = {
-                    "number": "Number",
-                    "select": "Select",
-                    "multi_select": "Multi-select",
-                    "checkbox": "Checkbox",
-                    "rich_text": "Text",
-                    "email": "Email",
-                    "url": "URL",
-                    "title": "Title"
-                }
-                notion_type = notion_type_map.get(field_type, field_type)
-                print(f"\n   Field: {field_name}")
-                print(f"   Type: {notion_type}")
-
-                # Special instructions for select fields
-                if field_type == "select":
-                    if field_name == "Priority Tier":
-                        print(f"   Options: 🔥 Hot, 🌡️ Warm, ❄️ Cold, ⛔ Out of Scope, ⏳ Pending Enrichment")
-                    elif field_name == "Scoring Status":
-                        print(f"   Options: Scored, Failed, Not Scored")
-                    elif field_name == "Vet Count Confidence":
-                        print(f"   Options: high, medium, low")
-                    elif field_name == "Enrichment Status":
-                        print(f"   Options: New, In Progress, Completed, Failed, Partial")
-
-        print("\n" + "=" * 80)
-        print("SUMMARY")
-        print("=" * 80)
-        print(f"Total Required: {len(required_fields)}")
-        print(f"✅ Existing: {len(existing_fields)}")
-        print(f"⚠️  Type Mismatches: {len(type_mismatches)}")
-        print(f"❌ Missing: {len(missing_fields)}")
-
-        if missing_fields or type_mismatches:
-            print("\n⚠️  Database schema is INCOMPLETE")
-            print("   Please add/fix the fields listed above before running scoring.")
-            sys.exit(1)
-        else:
-            print("\n✅ Database schema is COMPLETE and ready for scoring!")
-            sys.exit(0)
+        # Prefer a running schema daemon (warm connection), fetch the rest directly
+        responses = [fetch_schema_via_daemon(database_id) for database_id in database_ids]
+        pending = [i for i, response in enumerate(responses) if response is None]
+        if pending:
+            fetched = asyncio.run(
+                fetch_schemas(api_key, [database_ids[i] for i in pending])
+            )
+            for i, response in zip(pending, fetched):
+                responses[i] = response
+
+        all_complete = True
+        for database_id, response in zip(database_ids, responses):
+            print(f"Database ID: {database_id}\n")
+
+            if isinstance(response, Exception):
+                print(f"\n❌ Error: {response}")
+                all_complete = False
+                continue
+
+            if not report_schema(response.get("properties", {})):
+                all_complete = False
+
+        sys.exit(0 if all_complete else 1)
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
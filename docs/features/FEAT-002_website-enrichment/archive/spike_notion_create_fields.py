@@ -6,12 +6,51 @@ Creates all 20 required enrichment fields for FEAT-002 in the Notion database.
 """
 
 import os
-from notion_client import Client
+import sys
+import time
+from pathlib import Path
+from notion_client import APIResponseError, Client
 from dotenv import load_dotenv
 
+# Repo root, for the shared src package
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from src.utils.rate_limit import NOTION_REQUESTS_PER_SECOND, RequestSpacer, retry_after_seconds
+from spikes.enrichment_schema import FIELDS, clear_cached_properties, load_cached_properties
+
 # Load environment variables
 load_dotenv()
 
+MAX_ATTEMPTS = 6
+MAX_WAIT_SECONDS = 30
+# Stay under Notion's average rate so jitter doesn't tip us into 429s
+REQUESTS_PER_SECOND = NOTION_REQUESTS_PER_SECOND - 0.5
+
+# Shared by every Notion request made through notion_call()
+spacer = RequestSpacer(1.0 / REQUESTS_PER_SECOND)
+
+
+def notion_call(fn, **kwargs):
+    """Call a Notion endpoint under the shared spacer, retrying 429/5xx.
+
+    A 429 sleeps for the server's Retry-After when present; anything else
+    (validation errors, "already exists") is raised on the first attempt.
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            spacer.wait()
+            return fn(**kwargs)
+        except APIResponseError as e:
+            retryable = e.code == "rate_limited" or 500 <= e.status < 600
+            if not retryable or attempt == MAX_ATTEMPTS:
+                raise
+            wait = min(2 ** (attempt - 1), MAX_WAIT_SECONDS)
+            if e.code == "rate_limited":
+                wait = retry_after_seconds(e, wait)
+            print(f"   ⏳ Notion {e.status} on attempt {attempt}/{MAX_ATTEMPTS}, retrying in {wait:g}s...")
+            time.sleep(wait)
+
+
 def create_enrichment_fields():
     """Create all missing enrichment fields in Notion database."""
 
@@ -24,105 +63,7 @@ def create_enrichment_fields():
     print(f"Database ID: {database_id}")
     print()
 
-    # Define all enrichment fields with their schemas
-    fields_to_create = {
-        "Confirmed Vet Count (Total)": {
-            "number": {
-                "format": "number"
-            }
-        },
-        "Vet Count Confidence": {
-            "select": {
-                "options": [
-                    {"name": "high", "color": "green"},
-                    {"name": "medium", "color": "yellow"},
-                    {"name": "low", "color": "red"}
-                ]
-            }
-        },
-        "Decision Maker Name": {
-            "rich_text": {}
-        },
-        "Decision Maker Role": {
-            "select": {
-                "options": [
-                    {"name": "Owner", "color": "blue"},
-                    {"name": "Practice Manager", "color": "purple"},
-                    {"name": "Medical Director", "color": "green"}
-                ]
-            }
-        },
-        "Decision Maker Email": {
-            "email": {}
-        },
-        "Decision Maker Phone": {
-            "phone_number": {}
-        },
-        "24/7 Emergency Services": {
-            "checkbox": {}
-        },
-        "Specialty Services": {
-            "multi_select": {
-                "options": [
-                    {"name": "Surgery", "color": "blue"},
-                    {"name": "Dental", "color": "green"},
-                    {"name": "Oncology", "color": "red"},
-                    {"name": "Cardiology", "color": "purple"},
-                    {"name": "Dermatology", "color": "yellow"},
-                    {"name": "Ophthalmology", "color": "orange"},
-                    {"name": "Orthopedics", "color": "pink"},
-                    {"name": "Internal Medicine", "color": "brown"}
-                ]
-            }
-        },
-        "Wellness Programs": {
-            "checkbox": {}
-        },
-        "Boarding Services": {
-            "checkbox": {}
-        },
-        "Online Booking": {
-            "checkbox": {}
-        },
-        "Telemedicine": {
-            "checkbox": {}
-        },
-        "Patient Portal": {
-            "checkbox": {}
-        },
-        "Digital Records Mentioned": {
-            "checkbox": {}
-        },
-        "Awards/Accreditations": {
-            "multi_select": {
-                "options": [
-                    {"name": "AAHA Accredited", "color": "blue"},
-                    {"name": "Fear Free Certified", "color": "green"},
-                    {"name": "Cat Friendly Practice", "color": "purple"}
-                ]
-            }
-        },
-        "Unique Services": {
-            "multi_select": {
-                "options": []
-            }
-        },
-        "Enrichment Status": {
-            "select": {
-                "options": [
-                    {"name": "Pending", "color": "yellow"},
-                    {"name": "Completed", "color": "green"},
-                    {"name": "Failed", "color": "red"}
-                ]
-            }
-        },
-        "Last Enrichment Date": {
-            "date": {}
-        },
-        "Enrichment Error": {
-            "rich_text": {}
-        }
-    }
+    fields_to_create = FIELDS
 
     # Fix existing "Personalization Context" field (change from rich_text to multi_select)
     print("Step 1: Fixing 'Personalization Context' field type...")
@@ -140,33 +81,79 @@ def create_enrichment_fields():
     print("Step 2: Creating missing enrichment fields...")
     print("-"*60)
 
+    # One read up front: only POST what the database doesn't have yet. A
+    # fresh schema validation run has already read it, so reuse that
+    existing = load_cached_properties(database_id)
+    if existing is None:
+        existing = notion_call(client.databases.retrieve, database_id=database_id)["properties"]
+    existing = existing.keys()
+    lines = []  # Per-field results, written once at the end of the step
+    already_present = [name for name in fields_to_create if name in existing]
+    skipped_count = len(already_present)
+    for field_name in already_present:
+        lines.append(f"⚠️  Already exists: {field_name}")
+    fields_to_create = {
+        name: schema for name, schema in fields_to_create.items() if name not in existing
+    }
+
     created_count = 0
     failed_count = 0
 
-    for field_name, field_schema in fields_to_create.items():
+    def create_one(field_name, field_schema):
+        """Per-field fallback so one bad schema doesn't block the rest."""
+        nonlocal created_count, failed_count
         try:
-            # Update database schema to add the new property
-            client.databases.update(
+            notion_call(
+                client.databases.update,
                 database_id=database_id,
                 properties={
                     field_name: field_schema
                 }
             )
-            print(f"✅ Created: {field_name}")
+            lines.append(f"✅ Created: {field_name}")
             created_count += 1
 
         except Exception as e:
             if "already exists" in str(e).lower():
-                print(f"⚠️  Already exists: {field_name}")
+                lines.append(f"⚠️  Already exists: {field_name}")
             else:
-                print(f"❌ Failed to create '{field_name}': {e}")
+                lines.append(f"❌ Failed to create '{field_name}': {e}")
                 failed_count += 1
 
+    if not fields_to_create:
+        lines.append("✅ All enrichment fields already exist - nothing to create")
+    else:
+        # The schema is about to change - the next run must read it fresh
+        clear_cached_properties(database_id)
+        try:
+            # One databases.update adds every property in a single request
+            database = notion_call(
+                client.databases.update,
+                database_id=database_id,
+                properties=fields_to_create
+            )
+        except Exception as e:
+            lines.append(f"⚠️  Batch update failed ({e}), creating fields one by one...")
+            for field_name, field_schema in fields_to_create.items():
+                create_one(field_name, field_schema)
+        else:
+            # The response carries the updated schema - check it rather than trusting the call
+            created = database.get("properties", {}).keys()
+            for field_name, field_schema in fields_to_create.items():
+                if field_name in created:
+                    lines.append(f"✅ Created: {field_name}")
+                    created_count += 1
+                else:
+                    create_one(field_name, field_schema)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
     print()
     print("="*60)
     print("CREATION SUMMARY")
     print("="*60)
     print(f"✅ Created: {created_count} fields")
+    print(f"⏭️  Already existed: {skipped_count} fields")
     print(f"⚠️  Failed: {failed_count} fields")
     print()
 
@@ -0,0 +1,110 @@
+"""
+FEAT-002 enrichment field schema, shared by the spike scripts.
+
+FIELDS is the full Notion property definition used to create the fields;
+the validator's type and select-option tables are derived from it so the
+two can't drift.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Repo root, for the shared src package
+sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+
+from src.integrations.notion_schema import clear_cached_schema, load_cached_schema, save_cached_schema
+
+# Shared schema fragments - the payload is read-only, so fields reuse one object
+NUMBER = {"number": {"format": "number"}}
+RICH_TEXT = {"rich_text": {}}
+EMAIL = {"email": {}}
+PHONE_NUMBER = {"phone_number": {}}
+CHECKBOX = {"checkbox": {}}
+DATE = {"date": {}}
+EMPTY_MULTI_SELECT = {"multi_select": {"options": []}}
+
+
+def _options(kind, *pairs):
+    """Build a select/multi_select schema from (name, color) pairs."""
+    return {kind: {"options": [{"name": name, "color": color} for name, color in pairs]}}
+
+
+FIELDS = {
+    "Confirmed Vet Count (Total)": NUMBER,
+    "Vet Count Confidence": _options(
+        "select", ("high", "green"), ("medium", "yellow"), ("low", "red")
+    ),
+    "Decision Maker Name": RICH_TEXT,
+    "Decision Maker Role": _options(
+        "select", ("Owner", "blue"), ("Practice Manager", "purple"), ("Medical Director", "green")
+    ),
+    "Decision Maker Email": EMAIL,
+    "Decision Maker Phone": PHONE_NUMBER,
+    "24/7 Emergency Services": CHECKBOX,
+    "Specialty Services": _options(
+        "multi_select",
+        ("Surgery", "blue"),
+        ("Dental", "green"),
+        ("Oncology", "red"),
+        ("Cardiology", "purple"),
+        ("Dermatology", "yellow"),
+        ("Ophthalmology", "orange"),
+        ("Orthopedics", "pink"),
+        ("Internal Medicine", "brown"),
+    ),
+    "Wellness Programs": CHECKBOX,
+    "Boarding Services": CHECKBOX,
+    "Online Booking": CHECKBOX,
+    "Telemedicine": CHECKBOX,
+    "Patient Portal": CHECKBOX,
+    "Digital Records Mentioned": CHECKBOX,
+    "Personalization Context (Multi)": EMPTY_MULTI_SELECT,
+    "Awards/Accreditations": _options(
+        "multi_select",
+        ("AAHA Accredited", "blue"),
+        ("Fear Free Certified", "green"),
+        ("Cat Friendly Practice", "purple"),
+    ),
+    "Unique Services": EMPTY_MULTI_SELECT,
+    "Enrichment Status": _options(
+        "select", ("Pending", "yellow"), ("Completed", "green"), ("Failed", "red")
+    ),
+    "Last Enrichment Date": DATE,
+    "Enrichment Error": RICH_TEXT,
+}
+
+# Field name -> Notion property type
+REQUIRED_FIELDS = {name: next(iter(schema)) for name, schema in FIELDS.items()}
+
+# Select field name -> option names it must offer
+REQUIRED_SELECT_OPTIONS = {
+    name: [option["name"] for option in schema["select"]["options"]]
+    for name, schema in FIELDS.items()
+    if "select" in schema
+}
+
+
+# The validator saves the schema it retrieved to the pipeline's schema cache
+# (src.integrations.notion_schema); the create script reuses it within the
+# TTL instead of retrieving again (0 disables the cache)
+SCHEMA_CACHE_TTL = float(os.getenv("NOTION_SCHEMA_CACHE_TTL", "60"))
+
+
+def save_cached_database(database_id, database):
+    """Record a retrieved database object for a follow-up run."""
+    if SCHEMA_CACHE_TTL > 0:
+        save_cached_schema(database_id, database)
+
+
+def load_cached_properties(database_id):
+    """Cached properties for database_id, or None if missing or stale."""
+    if SCHEMA_CACHE_TTL <= 0:
+        return None
+    database = load_cached_schema(database_id, SCHEMA_CACHE_TTL)
+    return None if database is None else database.get("properties", {})
+
+
+def clear_cached_properties(database_id):
+    """Drop the cache once the schema has been changed."""
+    clear_cached_schema(database_id)
@@ -12,12 +12,162 @@ Success Criteria:
 """
 
 import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
 import time
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode
+import zlib
+from collections import namedtuple
+from urllib.parse import urlsplit
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
 from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
-from crawl4ai.deep_crawling.filters import FilterChain, URLPatternFilter
+from crawl4ai.deep_crawling.filters import FilterChain, URLFilter
 from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
 
+# Deep crawls run concurrently over one shared browser
+MAX_CONCURRENT_SITES = 5
+
+# First-pass cache mode (CRAWL4AI_CACHE_MODE=enabled|write_only|bypass|...).
+# The default warms the cache without lookups; the re-read pass is READ_ONLY.
+CACHE_MODE = CacheMode(os.getenv("CRAWL4AI_CACHE_MODE", CacheMode.WRITE_ONLY.value))
+_READ_MODES = {CacheMode.ENABLED, CacheMode.READ_ONLY}
+_WRITE_MODES = {CacheMode.ENABLED, CacheMode.WRITE_ONLY}
+
+CACHE_DB_PATH = os.getenv("CRAWL_CACHE_DB", "data/website_cache/crawl_cache.sqlite3")
+
+# The fields of a CrawlResult the analysis (and LLM re-runs) read
+CachedPage = namedtuple("CachedPage", "url success metadata cleaned_html markdown error_message")
+
+
+class PageCache:
+    """Deep-crawl results per site in one SQLite table keyed by sha256(url).
+
+    Crawl4AI keeps several content files per crawled URL; here one indexed
+    row holds a whole site, with the HTML and markdown zlib-compressed.
+    Rows are indexed by domain too, so LLM-only re-runs can read the stored
+    crawl (iter_domain) instead of scraping again.
+    """
+
+    def __init__(self, path=CACHE_DB_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url_hash BLOB PRIMARY KEY, domain TEXT, url TEXT, fetched_at INTEGER,"
+            " html BLOB, meta TEXT);"
+            "CREATE INDEX IF NOT EXISTS pages_domain ON pages (domain);"
+        )
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode()).digest()
+
+    @staticmethod
+    def _pages(html, meta):
+        return [
+            CachedPage(m["url"], m["success"], {"depth": m["depth"]}, page_html, markdown, m["error"])
+            for m, (page_html, markdown) in zip(json.loads(meta), json.loads(zlib.decompress(html)))
+        ]
+
+    def get(self, url):
+        """Cached pages for url, or None on a miss."""
+        row = self.conn.execute(
+            "SELECT html, meta FROM pages WHERE url_hash = ?", (self._key(url),)
+        ).fetchone()
+        return self._pages(*row) if row else None
+
+    def iter_domain(self, domain):
+        """Yield (url, fetched_at, pages) for every stored crawl of domain."""
+        rows = self.conn.execute(
+            "SELECT url, fetched_at, html, meta FROM pages WHERE domain = ?", (domain,)
+        )
+        for url, fetched_at, html, meta in rows:
+            yield url, fetched_at, self._pages(html, meta)
+
+    def put(self, url, results):
+        """Store the pages of one site crawl (INSERT OR REPLACE)."""
+        meta = [
+            {
+                "url": r.url,
+                "success": r.success,
+                "depth": r.metadata.get("depth", 0),
+                "error": r.error_message,
+            }
+            for r in results
+        ]
+        content = [(r.cleaned_html, str(r.markdown or "")) for r in results]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                self._key(url),
+                urlsplit(url).hostname,
+                url,
+                int(time.time()),
+                zlib.compress(json.dumps(content).encode()),
+                json.dumps(meta),
+            ),
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+# Pages with less cleaned HTML than this (nav-only, JS-blocked) are not
+# worth tokenizing or sending to the LLM
+MIN_USEFUL_CHARS = 500
+
+# Pages worth crawling, matched anywhere in the URL in a single regex pass
+_URL_PATTERN_RE = re.compile(r"(about|team|staff|contact)", re.I)
+
+# Matched keyword -> page type shown in the report
+_PAGE_TYPES = {"about": "[about]", "team": "[team]", "staff": "[team]", "contact": "[contact]"}
+
+
+class FastPatternFilter(URLFilter):
+    """Keep URLs containing about/team/staff/contact.
+
+    Equivalent to URLPatternFilter(["*about*", "*team*", "*staff*",
+    "*contact*"]) but one compiled search instead of a glob per pattern.
+    """
+
+    __slots__ = ()
+
+    def apply(self, url):
+        passed = _URL_PATTERN_RE.search(url) is not None
+        self._update_stats(passed)
+        return passed
+
+
+# One browser (persistent profile: cookies, DNS and TLS state) for every site
+CRAWL_PROFILE_DIR = os.getenv("CRAWL_PROFILE_DIR", "data/website_cache/browser_profile")
+_CRAWLER = None
+
+
+async def get_crawler():
+    """Shared AsyncWebCrawler, started on first use."""
+    global _CRAWLER
+    if _CRAWLER is None:
+        crawler = AsyncWebCrawler(config=BrowserConfig(
+            headless=True,
+            use_persistent_context=True,
+            user_data_dir=CRAWL_PROFILE_DIR,
+        ))
+        await crawler.__aenter__()
+        _CRAWLER = crawler
+    return _CRAWLER
+
+
+async def close_crawler():
+    """Shut down the shared crawler (must run on the loop that started it)."""
+    global _CRAWLER
+    if _CRAWLER is not None:
+        await _CRAWLER.__aexit__(None, None, None)
+        _CRAWLER = None
+
+
 async def test_bfs_deep_crawl():
     """Test BFSDeepCrawlStrategy with real vet websites."""
 
@@ -39,105 +189,152 @@ async def test_bfs_deep_crawl():
     print("  max_depth: 1 (homepage + 1 level)")
     print("  max_pages: 5")
     print("  URL patterns: *about*, *team*, *staff*, *contact*")
-    print("  Cache: ENABLED")
+    print(f"  Cache: {CACHE_MODE.name}, then READ_ONLY re-read ({CACHE_DB_PATH})")
+    print(f"  Concurrent sites: {MAX_CONCURRENT_SITES}")
     print("  Timeout: 30s per page")
     print()
 
-    url_filter = URLPatternFilter(patterns=["*about*", "*team*", "*staff*", "*contact*"])
-
-    strategy = BFSDeepCrawlStrategy(
-        max_depth=1,  # Homepage + 1 level
-        include_external=False,
-        max_pages=5,
-        filter_chain=FilterChain([url_filter])
-    )
+    def make_strategy():
+        """A fresh strategy per site: its max_pages counter is per instance."""
+        return BFSDeepCrawlStrategy(
+            max_depth=1,  # Homepage + 1 level
+            include_external=False,
+            max_pages=5,
+            filter_chain=FilterChain([FastPatternFilter()])
+        )
 
     config = CrawlerRunConfig(
-        deep_crawl_strategy=strategy,
         scraping_strategy=LXMLWebScrapingStrategy(),
-        cache_mode=CacheMode.ENABLED,
+        cache_mode=CacheMode.BYPASS,  # PageCache fronts the crawler
         page_timeout=30000,  # 30s timeout per page
+        stream=True,  # Yield pages as they are crawled
         verbose=False  # Reduced verbosity for cleaner output
     )
 
     all_results = []
     total_pages = 0
+    total_useful = 0
     total_time = 0
 
-    async with AsyncWebCrawler() as crawler:
-        for url, description in test_urls:
-            print(f"{'='*60}")
-            print(f"Testing: {url}")
-            print(f"Type: {description}")
-            print(f"{'='*60}")
+    # Sites share one browser; a semaphore bounds how many deep crawls run at once
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SITES)
 
-            start_time = time.time()
+    page_cache = PageCache()
 
-            try:
-                results = await crawler.arun(url, config=config)
-
-                elapsed = time.time() - start_time
-                total_time += elapsed
-
-                # Analyze results
-                success_count = sum(1 for r in results if r.success)
-                total_pages += len(results)
-
-                print(f"\n✅ Scraped {len(results)} pages in {elapsed:.1f}s")
-                print(f"   Success rate: {success_count}/{len(results)} pages")
-                print()
-
-                for i, result in enumerate(results):
-                    depth = result.metadata.get("depth", 0)
-                    success_icon = "✅" if result.success else "❌"
-
-                    # Extract page type from URL
-                    url_lower = result.url.lower()
-                    if "about" in url_lower:
-                        page_type = "[about]"
-                    elif "team" in url_lower or "staff" in url_lower:
-                        page_type = "[team]"
-                    elif "contact" in url_lower:
-                        page_type = "[contact]"
-                    else:
-                        page_type = "[home]"
-
-                    content_len = len(result.cleaned_html) if result.cleaned_html else 0
-
-                    print(f"  {success_icon} Depth {depth} {page_type}: {result.url}")
-                    print(f"     Content: {content_len:,} chars")
-
-                    if not result.success:
-                        print(f"     Error: {result.error_message}")
-
-                all_results.append({
-                    "url": url,
-                    "description": description,
-                    "pages": len(results),
-                    "success": success_count,
-                    "time": elapsed
-                })
-
-            except Exception as e:
-                print(f"\n❌ Failed to scrape {url}: {e}")
-                all_results.append({
-                    "url": url,
-                    "description": description,
-                    "pages": 0,
-                    "success": 0,
-                    "time": 0,
-                    "error": str(e)
-                })
+    async def crawl_site(crawler, url, cache_mode):
+        async with semaphore:
+            start_time = time.time()
+            first_page = None
+            results = page_cache.get(url) if cache_mode in _READ_MODES else None
+            if results is None and cache_mode is not CacheMode.READ_ONLY:
+                # Streamed: pages arrive as the BFS fetches them, so per-page
+                # work can start before the whole site is crawled
+                results = []
+                site_config = config.clone(deep_crawl_strategy=make_strategy())
+                async for result in await crawler.arun(url, config=site_config):
+                    if first_page is None:
+                        first_page = time.time() - start_time
+                    results.append(result)
+                if cache_mode in _WRITE_MODES:
+                    page_cache.put(url, results)
+            return results or [], time.time() - start_time, first_page
+
+    async def crawl_all(crawler, cache_mode):
+        start_time = time.time()
+        outcomes = await asyncio.gather(
+            *(crawl_site(crawler, url, cache_mode) for url, _ in test_urls),
+            return_exceptions=True,
+        )
+        return outcomes, time.time() - start_time
 
+    try:
+        crawler = await get_crawler()
+        outcomes, wall_time = await crawl_all(crawler, CACHE_MODE)
+        # Second pass serves everything from the cache written above
+        reread_outcomes, reread_time = await crawl_all(crawler, CacheMode.READ_ONLY)
+    finally:
+        page_cache.close()
+        await close_crawler()
+
+    for (url, description), outcome in zip(test_urls, outcomes):
+        print(f"{'='*60}")
+        print(f"Testing: {url}")
+        print(f"Type: {description}")
+        print(f"{'='*60}")
+
+        try:
+            if isinstance(outcome, Exception):
+                raise outcome
+            results, elapsed, first_page = outcome
+            total_time += elapsed
+
+            # Analyze results
+            success_count = sum(1 for r in results if r.success)
+            total_pages += len(results)
+
+            print(f"\n✅ Scraped {len(results)} pages in {elapsed:.1f}s")
+            if first_page is not None:
+                print(f"   First page after {first_page:.1f}s")
+            print(f"   Success rate: {success_count}/{len(results)} pages")
             print()
 
+            for i, result in enumerate(results):
+                depth = result.metadata.get("depth", 0)
+                success_icon = "✅" if result.success else "❌"
+
+                # Extract page type from URL (first keyword in the URL wins)
+                match = _URL_PATTERN_RE.search(result.url)
+                page_type = _PAGE_TYPES[match.group(1).lower()] if match else "[home]"
+
+                content_len = len(result.cleaned_html) if result.cleaned_html else 0
+
+                print(f"  {success_icon} Depth {depth} {page_type}: {result.url}")
+                print(f"     Content: {content_len:,} chars")
+
+                if not result.success:
+                    print(f"     Error: {result.error_message}")
+
+            # Drop failed/empty pages before any downstream extraction cost
+            useful = [
+                r for r in results
+                if r.success and r.cleaned_html and len(r.cleaned_html) >= MIN_USEFUL_CHARS
+            ]
+            if len(useful) < len(results):
+                print(f"  ⏭️  Skipping {len(results) - len(useful)} page(s) failed or under {MIN_USEFUL_CHARS} chars")
+            total_useful += len(useful)
+
+            all_results.append({
+                "url": url,
+                "description": description,
+                "pages": len(results),
+                "success": success_count,
+                "useful": len(useful),
+                "time": elapsed
+            })
+
+        except Exception as e:
+            print(f"\n❌ Failed to scrape {url}: {e}")
+            all_results.append({
+                "url": url,
+                "description": description,
+                "pages": 0,
+                "success": 0,
+                "useful": 0,
+                "time": 0,
+                "error": str(e)
+            })
+
+        print()
+
     # Summary
     print("="*60)
     print("TEST SUMMARY")
     print("="*60)
     print(f"Total practices tested: {len(test_urls)}")
     print(f"Total pages scraped: {total_pages}")
-    print(f"Total time: {total_time:.1f}s")
+    print(f"Pages worth extracting (≥{MIN_USEFUL_CHARS} chars): {total_useful}")
+    print(f"Total time: {total_time:.1f}s (wall clock: {wall_time:.1f}s)")
+    print(f"Cached re-read: {reread_time:.1f}s wall clock")
     print(f"Average pages per practice: {total_pages / len(test_urls):.1f}")
     print(f"Average time per practice: {total_time / len(test_urls):.1f}s")
     print()
@@ -148,12 +345,18 @@ async def test_bfs_deep_crawl():
 
     avg_pages = total_pages / len(test_urls)
     avg_time = total_time / len(test_urls)
+    reread_pages = sum(
+        sum(1 for r in outcome[0] if r.success)
+        for outcome in reread_outcomes
+        if not isinstance(outcome, Exception)
+    )
 
     criteria = [
         ("BFSDeepCrawlStrategy works without errors", total_pages > 0),
         ("Scrapes 2-4 pages per practice", 2 <= avg_pages <= 5),
         ("Execution time ≤20s per practice", avg_time <= 20),
-        ("URL pattern filter matches /about, /team", any("about" in r.get("url", "").lower() or "team" in r.get("url", "").lower() for r in all_results))
+        ("URL pattern filter matches /about, /team", any("about" in r.get("url", "").lower() or "team" in r.get("url", "").lower() for r in all_results)),
+        ("Cached results reused on second run", reread_pages > 0 and reread_time < wall_time)
     ]
 
     all_passed = True
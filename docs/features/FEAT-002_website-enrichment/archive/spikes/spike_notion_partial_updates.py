@@ -11,6 +11,7 @@ Success Criteria:
 """
 
 import os
+from dataclasses import dataclass
 from datetime import datetime
 from notion_client import Client
 from dotenv import load_dotenv
@@ -18,6 +19,62 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+
+# Property value extractors by Notion type; each returns None when empty
+def _select(prop):
+    return prop["select"]["name"] if prop.get("select") else None
+
+
+def _people(prop):
+    return [p.get("name", p.get("id")) for p in prop["people"]] if prop.get("people") else None
+
+
+def _rich_text(prop):
+    return prop["rich_text"][0].get("plain_text", "") if prop.get("rich_text") else None
+
+
+def _date(prop):
+    return prop["date"]["start"] if prop.get("date") else None
+
+
+_EXTRACTORS = {
+    "select": _select,
+    "people": _people,
+    "rich_text": _rich_text,
+    "date": _date,
+}
+
+
+def get_field_value(properties, field_name, field_type):
+    """Helper to extract field values safely."""
+    return _EXTRACTORS[field_type](properties.get(field_name, {}))
+
+
+@dataclass(slots=True)
+class SalesFields:
+    """Sales workflow fields that enrichment must never touch."""
+    status: str | None
+    assigned_to: list | None
+    research_notes: str | None
+    call_notes: str | None
+    last_contact_date: str | None
+
+
+# (SalesFields attribute, Notion property, extractor), in SalesFields order
+FIELD_SPECS = (
+    ("status", "Status", _select),
+    ("assigned_to", "Assigned To", _people),
+    ("research_notes", "Research Notes", _rich_text),
+    ("call_notes", "Call Notes", _rich_text),
+    ("last_contact_date", "Last Contact Date", _date),
+)
+
+
+def extract(properties, specs=FIELD_SPECS):
+    """Read every sales workflow field from a page's properties in one pass."""
+    return SalesFields(*(extractor(properties.get(name, {})) for _, name, extractor in specs))
+
+
 def test_notion_partial_updates():
     """Test Notion API partial updates preserve untouched fields."""
 
@@ -59,30 +116,11 @@ def test_notion_partial_updates():
     print("Step 2: Capturing current sales workflow fields...")
     print("-"*60)
 
-    def get_field_value(properties, field_name, field_type):
-        """Helper to extract field values safely."""
-        prop = properties.get(field_name, {})
-        if field_type == "select" and prop.get("select"):
-            return prop["select"]["name"]
-        elif field_type == "people" and prop.get("people"):
-            return [p.get("name", p.get("id")) for p in prop["people"]]
-        elif field_type == "rich_text" and prop.get("rich_text"):
-            return prop["rich_text"][0].get("plain_text", "") if prop["rich_text"] else ""
-        elif field_type == "date" and prop.get("date"):
-            return prop["date"]["start"]
-        return None
-
-    before_state = {
-        "Status": get_field_value(page["properties"], "Status", "select"),
-        "Assigned To": get_field_value(page["properties"], "Assigned To", "people"),
-        "Research Notes": get_field_value(page["properties"], "Research Notes", "rich_text"),
-        "Call Notes": get_field_value(page["properties"], "Call Notes", "rich_text"),
-        "Last Contact Date": get_field_value(page["properties"], "Last Contact Date", "date"),
-    }
+    before_state = extract(page["properties"])
 
     print("Sales Workflow Fields (BEFORE):")
-    for field, value in before_state.items():
-        print(f"  {field}: {value}")
+    for attr, field, _ in FIELD_SPECS:
+        print(f"  {field}: {getattr(before_state, attr)}")
     print()
 
     # Step 3: Update ONLY enrichment fields (partial update)
@@ -106,7 +144,8 @@ def test_notion_partial_updates():
     print()
 
     try:
-        notion.pages.update(
+        # The update response is the full updated page - no re-read needed
+        updated_page = notion.pages.update(
             page_id=page_id,
             properties=enrichment_update
         )
@@ -117,23 +156,15 @@ def test_notion_partial_updates():
 
     print()
 
-    # Step 4: Re-query the page and verify sales fields unchanged
+    # Step 4: Verify sales fields unchanged in the returned page
     print("Step 4: Verifying sales workflow fields preserved...")
     print("-"*60)
 
-    updated_page = notion.pages.retrieve(page_id=page_id)
-
-    after_state = {
-        "Status": get_field_value(updated_page["properties"], "Status", "select"),
-        "Assigned To": get_field_value(updated_page["properties"], "Assigned To", "people"),
-        "Research Notes": get_field_value(updated_page["properties"], "Research Notes", "rich_text"),
-        "Call Notes": get_field_value(updated_page["properties"], "Call Notes", "rich_text"),
-        "Last Contact Date": get_field_value(updated_page["properties"], "Last Contact Date", "date"),
-    }
+    after_state = extract(updated_page["properties"])
 
     print("Sales Workflow Fields (AFTER):")
-    for field, value in after_state.items():
-        print(f"  {field}: {value}")
+    for attr, field, _ in FIELD_SPECS:
+        print(f"  {field}: {getattr(after_state, attr)}")
     print()
 
     # Step 5: Validate enrichment fields were updated
@@ -173,13 +204,15 @@ def test_notion_partial_updates():
     print("Step 6: Final validation...")
     print("-"*60)
 
-    sales_fields_preserved = True
-    for field in before_state.keys():
-        if before_state[field] != after_state[field]:
-            print(f"❌ {field} changed!")
-            print(f"   Before: {before_state[field]}")
-            print(f"   After: {after_state[field]}")
-            sales_fields_preserved = False
+    sales_fields_preserved = before_state == after_state
+    if not sales_fields_preserved:
+        for attr, field, _ in FIELD_SPECS:
+            before = getattr(before_state, attr)
+            after = getattr(after_state, attr)
+            if before != after:
+                print(f"❌ {field} changed!")
+                print(f"   Before: {before}")
+                print(f"   After: {after}")
 
     if sales_fields_preserved:
         print("✅ All sales workflow fields preserved")
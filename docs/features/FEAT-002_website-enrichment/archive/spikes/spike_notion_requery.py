@@ -10,17 +10,55 @@ Tests that re-enrichment query filter returns correct practices:
 Success Criteria:
 - Query returns practices needing enrichment
 - Excludes recently enriched practices
-- OR filter works correctly
+- Never-enriched and stale filters work correctly (evaluated server-side)
 """
 
+import asyncio
 import os
+import sys
 from datetime import datetime, timedelta, UTC
-from notion_client import Client
+from pathlib import Path
 from dotenv import load_dotenv
 
+# Repo root, for the shared src package
+sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+
+from src.utils.fast_json import AsyncFastJSONClient
+
 # Load environment variables
 load_dotenv()
 
+# Notion's maximum page size for databases.query
+PAGE_SIZE = 100
+
+# Staleness cutoff, computed once; filters compare against the ISO string
+_CUTOFF = datetime.now(UTC) - timedelta(days=30)
+_CUTOFF_ISO = _CUTOFF.isoformat()
+
+
+async def query_all(notion, database_id, filter):
+    """Return every page matching filter, following has_more/next_cursor.
+
+    Notion cursors are opaque and only available from the previous response,
+    so pages of one query are fetched in order; independent queries are
+    overlapped by the caller with asyncio.gather.
+    """
+    results = []
+    start_cursor = None
+
+    while True:
+        params = {"database_id": database_id, "filter": filter, "page_size": PAGE_SIZE}
+        if start_cursor:
+            params["start_cursor"] = start_cursor
+
+        response = await notion.databases.query(**params)
+        results.extend(response["results"])
+
+        if not response.get("has_more"):
+            return results
+        start_cursor = response.get("next_cursor")
+
+
 def test_notion_requery():
     """Test Notion re-enrichment query filter."""
 
@@ -29,29 +67,72 @@ def test_notion_requery():
     print("="*60)
     print()
 
-    notion = Client(auth=os.getenv("NOTION_API_KEY"))
     database_id = os.getenv("NOTION_DATABASE_ID")
 
-    # Calculate 30 days ago
-    thirty_days_ago = (datetime.now(UTC) - timedelta(days=30)).isoformat()
-
     print("Query Configuration:")
-    print(f"  30 days ago: {thirty_days_ago}")
+    print(f"  30 days ago: {_CUTOFF_ISO}")
     print()
 
+    # Steps 1-4 issue independent queries - run them concurrently
+    website_filter = {"property": "Website", "url": {"is_not_empty": True}}
+
+    # The production filter (never enriched OR stale) is what the exclusion
+    # check must exercise, so it is queried as-is
+    enrichment_filter = {
+        "and": [
+            website_filter,
+            {
+                "or": [
+                    {"property": "Enrichment Status", "select": {"does_not_equal": "Completed"}},
+                    {"property": "Last Enrichment Date", "date": {"before": _CUTOFF_ISO}}
+                ]
+            }
+        ]
+    }
+    # Display buckets are separate server-side queries so no client-side
+    # date parsing is needed; they are never used to validate the filter
+    never_enriched_filter = {
+        "and": [
+            website_filter,
+            {"property": "Enrichment Status", "select": {"does_not_equal": "Completed"}}
+        ]
+    }
+    stale_filter = {
+        "and": [
+            website_filter,
+            {"property": "Enrichment Status", "select": {"equals": "Completed"}},
+            {"property": "Last Enrichment Date", "date": {"before": _CUTOFF_ISO}}
+        ]
+    }
+    recent_filter = {
+        "and": [
+            website_filter,
+            {"property": "Enrichment Status", "select": {"equals": "Completed"}},
+            {"property": "Last Enrichment Date", "date": {"on_or_after": _CUTOFF_ISO}}
+        ]
+    }
+
+    async def run_queries():
+        notion = AsyncFastJSONClient(auth=os.getenv("NOTION_API_KEY"))
+        try:
+            return await asyncio.gather(
+                query_all(notion, database_id, website_filter),
+                query_all(notion, database_id, enrichment_filter),
+                query_all(notion, database_id, never_enriched_filter),
+                query_all(notion, database_id, stale_filter),
+                query_all(notion, database_id, recent_filter),
+            )
+        finally:
+            await notion.aclose()
+
+    (all_practices, enrichment_pages, never_pages, stale_pages,
+     recent_pages) = asyncio.run(run_queries())
+
     # Step 1: Query all practices with websites
     print("Step 1: Querying ALL practices with websites...")
     print("-"*60)
 
-    all_practices = notion.databases.query(
-        database_id=database_id,
-        filter={
-            "property": "Website",
-            "url": {"is_not_empty": True}
-        }
-    )
-
-    total_with_websites = len(all_practices["results"])
+    total_with_websites = len(all_practices)
     print(f"✅ Found {total_with_websites} practices with websites")
     print()
 
@@ -59,24 +140,7 @@ def test_notion_requery():
     print("Step 2: Querying practices needing enrichment...")
     print("-"*60)
 
-    enrichment_query = notion.databases.query(
-        database_id=database_id,
-        filter={
-            "and": [
-                {"property": "Website", "url": {"is_not_empty": True}},
-                {
-                    "or": [
-                        # Never enriched
-                        {"property": "Enrichment Status", "select": {"does_not_equal": "Completed"}},
-                        # Or enriched >30 days ago
-                        {"property": "Last Enrichment Date", "date": {"before": thirty_days_ago}}
-                    ]
-                }
-            ]
-        }
-    )
-
-    needs_enrichment = len(enrichment_query["results"])
+    needs_enrichment = len(enrichment_pages)
     print(f"✅ Found {needs_enrichment} practices needing enrichment")
     print()
 
@@ -84,31 +148,20 @@ def test_notion_requery():
     print("Step 3: Categorizing results...")
     print("-"*60)
 
-    def get_enrichment_status(page):
-        """Extract enrichment status from page."""
-        status_prop = page["properties"].get("Enrichment Status", {}).get("select")
-        return status_prop["name"] if status_prop else None
-
     def get_enrichment_date(page):
         """Extract enrichment date from page."""
         date_prop = page["properties"].get("Last Enrichment Date", {}).get("date")
         return date_prop["start"] if date_prop else None
 
-    never_enriched = []
-    stale_enriched = []
-    recently_enriched = []
-
-    for page in enrichment_query["results"]:
-        status = get_enrichment_status(page)
-        date = get_enrichment_date(page)
+    def summarize(page):
+        """(practice name, status, last enrichment date) for display."""
+        status_prop = page["properties"].get("Enrichment Status", {}).get("select")
         practice_name = page["properties"].get("Practice Name", {}).get("title", [{}])[0].get("plain_text", "Unknown")
+        return practice_name, status_prop["name"] if status_prop else None, get_enrichment_date(page)
 
-        if status != "Completed":
-            never_enriched.append((practice_name, status, date))
-        elif date and datetime.fromisoformat(date.replace("Z", "+00:00")) < datetime.fromisoformat(thirty_days_ago):
-            stale_enriched.append((practice_name, status, date))
-        else:
-            recently_enriched.append((practice_name, status, date))
+    # Buckets come from the display-only server-side queries
+    never_enriched = [summarize(page) for page in never_pages]
+    stale_enriched = [summarize(page) for page in stale_pages]
 
     print(f"Never Enriched: {len(never_enriched)}")
     for name, status, date in never_enriched[:5]:  # Show first 5
@@ -124,35 +177,16 @@ def test_notion_requery():
         print(f"  ... and {len(stale_enriched) - 5} more")
     print()
 
-    print(f"Recent (<30 days): {len(recently_enriched)}")
-    for name, status, date in recently_enriched[:5]:  # Show first 5
-        print(f"  - {name} (Last: {date})")
-    if len(recently_enriched) > 5:
-        print(f"  ... and {len(recently_enriched) - 5} more")
-    print()
-
     # Step 4: Validate query excluded recent enrichments
     print("Step 4: Validating recently enriched practices excluded...")
     print("-"*60)
 
-    # Query practices enriched recently (should be excluded from enrichment query)
-    recent_query = notion.databases.query(
-        database_id=database_id,
-        filter={
-            "and": [
-                {"property": "Website", "url": {"is_not_empty": True}},
-                {"property": "Enrichment Status", "select": {"equals": "Completed"}},
-                {"property": "Last Enrichment Date", "date": {"on_or_after": thirty_days_ago}}
-            ]
-        }
-    )
-
-    excluded_count = len(recent_query["results"])
+    excluded_count = len(recent_pages)
     print(f"✅ Practices enriched <30 days ago: {excluded_count}")
 
     # These should NOT be in enrichment_query results
-    recent_page_ids = {p["id"] for p in recent_query["results"]}
-    enrichment_page_ids = {p["id"] for p in enrichment_query["results"]}
+    recent_page_ids = {p["id"] for p in recent_pages}
+    enrichment_page_ids = {p["id"] for p in enrichment_pages}
 
     incorrectly_included = recent_page_ids & enrichment_page_ids
 
@@ -170,7 +204,7 @@ def test_notion_requery():
     print(f"Practices needing enrichment: {needs_enrichment}")
     print(f"  - Never enriched: {len(never_enriched)}")
     print(f"  - Stale (>30 days): {len(stale_enriched)}")
-    print(f"  - Incorrectly included recent: {len(recently_enriched)}")
+    print(f"  - Incorrectly included recent: {len(incorrectly_included)}")
     print(f"Practices excluded (recent): {excluded_count}")
     print()
 
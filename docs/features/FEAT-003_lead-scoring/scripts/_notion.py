@@ -0,0 +1,31 @@
+"""
+Process-wide Notion client for the FEAT-003 scripts.
+
+notion_client.Client keeps an httpx connection pool, so reusing one client
+lets repeated calls (e.g. checking many pages) share a kept-alive TLS
+connection instead of opening a new one each time.
+
+The client is src.utils.fast_json.FastJSONClient, which decodes successful
+responses with orjson when it is installed.
+
+Usage:
+    from _notion import get_notion_client
+
+    client = get_notion_client()
+"""
+
+import functools
+import os
+import sys
+from pathlib import Path
+
+# Repo root, for the shared src package
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from src.utils.fast_json import FastJSONClient
+
+
+@functools.lru_cache(maxsize=1)
+def get_notion_client() -> FastJSONClient:
+    """The shared Client, created on first use from NOTION_API_KEY."""
+    return FastJSONClient(auth=os.environ["NOTION_API_KEY"])
@@ -0,0 +1,42 @@
+"""
+Cached Notion database schemas for the FEAT-003 scripts.
+
+The schema barely changes between runs, so the scripts read it from the
+pipeline's schema cache (src.integrations.notion_schema) instead of each
+fetching it every time. A fetch here refreshes that same cache.
+
+Usage:
+    from _notion_cache import load_schema
+
+    properties = load_schema(client, database_id)                # cached for 1h
+    properties = load_schema(client, database_id, refresh=True)  # force a fetch
+"""
+
+import sys
+from pathlib import Path
+
+# Repo root, for the shared src package
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from src.integrations.notion_schema import load_cached_schema, save_cached_schema
+
+DEFAULT_TTL = 3600  # seconds
+
+
+def load_schema(client, database_id, ttl=DEFAULT_TTL, refresh=False):
+    """Return the database's properties, from the cache when it is fresh.
+
+    Args:
+        client: notion_client.Client
+        database_id: Notion database ID (cache key)
+        ttl: Maximum cache age in seconds
+        refresh: Skip the cache and fetch (the result is still written back)
+
+    Returns:
+        The "properties" dict from databases.retrieve
+    """
+    database = None if refresh else load_cached_schema(database_id, ttl)
+    if database is None:
+        database = client.databases.retrieve(database_id=database_id)
+        save_cached_schema(database_id, database)
+    return database.get("properties", {})
@@ -10,17 +10,35 @@ This will show:
 5. Recommendations for consolidation
 """
 
+import argparse
 import os
 import sys
+from collections import defaultdict
 from pathlib import Path
 from dotenv import load_dotenv
-from notion_client import Client
 import json
 
+from _notion import get_notion_client
+from _notion_cache import load_schema
+
+try:
+    import orjson
+except ImportError:  # optional - stdlib json is the fallback
+    orjson = None
+
 # Load environment
 load_dotenv()
 
+# Status glyphs and the requirement row layout, built once
+_OK, _WARN, _MISS = "✅", "⚠️", "❌"
+_MISSING = f"{_MISS} MISSING"
+_ROW = "    {} {:35s} ({:15s}) - {}".format
+
 def main():
+    parser = argparse.ArgumentParser(description="Analyze Notion fields against feature requirements")
+    parser.add_argument("--no-cache", action="store_true", help="Re-fetch the database schema")
+    args = parser.parse_args()
+
     # Get credentials
     api_key = os.getenv("NOTION_API_KEY")
     database_id = os.getenv("NOTION_DATABASE_ID")
@@ -29,58 +47,56 @@ def main():
         print("❌ Error: NOTION_API_KEY and NOTION_DATABASE_ID must be set")
         sys.exit(1)
 
-    client = Client(auth=api_key)
+    client = get_notion_client()
 
     try:
-        # Retrieve database schema
-        response = client.databases.retrieve(database_id=database_id)
-        properties = response.get("properties", {})
+        # Retrieve database schema (cached on disk between runs)
+        properties = load_schema(client, database_id, refresh=args.no_cache)
+
+        # Index the schema once; every check below is a dict probe on these
+        type_index = {name: prop["type"] for name, prop in properties.items()}
+        select_opts = {
+            name: [opt["name"] for opt in prop[prop["type"]].get("options", [])]
+            for name, prop in properties.items()
+            if prop["type"] in ("select", "multi_select")
+        }
 
-        print("=" * 100)
-        print("COMPLETE NOTION DATABASE FIELD ANALYSIS")
-        print("=" * 100)
-        print(f"\nDatabase ID: {database_id}")
-        print(f"Total Fields: {len(properties)}\n")
+        # The report is buffered and written in one go once it is complete
+        lines = []
+        out = lines.append
+
+        out("=" * 100)
+        out("COMPLETE NOTION DATABASE FIELD ANALYSIS")
+        out("=" * 100)
+        out(f"\nDatabase ID: {database_id}")
+        out(f"Total Fields: {len(properties)}\n")
 
         # Group fields by type
-        fields_by_type = {}
-        for name, prop in properties.items():
-            field_type = prop["type"]
-            if field_type not in fields_by_type:
-                fields_by_type[field_type] = []
+        fields_by_type = defaultdict(list)
+        for name, field_type in type_index.items():
             fields_by_type[field_type].append(name)
 
-        print("\n" + "=" * 100)
-        print("ALL EXISTING FIELDS (Grouped by Type)")
-        print("=" * 100)
+        out("\n" + "=" * 100)
+        out("ALL EXISTING FIELDS (Grouped by Type)")
+        out("=" * 100)
 
         for field_type in sorted(fields_by_type.keys()):
             fields = sorted(fields_by_type[field_type])
-            print(f"\n{field_type.upper()} ({len(fields)} fields):")
+            out(f"\n{field_type.upper()} ({len(fields)} fields):")
             for field in fields:
                 # Get additional info for select/multi-select
-                field_data = properties[field]
-                if field_type == "select" and "select" in field_data:
-                    options = field_data["select"].get("options", [])
-                    if options:
-                        option_names = [opt["name"] for opt in options]
-                        print(f"  • {field:40s} Options: {', '.join(option_names)}")
-                    else:
-                        print(f"  • {field}")
-                elif field_type == "multi_select" and "multi_select" in field_data:
-                    options = field_data["multi_select"].get("options", [])
-                    if options:
-                        option_names = [opt["name"] for opt in options]
-                        print(f"  • {field:40s} Options: {', '.join(option_names[:3])}{'...' if len(option_names) > 3 else ''}")
-                    else:
-                        print(f"  • {field}")
+                option_names = select_opts.get(field)
+                if option_names and field_type == "select":
+                    out(f"  • {field:40s} Options: {', '.join(option_names)}")
+                elif option_names:
+                    out(f"  • {field:40s} Options: {', '.join(option_names[:3])}{'...' if len(option_names) > 3 else ''}")
                 else:
-                    print(f"  • {field}")
+                    out(f"  • {field}")
 
         # Feature requirements
-        print("\n" + "=" * 100)
-        print("FEATURE REQUIREMENTS ANALYSIS")
-        print("=" * 100)
+        out("\n" + "=" * 100)
+        out("FEATURE REQUIREMENTS ANALYSIS")
+        out("=" * 100)
 
         feat001_fields = {
             "READS": [],
@@ -157,127 +173,137 @@ def main():
             ]
         }
 
+        feats = {"FEAT-001": feat001_fields, "FEAT-002": feat002_fields, "FEAT-003": feat003_fields}
+        feat_titles = {
+            "FEAT-001": "Google Maps Scraping",
+            "FEAT-002": "Website Enrichment",
+            "FEAT-003": "Lead Scoring",
+        }
+
+        # One pass over the requirement tables: field -> [(type, feature), ...]
+        feature_field_types = defaultdict(list)
+        for feat_name, feat_data in feats.items():
+            for operation in ["READS", "WRITES"]:
+                for field_name, field_type, _ in feat_data[operation]:
+                    feature_field_types[field_name].append((field_type, feat_name))
+        feature_fields = feature_field_types.keys()
+
         # Analyze each feature
-        for feat_name, feat_data in [("FEAT-001", feat001_fields), ("FEAT-002", feat002_fields), ("FEAT-003", feat003_fields)]:
-            print(f"\n{feat_name} (Google Maps Scraping)" if feat_name == "FEAT-001" else
-                  f"\n{feat_name} (Website Enrichment)" if feat_name == "FEAT-002" else
-                  f"\n{feat_name} (Lead Scoring)")
-            print("-" * 100)
+        for feat_name, feat_data in feats.items():
+            out(f"\n{feat_name} ({feat_titles[feat_name]})")
+            out("-" * 100)
 
             for operation in ["READS", "WRITES"]:
                 if not feat_data[operation]:
                     continue
 
-                print(f"\n  {operation}:")
+                out(f"\n  {operation}:")
                 for field_name, field_type, description in feat_data[operation]:
-                    exists = field_name in properties
-                    if exists:
-                        actual_type = properties[field_name]["type"]
-                        type_match = actual_type == field_type
-                        status = "✅" if type_match else f"⚠️ (type mismatch: {actual_type})"
-                    else:
-                        status = "❌ MISSING"
-
-                    print(f"    {status} {field_name:35s} ({field_type:15s}) - {description}")
+                    actual_type = type_index.get(field_name)
+                    status = (
+                        _MISSING if actual_type is None
+                        else _OK if actual_type == field_type
+                        else f"{_WARN} (type mismatch: {actual_type})"
+                    )
+                    out(_ROW(status, field_name, field_type, description))
 
         # Find naming inconsistencies
-        print("\n" + "=" * 100)
-        print("NAMING PATTERN ANALYSIS")
-        print("=" * 100)
+        out("\n" + "=" * 100)
+        out("NAMING PATTERN ANALYSIS")
+        out("=" * 100)
 
         # Look for common patterns
-        potential_duplicates = []
-        field_names = list(properties.keys())
+        name_aliases = [
+            ("Rating", "Google Rating"),
+            ("Review Count", "Google Review Count"),
+            ("Multiple Locations", "Has Multiple Locations"),
+            ("Emergency 24/7", "Has Emergency Services"),
+        ]
+        potential_duplicates = [
+            (expected, actual, "Different names for same field")
+            for expected, actual in name_aliases
+            if expected not in type_index and actual in type_index
+        ]
 
         # Check for similar names
-        print("\nPotential Naming Issues:")
-        if "Rating" not in properties and "Google Rating" in properties:
-            potential_duplicates.append(("Rating", "Google Rating", "Different names for same field"))
-        if "Review Count" not in properties and "Google Review Count" in properties:
-            potential_duplicates.append(("Review Count", "Google Review Count", "Different names for same field"))
-        if "Multiple Locations" not in properties and "Has Multiple Locations" in properties:
-            potential_duplicates.append(("Multiple Locations", "Has Multiple Locations", "Different names for same field"))
-        if "Emergency 24/7" not in properties and "Has Emergency Services" in properties:
-            potential_duplicates.append(("Emergency 24/7", "Has Emergency Services", "Different names for same field"))
+        out("\nPotential Naming Issues:")
 
         if potential_duplicates:
             for expected, actual, reason in potential_duplicates:
-                print(f"  • Expected: '{expected}' but found: '{actual}' - {reason}")
+                out(f"  • Expected: '{expected}' but found: '{actual}' - {reason}")
         else:
-            print("  ✅ No obvious naming inconsistencies found")
+            out("  ✅ No obvious naming inconsistencies found")
 
         # Recommendations
-        print("\n" + "=" * 100)
-        print("RECOMMENDATIONS FOR SCHEMA CONSOLIDATION")
-        print("=" * 100)
-
-        print("\n1. STANDARDIZE NAMING CONVENTIONS:")
-        print("   • Use simple, clear names without prefixes")
-        print("   • Example: 'Rating' not 'Google Rating'")
-        print("   • Example: 'Emergency 24/7' not 'Has Emergency Services'")
-
-        print("\n2. MISSING FIELDS TO ADD:")
-        all_missing = set()
-        for feat_name, feat_data in [("FEAT-001", feat001_fields), ("FEAT-002", feat002_fields), ("FEAT-003", feat003_fields)]:
-            for operation in ["READS", "WRITES"]:
-                for field_name, field_type, description in feat_data[operation]:
-                    if field_name not in properties:
-                        all_missing.add((field_name, field_type, feat_name))
+        out("\n" + "=" * 100)
+        out("RECOMMENDATIONS FOR SCHEMA CONSOLIDATION")
+        out("=" * 100)
+
+        out("\n1. STANDARDIZE NAMING CONVENTIONS:")
+        out("   • Use simple, clear names without prefixes")
+        out("   • Example: 'Rating' not 'Google Rating'")
+        out("   • Example: 'Emergency 24/7' not 'Has Emergency Services'")
+
+        out("\n2. MISSING FIELDS TO ADD:")
+        all_missing = {
+            (field_name, field_type, feat_name)
+            for field_name, uses in feature_field_types.items()
+            if field_name not in type_index
+            for field_type, feat_name in uses
+        }
 
         if all_missing:
             for field_name, field_type, needed_by in sorted(all_missing):
-                print(f"   • {field_name:35s} ({field_type:15s}) - Needed by {needed_by}")
+                out(f"   • {field_name:35s} ({field_type:15s}) - Needed by {needed_by}")
 
-        print("\n3. FIELDS TO RENAME (If Different):")
-        print("   Check if these exist with different names:")
+        out("\n3. FIELDS TO RENAME (If Different):")
+        out("   Check if these exist with different names:")
         for expected, actual, reason in potential_duplicates:
-            print(f"   • '{actual}' → '{expected}'")
+            out(f"   • '{actual}' → '{expected}'")
 
-        print("\n4. UNUSED FIELDS (Not referenced by any feature):")
-        feature_fields = set()
-        for feat_data in [feat001_fields, feat002_fields, feat003_fields]:
-            for operation in ["READS", "WRITES"]:
-                for field_name, _, _ in feat_data[operation]:
-                    feature_fields.add(field_name)
-
-        unused = []
-        for field_name in properties.keys():
-            if field_name not in feature_fields:
-                unused.append(field_name)
+        out("\n4. UNUSED FIELDS (Not referenced by any feature):")
+        unused = sorted(name for name in type_index if name not in feature_fields)
 
         if unused:
-            for field in sorted(unused):
-                print(f"   • {field:35s} ({properties[field]['type']})")
+            for field in unused:
+                out(f"   • {field:35s} ({type_index[field]})")
         else:
-            print("   ✅ All fields are used by at least one feature")
+            out("   ✅ All fields are used by at least one feature")
+
+        out("\n" + "=" * 100)
+        out("NEXT STEPS")
+        out("=" * 100)
+        out("\n1. Review existing fields and identify which ones match requirements")
+        out("2. Rename fields for consistency (if needed)")
+        out("3. Add missing fields")
+        out("4. Update feature code to use actual field names")
+        out("5. Re-run schema check to verify")
 
-        print("\n" + "=" * 100)
-        print("NEXT STEPS")
-        print("=" * 100)
-        print("\n1. Review existing fields and identify which ones match requirements")
-        print("2. Rename fields for consistency (if needed)")
-        print("3. Add missing fields")
-        print("4. Update feature code to use actual field names")
-        print("5. Re-run schema check to verify")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
         # Export to JSON for detailed analysis
         output_file = "notion_schema_analysis.json"
         analysis_data = {
             "database_id": database_id,
             "total_fields": len(properties),
-            "existing_fields": {name: prop["type"] for name, prop in properties.items()},
-            "feature_requirements": {
-                "FEAT-001": feat001_fields,
-                "FEAT-002": feat002_fields,
-                "FEAT-003": feat003_fields
-            },
-            "missing_fields": list(all_missing),
+            "existing_fields": type_index,
+            "feature_requirements": feats,
+            "missing_fields": [
+                {"name": name, "type": field_type, "needed_by": feat_name}
+                for name, field_type, feat_name in sorted(all_missing)
+            ],
             "potential_duplicates": potential_duplicates,
             "unused_fields": unused
         }
 
-        with open(output_file, 'w') as f:
-            json.dump(analysis_data, f, indent=2)
+        if orjson is not None:
+            Path(output_file).write_bytes(
+                orjson.dumps(analysis_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            )
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(analysis_data, f, indent=2, sort_keys=True)
 
         print(f"\n📄 Detailed analysis exported to: {output_file}")
 
@@ -1,66 +1,207 @@
 #!/usr/bin/env python3
 """Quick script to check if new fields were populated."""
 
+import argparse
+import asyncio
 import os
 import sys
-from notion_client import Client
+from pathlib import Path
+from urllib.parse import unquote
 from dotenv import load_dotenv
+from notion_client import APIResponseError
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+# Repo root, for the shared src package
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from src.utils.fast_json import AsyncFastJSONClient
+from _notion import get_notion_client
+from _notion_cache import load_schema
 
 load_dotenv()
 
-notion = Client(auth=os.getenv("NOTION_API_KEY"))
-page_id = sys.argv[1]
+# The only properties this script reads
+QUICK_WIN_FIELDS = (
+    "Google Maps URL",
+    "Operating Hours",
+    "First Scraped Date",
+    "Last Scraped Date",
+    "Enrichment Error",
+)
 
-page = notion.pages.retrieve(page_id=page_id)
-props = page["properties"]
+# Status glyph by whether the field is populated
+STATUS = ("❌", "✅")
 
-print("\n" + "=" * 80)
-print("NEW QUICK WIN FIELDS")
-print("=" * 80)
+# Notion allows ~3 requests/s per integration
+MAX_CONCURRENT_RETRIEVES = 3
 
-# Check Google Maps URL
-gmaps = props.get("Google Maps URL", {})
-gmaps_url = gmaps.get("url") if gmaps else None
-print(f"  {'✅' if gmaps_url else '❌'} Google Maps URL         = {gmaps_url or '(empty)'}")
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("page_ids", nargs="*", help="Notion page IDs of the practices")
+parser.add_argument("--page-ids-file", type=Path, help="File with one page ID per line")
+parser.add_argument("--no-cache", action="store_true", help="Re-fetch the database schema")
+parser.add_argument(
+    "--batch", action="store_true",
+    help="Read pages 100 at a time via databases.query instead of one request per page"
+)
+args = parser.parse_args()
 
-# Check Operating Hours
-hours = props.get("Operating Hours", {})
-hours_text = hours.get("rich_text", [])
-if hours_text and len(hours_text) > 0:
-    hours_content = hours_text[0].get("plain_text", "")
-    print(f"  ✅ Operating Hours         = {hours_content[:50]}..." if len(hours_content) > 50 else f"  ✅ Operating Hours         = {hours_content}")
-else:
-    print(f"  ❌ Operating Hours         = (empty)")
-
-# Check First Scraped Date
-first_date = props.get("First Scraped Date", {})
-first_date_value = first_date.get("date", {}).get("start") if first_date else None
-print(f"  {'✅' if first_date_value else '❌'} First Scraped Date     = {first_date_value or '(empty)'}")
-
-# Check Last Scraped Date
-last_date = props.get("Last Scraped Date", {})
-last_date_value = last_date.get("date", {}).get("start") if last_date else None
-print(f"  {'✅' if last_date_value else '❌'} Last Scraped Date      = {last_date_value or '(empty)'}")
-
-# Check Enrichment Error
-enrich_error = props.get("Enrichment Error", {})
-error_text = enrich_error.get("rich_text", [])
-if error_text and len(error_text) > 0:
-    error_content = error_text[0].get("plain_text", "")
-    print(f"  ✅ Enrichment Error        = {error_content}")
-else:
-    print(f"  ✅ Enrichment Error        = (empty - no errors)")
+page_ids = list(args.page_ids)
+if args.page_ids_file:
+    page_ids += [line.strip() for line in args.page_ids_file.read_text().splitlines() if line.strip()]
+if not page_ids:
+    parser.error("give at least one page ID or --page-ids-file")
+if args.batch and not os.getenv("NOTION_DATABASE_ID"):
+    parser.error("--batch needs NOTION_DATABASE_ID")
+
+# One client for every page, so the checks share its kept-alive connection
+notion = get_notion_client()
+database_id = os.getenv("NOTION_DATABASE_ID")
+
+
+def property_ids(notion, database_id):
+    """Name -> property ID map, from the cached schema.
+
+    filter_properties takes IDs, not names; IDs come back URL-encoded and
+    httpx encodes query params itself.
+    """
+    properties = load_schema(notion, database_id, refresh=args.no_cache)
+    return {name: unquote(prop["id"]) for name, prop in properties.items()}
+
+
+# Fetch only the quick win properties; fall back to the full page when the
+# database is unknown or a field isn't in the ID map
+ids = property_ids(notion, database_id) if database_id else {}
+filter_ids = None
+if all(name in ids for name in QUICK_WIN_FIELDS):
+    filter_ids = [ids[name] for name in QUICK_WIN_FIELDS]
+
+
+def report(page_id, props):
+    """Print the quick win fields of one page."""
+    print("\n" + "=" * 80)
+    print(f"NEW QUICK WIN FIELDS - {page_id}")
+    print("=" * 80)
+
+    # Check Google Maps URL
+    gmaps = props.get("Google Maps URL", {})
+    gmaps_url = gmaps.get("url") if gmaps else None
+    print(f"  {STATUS[bool(gmaps_url)]} Google Maps URL         = {gmaps_url or '(empty)'}")
+
+    # Check Operating Hours
+    hours = props.get("Operating Hours", {})
+    hours_text = hours.get("rich_text", [])
+    if hours_text and len(hours_text) > 0:
+        hours_content = hours_text[0].get("plain_text", "")
+        print(f"  ✅ Operating Hours         = {hours_content[:50]}..." if len(hours_content) > 50 else f"  ✅ Operating Hours         = {hours_content}")
+    else:
+        print(f"  ❌ Operating Hours         = (empty)")
+
+    # Check First Scraped Date
+    first_date = props.get("First Scraped Date", {})
+    first_date_value = first_date.get("date", {}).get("start") if first_date else None
+    print(f"  {STATUS[bool(first_date_value)]} First Scraped Date     = {first_date_value or '(empty)'}")
+
+    # Check Last Scraped Date
+    last_date = props.get("Last Scraped Date", {})
+    last_date_value = last_date.get("date", {}).get("start") if last_date else None
+    print(f"  {STATUS[bool(last_date_value)]} Last Scraped Date      = {last_date_value or '(empty)'}")
 
-print("=" * 80)
+    # Check Enrichment Error
+    enrich_error = props.get("Enrichment Error", {})
+    error_text = enrich_error.get("rich_text", [])
+    if error_text and len(error_text) > 0:
+        error_content = error_text[0].get("plain_text", "")
+        print(f"  ✅ Enrichment Error        = {error_content}")
+    else:
+        print(f"  ✅ Enrichment Error        = (empty - no errors)")
 
-# Count populated
-populated = sum([
-    1 if gmaps_url else 0,
-    1 if hours_text and len(hours_text) > 0 else 0,
-    1 if first_date_value else 0,
-    1 if last_date_value else 0,
-    1  # Enrichment Error always counts as populated (empty = no errors)
-])
+    print("=" * 80)
 
-print(f"\nSummary: {populated}/5 quick win fields populated")
-print("=" * 80 + "\n")
+    # Count populated
+    populated = sum([
+        1 if gmaps_url else 0,
+        1 if hours_text and len(hours_text) > 0 else 0,
+        1 if first_date_value else 0,
+        1 if last_date_value else 0,
+        1  # Enrichment Error always counts as populated (empty = no errors)
+    ])
+
+    print(f"\nSummary: {populated}/5 quick win fields populated")
+    print("=" * 80 + "\n")
+
+
+def query_pages(wanted):
+    """Properties of the wanted pages, read via databases.query (100 per request).
+
+    Notion can't filter a query by page ID, so the database is paged through
+    until every wanted page has been seen.
+    """
+    found = {}
+    start_cursor = None
+    while True:
+        query_params = {"database_id": database_id, "page_size": 100}
+        if filter_ids:
+            query_params["filter_properties"] = filter_ids
+        if start_cursor:
+            query_params["start_cursor"] = start_cursor
+        response = notion.databases.query(**query_params)
+
+        for page in response["results"]:
+            key = page["id"].replace("-", "")
+            if key in wanted:
+                found[key] = page["properties"]
+        if len(found) == len(wanted) or not response.get("has_more"):
+            return found
+        start_cursor = response.get("next_cursor")
+
+
+def _is_retryable(error):
+    """Rate limits and Notion-side failures are worth another try."""
+    return isinstance(error, APIResponseError) and (
+        error.code == "rate_limited" or 500 <= error.status < 600
+    )
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=30),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True
+)
+async def fetch_page(client, semaphore, page_id):
+    """pages.retrieve for one page, at most MAX_CONCURRENT_RETRIEVES at once."""
+    async with semaphore:
+        if filter_ids:
+            return await client.pages.retrieve(page_id=page_id, filter_properties=filter_ids)
+        return await client.pages.retrieve(page_id=page_id)
+
+
+async def retrieve_pages(page_ids):
+    """Retrieve the pages concurrently; results are in page_ids order.
+
+    A failed retrieve (e.g. a 404 for a deleted page) is returned as its
+    exception so the remaining pages are still reported.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RETRIEVES)
+    async with AsyncFastJSONClient(auth=os.environ["NOTION_API_KEY"]) as client:
+        return await asyncio.gather(
+            *(fetch_page(client, semaphore, page_id) for page_id in page_ids),
+            return_exceptions=True
+        )
+
+
+if args.batch:
+    # IDs are compared without hyphens - both forms are valid page IDs
+    found = query_pages({page_id.replace("-", "") for page_id in page_ids})
+    for page_id in page_ids:
+        props = found.get(page_id.replace("-", ""))
+        if props is None:
+            print(f"\n❌ {page_id}: not found in database {database_id}")
+        else:
+            report(page_id, props)
+else:
+    for page_id, page in zip(page_ids, asyncio.run(retrieve_pages(page_ids))):
+        if isinstance(page, Exception):
+            print(f"\n❌ {page_id}: {type(page).__name__}: {page}")
+        else:
+            report(page_id, page["properties"])
@@ -13,15 +13,22 @@ Tests a single website URL and shows:
 Usage:
     python diagnose_website_scraping.py <URL>
     python diagnose_website_scraping.py http://www.shelburnefallsvet.com
+    python diagnose_website_scraping.py <URL> --no-llm-cache  # always call OpenAI
+    python diagnose_website_scraping.py <URL> --trim-llm-input  # signal lines first, no boilerplate
 """
 
+import argparse
 import asyncio
+import hashlib
+import re
 import sys
 import logging
+from pathlib import Path
 from typing import Dict, List
 
 from src.enrichment.website_scraper import WebsiteScraper
 from src.enrichment.llm_extractor import LLMExtractor
+from src.models.enrichment_models import VetPracticeExtraction, WebsiteData
 from src.utils.cost_tracker import CostTracker
 from src.config.config import get_config
 
@@ -32,6 +39,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Browser profile shared by diagnostic runs
+DIAGNOSTIC_PROFILE_DIR = Path.home() / ".cache" / "us-vet-scraping" / "browser-profile"
+
+# Extractions from earlier runs, one JSON file per content hash
+LLM_CACHE_DIR = Path.home() / ".cache" / "us-vet-scraping" / "llm"
+
+
+# Page types the diagnostic expects to find, with the label used when missing
+EXPECTED_PAGE_TYPES = (("about", "/about"), ("team", "/team or /staff"), ("contact", "/contact"))
+
+
+# One scan per URL; the named group that matched is the page type
+_PAGE_TYPE_RE = re.compile(r"(?P<about>about)|(?P<team>team|staff)|(?P<contact>contact)")
+
+
+def classify_page(url: str) -> str:
+    """Page type from its URL: about, team, contact or homepage."""
+    match = _PAGE_TYPE_RE.search(url.lower())
+    return match.lastgroup if match else "homepage"
+
+
+# Below these sizes the LLM step can't find anything and is skipped
+MIN_LLM_CHARS = 500  # total across pages
+MIN_PAGE_CHARS = 200  # every page shorter than this
+
+# LLMExtractor keeps at most 3000 chars of any page (team budget); with
+# --trim-llm-input only the most useful lines are sent. Off by default, since
+# production sends pages untrimmed and this tool reproduces its result
+LLM_PAGE_CHARS = 3000
+_SIGNAL_RE = re.compile(r"\b(DVM|VMD|owner|founder|hospital administrator|practice manager)\b|@[\w-]+\.\w+", re.I)
+_BOILERPLATE_RE = re.compile(
+    r"^\s*(©|(skip to (main )?content|menu|home|privacy policy|terms of (use|service)|"
+    r"cookies?|all rights reserved|copyright|follow us|sitemap)\b)",
+    re.I
+)
+
+
+def trim_for_llm(page: WebsiteData, max_chars: int = LLM_PAGE_CHARS) -> WebsiteData:
+    """Page with navigation/footer lines dropped and signal lines moved first.
+
+    Lines naming vets, owners or emails come before the rest (original order
+    kept within each group), then the text is cut to max_chars.
+    """
+    lines = [line for line in page.content.splitlines() if line.strip() and not _BOILERPLATE_RE.match(line)]
+    signal = [line for line in lines if _SIGNAL_RE.search(line)]
+    rest = [line for line in lines if not _SIGNAL_RE.search(line)]
+    content = "\n".join(signal + rest)[:max_chars]
+    return page.model_copy(update={"content": content}) if content.strip() else page
+
 
 def print_banner(text: str, char: str = "="):
     """Print a banner with text."""
@@ -40,8 +96,23 @@ def print_banner(text: str, char: str = "="):
     print(f"{char * 70}\n")
 
 
-async def diagnose_website(url: str):
-    """Diagnose website scraping for a single URL."""
+def llm_cache_path(pages: List[WebsiteData], extractor: LLMExtractor) -> Path:
+    """Cache file for this exact LLM input (model, prompt and page contents)."""
+    digest = hashlib.sha256()
+    for part in (extractor.config.model, extractor.extraction_prompt, *(page.content for page in pages)):
+        digest.update(part.encode())
+        digest.update(b"\x00")
+    return LLM_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+async def diagnose_website(url: str, use_llm_cache: bool = True, trim_llm_input: bool = False):
+    """Diagnose website scraping for a single URL.
+
+    With use_llm_cache, an extraction of byte-identical content from an
+    earlier run is reused instead of calling OpenAI again. With
+    trim_llm_input, pages go through trim_for_llm() first, so the result no
+    longer matches what production would extract.
+    """
 
     print_banner(f"WEBSITE SCRAPING DIAGNOSTIC: {url}")
 
@@ -54,16 +125,27 @@ async def diagnose_website(url: str):
     print(f"Max pages: 5")
     print(f"URL patterns: *about*, *team*, *staff*, *contact*\n")
 
+    # Re-runs against the same site hit Crawl4AI's on-disk page cache; the
+    # persistent profile keeps cookies (e.g. passed bot checks) between runs
     scraper = WebsiteScraper(
         cache_enabled=True,
         max_depth=1,
         max_pages=5,
-        page_timeout=30000
+        page_timeout=30000,
+        user_data_dir=str(DIAGNOSTIC_PROFILE_DIR)
     )
 
+    # Extraction needs every page, but its setup doesn't: load the token
+    # encoder (first budget check) off the event loop while the crawl runs
+    cost_tracker = CostTracker(budget_limit=10.0)  # $10 budget for diagnostic
+    encoder_warmup = asyncio.create_task(asyncio.to_thread(cost_tracker.count_tokens, ""))
+
     pages = []
     async with scraper:
-        pages = await scraper.scrape_multi_page(url)
+        # Pages are reported as they finish; BFS already fetches each level concurrently
+        async for page in scraper.scrape_multi_page_iter(url):
+            pages.append(page)
+            print(f"  ✓ {page.url} ({len(page.content):,} chars)")
 
     print(f"\nRESULTS:")
     print(f"  Total pages scraped: {len(pages)}")
@@ -79,30 +161,16 @@ async def diagnose_website(url: str):
         return
 
     # Show page details
+    page_types = [classify_page(page.url) for page in pages]
     print("\n  Pages discovered:")
-    for i, page in enumerate(pages, 1):
-        url_lower = page.url.lower()
-        page_type = "homepage"
-        if "about" in url_lower:
-            page_type = "about"
-        elif "team" in url_lower or "staff" in url_lower:
-            page_type = "team"
-        elif "contact" in url_lower:
-            page_type = "contact"
-
+    for i, (page, page_type) in enumerate(zip(pages, page_types), 1):
         print(f"    {i}. [{page_type:8}] {page.url}")
         print(f"       Title: {page.title or '(none)'}")
         print(f"       Content: {len(page.content):,} characters")
 
     # Check for missing page types
-    page_urls = [p.url.lower() for p in pages]
-    missing = []
-    if not any("about" in u for u in page_urls):
-        missing.append("/about")
-    if not any("team" in u or "staff" in u for u in page_urls):
-        missing.append("/team or /staff")
-    if not any("contact" in u for u in page_urls):
-        missing.append("/contact")
+    seen = set(page_types)
+    missing = [label for page_type, label in EXPECTED_PAGE_TYPES if page_type not in seen]
 
     if missing:
         print(f"\n  ⚠️  Missing page types: {', '.join(missing)}")
@@ -114,95 +182,120 @@ async def diagnose_website(url: str):
     print_banner("STEP 2: LLM Data Extraction", "-")
     print(f"Using OpenAI GPT-4o with structured outputs\n")
 
-    cost_tracker = CostTracker(budget_limit=10.0)  # $10 budget for diagnostic
-    extractor = LLMExtractor(
-        cost_tracker=cost_tracker,
-        config=config.openai
-    )
-
-    try:
-        extraction = await extractor.extract_practice_data(
-            practice_name="Diagnostic Test Practice",
-            website_pages=pages
+    # Too little text to extract anything from - don't pay for the call
+    total_chars = sum(len(page.content) for page in pages)
+    extraction = None
+    if total_chars < MIN_LLM_CHARS or all(len(page.content) < MIN_PAGE_CHARS for page in pages):
+        await encoder_warmup
+        avoided = cost_tracker.estimate_cost(
+            "\n".join(page.content for page in pages), LLMExtractor.ESTIMATED_OUTPUT_TOKENS
+        )
+        print(f"⚠️  Insufficient content ({total_chars:,} chars) - skipping LLM extraction")
+        print(f"   Estimated cost avoided: ${avoided:.4f}")
+    else:
+        if trim_llm_input:
+            chars_before = sum(len(page.content) for page in pages)
+            pages = [trim_for_llm(page) for page in pages]
+            chars_after = sum(len(page.content) for page in pages)
+            logger.info(f"Trimmed LLM input: {chars_before:,} -> {chars_after:,} chars")
+
+        await encoder_warmup
+        extractor = LLMExtractor(
+            cost_tracker=cost_tracker,
+            config=config.openai
         )
 
-        print("EXTRACTION RESULTS:")
-        print(f"  Vet Count: {extraction.vet_count_total} (confidence: {extraction.vet_count_confidence})")
-
-        if extraction.decision_maker:
-            print(f"  Decision Maker:")
-            print(f"    Name: {extraction.decision_maker.name or '(not found)'}")
-            print(f"    Role: {extraction.decision_maker.role or '(not found)'}")
-            print(f"    Email: {extraction.decision_maker.email or '(not found)'}")
-            print(f"    Phone: {extraction.decision_maker.phone or '(not found)'}")
-        else:
-            print(f"  Decision Maker: (not found)")
-
-        # Check the "missing" fields
-        print(f"\n  FIELDS ANALYSIS:")
-
-        # Personalization Context
-        if extraction.personalization_context:
-            print(f"    ✅ Personalization Context: {len(extraction.personalization_context)} items")
-            for item in extraction.personalization_context[:3]:
-                print(f"       - {item}")
-        else:
-            print(f"    ❌ Personalization Context: empty")
-
-        # Awards
-        if extraction.awards_accreditations:
-            print(f"    ✅ Awards/Accreditations: {len(extraction.awards_accreditations)} items")
-            for item in extraction.awards_accreditations:
-                print(f"       - {item}")
-        else:
-            print(f"    ❌ Awards/Accreditations: empty (not found on website)")
-
-        # Community Involvement
-        if extraction.community_involvement:
-            print(f"    ✅ Community Involvement: {len(extraction.community_involvement)} items")
-            for item in extraction.community_involvement:
-                print(f"       - {item}")
-        else:
-            print(f"    ❌ Community Involvement: empty (not found on website)")
-
-        # Recent News
-        if extraction.recent_news_updates:
-            print(f"    ✅ Recent News/Updates: {len(extraction.recent_news_updates)} items")
-            for item in extraction.recent_news_updates:
-                print(f"       - {item}")
-        else:
-            print(f"    ❌ Recent News/Updates: empty (not found on website)")
-
-        # Practice Philosophy
-        if extraction.practice_philosophy:
-            preview = extraction.practice_philosophy[:100]
-            print(f"    ✅ Practice Philosophy: {len(extraction.practice_philosophy)} chars")
-            print(f"       Preview: {preview}...")
-        else:
-            print(f"    ❌ Practice Philosophy: empty (not found on website)")
-
-        # Services
-        services = []
-        if extraction.emergency_24_7:
-            services.append("24/7 Emergency")
-        if extraction.online_booking:
-            services.append("Online Booking")
-        if extraction.patient_portal:
-            services.append("Patient Portal")
-        if extraction.telemedicine_virtual_care:
-            services.append("Telemedicine")
-
-        if services:
-            print(f"\n  Services Detected: {', '.join(services)}")
-        else:
-            print(f"\n  Services Detected: None")
-
-        print(f"\n  OpenAI Cost: ${cost_tracker.cumulative_cost:.4f}")
-
-    except Exception as e:
-        print(f"  ❌ EXTRACTION FAILED: {e}")
-        logger.exception("Extraction error")
-        return
+        cache_path = llm_cache_path(pages, extractor)
+        try:
+            if use_llm_cache and cache_path.exists():
+                extraction = VetPracticeExtraction.model_validate_json(cache_path.read_text())
+                print(f"♻️  Same content as a previous run - reusing {cache_path.name[:12]}... (no OpenAI call)\n")
+            else:
+                extraction = await extractor.extract_practice_data(
+                    practice_name="Diagnostic Test Practice",
+                    website_pages=pages
+                )
+                if extraction is not None:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(extraction.model_dump_json())
+
+            print("EXTRACTION RESULTS:")
+            print(f"  Vet Count: {extraction.vet_count_total} (confidence: {extraction.vet_count_confidence})")
+
+            if extraction.decision_maker:
+                print(f"  Decision Maker:")
+                print(f"    Name: {extraction.decision_maker.name or '(not found)'}")
+                print(f"    Role: {extraction.decision_maker.role or '(not found)'}")
+                print(f"    Email: {extraction.decision_maker.email or '(not found)'}")
+                print(f"    Phone: {extraction.decision_maker.phone or '(not found)'}")
+            else:
+                print(f"  Decision Maker: (not found)")
+
+            # Check the "missing" fields
+            print(f"\n  FIELDS ANALYSIS:")
+
+            # Personalization Context
+            if extraction.personalization_context:
+                print(f"    ✅ Personalization Context: {len(extraction.personalization_context)} items")
+                for item in extraction.personalization_context[:3]:
+                    print(f"       - {item}")
+            else:
+                print(f"    ❌ Personalization Context: empty")
+
+            # Awards
+            if extraction.awards_accreditations:
+                print(f"    ✅ Awards/Accreditations: {len(extraction.awards_accreditations)} items")
+                for item in extraction.awards_accreditations:
+                    print(f"       - {item}")
+            else:
+                print(f"    ❌ Awards/Accreditations: empty (not found on website)")
+
+            # Community Involvement
+            if extraction.community_involvement:
+                print(f"    ✅ Community Involvement: {len(extraction.community_involvement)} items")
+                for item in extraction.community_involvement:
+                    print(f"       - {item}")
+            else:
+                print(f"    ❌ Community Involvement: empty (not found on website)")
+
+            # Recent News
+            if extraction.recent_news_updates:
+                print(f"    ✅ Recent News/Updates: {len(extraction.recent_news_updates)} items")
+                for item in extraction.recent_news_updates:
+                    print(f"       - {item}")
+            else:
+                print(f"    ❌ Recent News/Updates: empty (not found on website)")
+
+            # Practice Philosophy
+            if extraction.practice_philosophy:
+                preview = extraction.practice_philosophy[:100]
+                print(f"    ✅ Practice Philosophy: {len(extraction.practice_philosophy)} chars")
+                print(f"       Preview: {preview}...")
+            else:
+                print(f"    ❌ Practice Philosophy: empty (not found on website)")
+
+            # Services
+            services = []
+            if extraction.emergency_24_7:
+                services.append("24/7 Emergency")
+            if extraction.online_booking:
+                services.append("Online Booking")
+            if extraction.patient_portal:
+                services.append("Patient Portal")
+            if extraction.telemedicine_virtual_care:
+                services.append("Telemedicine")
+
+            if services:
+                print(f"\n  Services Detected: {', '.join(services)}")
+            else:
+                print(f"\n  Services Detected: None")
+
+            print(f"\n  OpenAI Cost: ${cost_tracker.cumulative_cost:.4f}")
+
+        except Exception as e:
+            print(f"  ❌ EXTRACTION FAILED: {e}")
+            logger.exception("Extraction error")
+            return
 
     # Step 3: Conclusion
     print_banner("DIAGNOSTIC CONCLUSION", "-")
@@ -219,42 +312,45 @@ async def diagnose_website(url: str):
 
     print()
 
-    # Count populated fields
-    populated = 0
-    total = 0
-
-    fields_check = [
-        ("Vet Count", extraction.vet_count_total is not None),
-        ("Decision Maker Name", extraction.decision_maker and extraction.decision_maker.name),
-        ("Decision Maker Email", extraction.decision_maker and extraction.decision_maker.email),
-        ("24/7 Emergency", extraction.emergency_24_7),
-        ("Online Booking", extraction.online_booking),
-        ("Patient Portal", extraction.patient_portal),
-        ("Telemedicine", extraction.telemedicine_virtual_care),
-        ("Awards", bool(extraction.awards_accreditations)),
-        ("Community Involvement", bool(extraction.community_involvement)),
-        ("Recent News", bool(extraction.recent_news_updates)),
-        ("Practice Philosophy", bool(extraction.practice_philosophy)),
-    ]
-
-    for field_name, is_populated in fields_check:
-        total += 1
-        if is_populated:
-            populated += 1
-
-    coverage = (populated / total * 100) if total > 0 else 0
-
-    if coverage >= 70:
-        print(f"✅ DATA COMPLETENESS: GOOD ({coverage:.0f}%)")
-        print(f"   {populated}/{total} key fields populated")
-    elif coverage >= 40:
-        print(f"⚠️  DATA COMPLETENESS: PARTIAL ({coverage:.0f}%)")
-        print(f"   {populated}/{total} key fields populated")
-        print(f"   Missing fields likely not on website or in hard-to-find locations")
+    if extraction is None:
+        print("⏭️  DATA COMPLETENESS: NOT EVALUATED (LLM extraction skipped)")
     else:
-        print(f"❌ DATA COMPLETENESS: POOR ({coverage:.0f}%)")
-        print(f"   Only {populated}/{total} key fields populated")
-        print(f"   Check if website has /about or /team pages with this information")
+        # Count populated fields
+        populated = 0
+        total = 0
+
+        fields_check = [
+            ("Vet Count", extraction.vet_count_total is not None),
+            ("Decision Maker Name", extraction.decision_maker and extraction.decision_maker.name),
+            ("Decision Maker Email", extraction.decision_maker and extraction.decision_maker.email),
+            ("24/7 Emergency", extraction.emergency_24_7),
+            ("Online Booking", extraction.online_booking),
+            ("Patient Portal", extraction.patient_portal),
+            ("Telemedicine", extraction.telemedicine_virtual_care),
+            ("Awards", bool(extraction.awards_accreditations)),
+            ("Community Involvement", bool(extraction.community_involvement)),
+            ("Recent News", bool(extraction.recent_news_updates)),
+            ("Practice Philosophy", bool(extraction.practice_philosophy)),
+        ]
+
+        for field_name, is_populated in fields_check:
+            total += 1
+            if is_populated:
+                populated += 1
+
+        coverage = (populated / total * 100) if total > 0 else 0
+
+        if coverage >= 70:
+            print(f"✅ DATA COMPLETENESS: GOOD ({coverage:.0f}%)")
+            print(f"   {populated}/{total} key fields populated")
+        elif coverage >= 40:
+            print(f"⚠️  DATA COMPLETENESS: PARTIAL ({coverage:.0f}%)")
+            print(f"   {populated}/{total} key fields populated")
+            print(f"   Missing fields likely not on website or in hard-to-find locations")
+        else:
+            print(f"❌ DATA COMPLETENESS: POOR ({coverage:.0f}%)")
+            print(f"   Only {populated}/{total} key fields populated")
+            print(f"   Check if website has /about or /team pages with this information")
 
     print()
 
@@ -265,15 +361,18 @@ async def diagnose_website(url: str):
         print(f"  1. Manually check website for: {', '.join(missing)}")
         print(f"     If these pages exist, check URL patterns (they might use different naming)")
 
-    if not extraction.decision_maker or not extraction.decision_maker.email:
-        print(f"  2. Decision maker email not found - check /contact, /about, /team pages manually")
-        print(f"     Email might be in image format or obfuscated (can't be scraped)")
+    if extraction is None:
+        print(f"  2. Scraped pages are nearly empty - check whether the site renders content with JavaScript")
+    else:
+        if not extraction.decision_maker or not extraction.decision_maker.email:
+            print(f"  2. Decision maker email not found - check /contact, /about, /team pages manually")
+            print(f"     Email might be in image format or obfuscated (can't be scraped)")
 
-    if not extraction.awards_accreditations:
-        print(f"  3. Awards/Accreditations not found - may not be prominently displayed")
+        if not extraction.awards_accreditations:
+            print(f"  3. Awards/Accreditations not found - may not be prominently displayed")
 
-    if not extraction.community_involvement:
-        print(f"  4. Community Involvement not found - check /about page or news section")
+        if not extraction.community_involvement:
+            print(f"  4. Community Involvement not found - check /about page or news section")
 
     print()
     print("=" * 70)
@@ -281,13 +380,23 @@ async def diagnose_website(url: str):
 
 def main():
     """Main entry point."""
-    if len(sys.argv) != 2:
-        print("Usage: python diagnose_website_scraping.py <URL>")
-        print("\nExample:")
-        print("  python diagnose_website_scraping.py http://www.shelburnefallsvet.com")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Diagnose website scraping for a single URL",
+        epilog="Example: python diagnose_website_scraping.py http://www.shelburnefallsvet.com"
+    )
+    parser.add_argument("url", help="Practice website URL")
+    parser.add_argument(
+        "--no-llm-cache", action="store_true",
+        help="Call OpenAI even if this content was extracted before (the cache is still refreshed)"
+    )
+    parser.add_argument(
+        "--trim-llm-input", action="store_true",
+        help="Drop boilerplate lines and put signal lines first before extracting "
+             "(differs from production, which sends pages untrimmed)"
+    )
+    args = parser.parse_args()
 
-    url = sys.argv[1]
+    url = args.url
 
     # Validate URL
     if not url.startswith(('http://', 'https://')):
@@ -295,7 +404,9 @@ def main():
         print("URL must start with http:// or https://")
         sys.exit(1)
 
-    asyncio.run(diagnose_website(url))
+    asyncio.run(diagnose_website(
+        url, use_llm_cache=not args.no_llm_cache, trim_llm_input=args.trim_llm_input
+    ))
 
 
 if __name__ == "__main__":
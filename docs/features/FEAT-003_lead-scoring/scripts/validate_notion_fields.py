@@ -3,13 +3,19 @@
 Validate all Notion fields for a practice.
 
 Shows which fields are populated and validates their values.
+
+Usage:
+    python validate_notion_fields.py <practice_id> [<practice_id> ...]
+    cat ids.txt | python validate_notion_fields.py   # one ID per line
 """
 
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+import operator
 import sys
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from notion_client import Client
 
 # Load environment
 load_dotenv()
@@ -17,24 +23,124 @@ load_dotenv()
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-def validate_practice_fields(practice_id: str):
-    """Validate all fields for a practice."""
+from _notion import get_notion_client
 
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    notion_database_id = os.getenv("NOTION_DATABASE_ID")
+# Property value getters, one per Notion type
+
+
+def _x_title(p):
+    title = p.get("title")
+    return title[0].get("plain_text") if title else None
+
+
+def _x_rich_text(p):
+    rich_text = p.get("rich_text")
+    return rich_text[0].get("plain_text") if rich_text else None
+
+
+def _x_url(p):
+    return p.get("url")
+
+
+def _x_number(p):
+    return p.get("number")
+
+
+def _x_email(p):
+    return p.get("email")
+
+
+def _x_checkbox(p):
+    return p.get("checkbox")
+
+
+def _x_select(p):
+    select = p.get("select")
+    return select.get("name") if select else None
+
+
+def _x_multi_select(p):
+    return [s.get("name") for s in p.get("multi_select") or []]
+
+
+# Shared by every field of that type
+EXTRACTORS = {
+    "title": _x_title,
+    "rich_text": _x_rich_text,
+    "url": _x_url,
+    "number": _x_number,
+    "email": _x_email,
+    "checkbox": _x_checkbox,
+    "select": _x_select,
+    "multi_select": _x_multi_select,
+}
+
+# Expected fields by feature: (name, type)
+FIELDS_BY_FEATURE = {
+    "FEAT-001 (Google Maps → Notion)": [
+        ("Name", "title"),
+        ("Google Place ID", "rich_text"),
+        ("Website", "url"),
+        ("Google Rating", "number"),
+        ("Google Review Count", "number"),
+    ],
+    "FEAT-002 (Website Enrichment)": [
+        ("Vet Count", "number"),
+        ("Vet Count Confidence", "select"),
+        ("Decision Maker Name", "rich_text"),
+        ("Decision Maker Email", "email"),
+        ("24/7 Emergency Services", "checkbox"),
+        ("Online Booking", "checkbox"),
+        ("Patient Portal", "checkbox"),
+        ("Telemedicine", "checkbox"),
+        ("Specialty Services", "multi_select"),
+        ("Enrichment Status", "select"),
+    ],
+    "FEAT-003 (Lead Scoring)": [
+        ("Lead Score", "number"),
+        ("Priority Tier", "select"),
+        ("Score Breakdown", "rich_text"),
+        ("Confidence Flags", "multi_select"),
+        ("Scoring Status", "select"),
+    ],
+}
 
-    if not notion_api_key or not notion_database_id:
-        print("❌ Missing NOTION_API_KEY or NOTION_DATABASE_ID in .env")
-        return
 
-    client = Client(auth=notion_api_key)
+# Page fetches in flight at once (Notion averages 3 req/s)
+MAX_FETCH_WORKERS = 3
 
-    # Fetch the practice
-    try:
-        page = client.pages.retrieve(page_id=practice_id)
-    except Exception as e:
-        print(f"❌ Failed to fetch practice: {e}")
-        return
+
+def fetch_pages(page_ids, client, workers=MAX_FETCH_WORKERS):
+    """pages.retrieve for each ID concurrently.
+
+    Returns:
+        One entry per ID, in order: the page dict, or the exception raised
+    """
+    def fetch(page_id):
+        try:
+            return client.pages.retrieve(page_id=page_id)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(page_ids))) as executor:
+        return list(executor.map(fetch, page_ids))
+
+
+def _is_populated(value) -> bool:
+    """Whether an extracted value counts as filled in."""
+    if value is None:
+        return False
+    if isinstance(value, list):
+        return len(value) > 0
+    if isinstance(value, bool):
+        return True  # Checkbox can be False but still populated
+    if isinstance(value, (str, int, float)):
+        return value != "" and value != 0
+    return True
+
+
+def validate_practice_fields(practice_id: str, page: dict):
+    """Validate all fields for a practice, given its retrieved page."""
 
     properties = page.get("properties", {})
 
@@ -44,131 +150,91 @@ def validate_practice_fields(practice_id: str):
     if name_prop.get("title"):
         name = name_prop["title"][0]["plain_text"]
 
-    print("=" * 80)
-    print(f"NOTION FIELD VALIDATION: {name}")
-    print(f"Practice ID: {practice_id}")
-    print("=" * 80)
-    print()
-
-    # Define expected fields by feature
-    fields_by_feature = {
-        "FEAT-001 (Google Maps → Notion)": [
-            ("Name", "title", lambda p: p.get("title", [{}])[0].get("plain_text") if p.get("title") else None),
-            ("Google Place ID", "rich_text", lambda p: p.get("rich_text", [{}])[0].get("plain_text") if p.get("rich_text") else None),
-            ("Website", "url", lambda p: p.get("url")),
-            ("Google Rating", "number", lambda p: p.get("number")),
-            ("Google Review Count", "number", lambda p: p.get("number")),
-        ],
-        "FEAT-002 (Website Enrichment)": [
-            ("Vet Count", "number", lambda p: p.get("number")),
-            ("Vet Count Confidence", "select", lambda p: p.get("select", {}).get("name") if p.get("select") else None),
-            ("Decision Maker Name", "rich_text", lambda p: p.get("rich_text", [{}])[0].get("plain_text") if p.get("rich_text") else None),
-            ("Decision Maker Email", "email", lambda p: p.get("email")),
-            ("24/7 Emergency Services", "checkbox", lambda p: p.get("checkbox")),
-            ("Online Booking", "checkbox", lambda p: p.get("checkbox")),
-            ("Patient Portal", "checkbox", lambda p: p.get("checkbox")),
-            ("Telemedicine", "checkbox", lambda p: p.get("checkbox")),
-            ("Specialty Services", "multi_select", lambda p: [s.get("name") for s in p.get("multi_select", [])] if p.get("multi_select") else []),
-            ("Enrichment Status", "select", lambda p: p.get("select", {}).get("name") if p.get("select") else None),
-        ],
-        "FEAT-003 (Lead Scoring)": [
-            ("Lead Score", "number", lambda p: p.get("number")),
-            ("Priority Tier", "select", lambda p: p.get("select", {}).get("name") if p.get("select") else None),
-            ("Score Breakdown", "rich_text", lambda p: p.get("rich_text", [{}])[0].get("plain_text") if p.get("rich_text") else None),
-            ("Confidence Flags", "multi_select", lambda p: [s.get("name") for s in p.get("multi_select", [])] if p.get("multi_select") else []),
-            ("Scoring Status", "select", lambda p: p.get("select", {}).get("name") if p.get("select") else None),
-        ]
-    }
+    # The report is buffered and written in one go once it is complete
+    lines = []
+    out = lines.append
 
-    # Validate each feature's fields
-    for feature, fields in fields_by_feature.items():
-        print(f"{'─' * 80}")
-        print(f"{feature}")
-        print(f"{'─' * 80}")
+    out("=" * 80)
+    out(f"NOTION FIELD VALIDATION: {name}")
+    out(f"Practice ID: {practice_id}")
+    out("=" * 80)
+    out("")
 
-        feature_populated = 0
-        feature_total = len(fields)
+    # Extract every field once: (feature, field_name, value, error)
+    results = []
+    for feature, fields in FIELDS_BY_FEATURE.items():
+        for field_name, field_type in fields:
+            try:
+                value = EXTRACTORS[field_type](properties.get(field_name, {}))
+            except Exception as e:
+                results.append((feature, field_name, None, e))
+            else:
+                results.append((feature, field_name, value, None))
 
-        for field_name, field_type, extractor in fields:
-            prop = properties.get(field_name, {})
+    # Validate each feature's fields
+    populated_fields = 0
+    for feature, feature_results in itertools.groupby(results, key=operator.itemgetter(0)):
+        feature_results = list(feature_results)
+        out(f"{'─' * 80}")
+        out(f"{feature}")
+        out(f"{'─' * 80}")
 
-            try:
-                value = extractor(prop)
-
-                # Check if populated
-                is_populated = False
-                if value is not None:
-                    if isinstance(value, list):
-                        is_populated = len(value) > 0
-                    elif isinstance(value, bool):
-                        is_populated = True  # Checkbox can be False but still populated
-                    elif isinstance(value, (str, int, float)):
-                        is_populated = value != "" and value != 0
-                    else:
-                        is_populated = True
-
-                if is_populated:
-                    feature_populated += 1
-
-                    # Format value for display
-                    if isinstance(value, list):
-                        display_value = f"[{', '.join(str(v) for v in value)}]" if value else "[]"
-                    elif isinstance(value, bool):
-                        display_value = "✓" if value else "✗"
-                    elif value is None:
-                        display_value = "None"
-                    else:
-                        display_value = str(value)
-
-                    # Truncate long values
-                    if len(display_value) > 60:
-                        display_value = display_value[:57] + "..."
-
-                    print(f"  ✅ {field_name:30} = {display_value}")
+        feature_populated = 0
+        feature_total = len(feature_results)
+
+        for _, field_name, value, error in feature_results:
+            if error is not None:
+                out(f"  ⚠️  {field_name:30} = ERROR: {error}")
+            elif _is_populated(value):
+                feature_populated += 1
+
+                # Format value for display
+                if isinstance(value, list):
+                    display_value = f"[{', '.join(str(v) for v in value)}]" if value else "[]"
+                elif isinstance(value, bool):
+                    display_value = "✓" if value else "✗"
                 else:
-                    print(f"  ❌ {field_name:30} = (empty)")
+                    display_value = str(value)
 
-            except Exception as e:
-                print(f"  ⚠️  {field_name:30} = ERROR: {e}")
+                # Truncate long values
+                if len(display_value) > 60:
+                    display_value = display_value[:57] + "..."
+
+                out(f"  ✅ {field_name:30} = {display_value}")
+            else:
+                out(f"  ❌ {field_name:30} = (empty)")
 
-        print()
-        print(f"  Summary: {feature_populated}/{feature_total} fields populated ({feature_populated/feature_total*100:.0f}%)")
-        print()
+        populated_fields += feature_populated
+        out("")
+        out(f"  Summary: {feature_populated}/{feature_total} fields populated ({feature_populated/feature_total*100:.0f}%)")
+        out("")
 
-    print("=" * 80)
+    out("=" * 80)
 
     # Overall summary
-    total_fields = sum(len(fields) for fields in fields_by_feature.values())
-    populated_fields = 0
-    for fields in fields_by_feature.values():
-        for field_name, field_type, extractor in fields:
-            prop = properties.get(field_name, {})
-            try:
-                value = extractor(prop)
-                if value is not None:
-                    if isinstance(value, list):
-                        if len(value) > 0:
-                            populated_fields += 1
-                    elif isinstance(value, bool):
-                        populated_fields += 1
-                    elif isinstance(value, (str, int, float)):
-                        if value != "" and value != 0:
-                            populated_fields += 1
-                    else:
-                        populated_fields += 1
-            except:
-                pass
-
-    print(f"OVERALL: {populated_fields}/{total_fields} fields populated ({populated_fields/total_fields*100:.0f}%)")
-    print("=" * 80)
+    total_fields = len(results)
+    out(f"OVERALL: {populated_fields}/{total_fields} fields populated ({populated_fields/total_fields*100:.0f}%)")
+    out("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python validate_notion_fields.py <practice_id>")
+    practice_ids = sys.argv[1:]
+    if not practice_ids and not sys.stdin.isatty():
+        practice_ids = [line.strip() for line in sys.stdin if line.strip()]
+    if not practice_ids:
+        print("Usage: python validate_notion_fields.py <practice_id> [<practice_id> ...]")
         print("\nExample:")
         print("  python validate_notion_fields.py 2a1edda2-a9a0-8100-8091-ecaf3ad75d8f")
         sys.exit(1)
 
-    practice_id = sys.argv[1]
-    validate_practice_fields(practice_id)
+    if not os.getenv("NOTION_API_KEY") or not os.getenv("NOTION_DATABASE_ID"):
+        print("❌ Missing NOTION_API_KEY or NOTION_DATABASE_ID in .env")
+        sys.exit(1)
+
+    pages = fetch_pages(practice_ids, get_notion_client())
+    for practice_id, page in zip(practice_ids, pages):
+        if isinstance(page, Exception):
+            print(f"❌ Failed to fetch practice {practice_id}: {page}")
+        else:
+            validate_practice_fields(practice_id, page)
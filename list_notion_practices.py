@@ -3,16 +3,20 @@
 Helper script to list practices from Notion database.
 
 Usage:
-    python3 list_notion_practices.py [--limit 20]
+    python3 list_notion_practices.py [--limit 20]   # any limit; pages of 100 are fetched as needed
 
 This will show you Notion page IDs that you can use with score_leads.py
+Property IDs come from the schema cache shared with the pipeline
+(src.integrations.notion_schema), so the query can ask Notion for just the
+listed fields without a schema fetch.
 """
 
+import itertools
 import os
 import sys
 from pathlib import Path
+from urllib.parse import unquote
 from dotenv import load_dotenv
-from notion_client import Client
 
 # Load environment
 load_dotenv()
@@ -20,6 +24,81 @@ load_dotenv()
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.integrations.notion_schema import SCHEMA_CACHE_TTL, load_cached_schema, save_cached_schema
+from src.integrations.notion_schema_daemon import fetch_schema_via_daemon
+from src.utils.fast_json import FastJSONClient
+
+# The only properties printed per practice
+LISTED_PROPERTIES = (
+    "Name",
+    "Website",
+    "Vet Count",
+    "Rating",
+    "Review Count",
+    "Lead Score",
+    "Enrichment Status",
+)
+
+# key -> (property, value key, default, format) for each printed field.
+# A missing property or a null value shows the default.
+PROPERTY_FIELDS = (
+    ("name", "Name", "title", "Unknown",
+     lambda title: title[0].get("plain_text", "Unknown") if title else "Unknown"),
+    ("website", "Website", "url", "No website", lambda url: url or "No website"),
+    ("vet_count", "Vet Count", "number", "?", str),
+    ("rating", "Rating", "number", "?", lambda r: f"{r:.1f}"),
+    ("reviews", "Review Count", "number", "?", str),
+    ("lead_score", "Lead Score", "number", "Not scored", lambda ls: f"{ls}/120"),
+    ("enrichment_status", "Enrichment Status", "select", "?",
+     lambda status: status.get("name", "?")),
+)
+
+def get_property_ids(client, database_id):
+    """Property name -> ID for the database, from the shared schema cache.
+
+    IDs come back URL-encoded; httpx encodes query params itself, so they are
+    returned decoded.
+    """
+    database = load_cached_schema(database_id, SCHEMA_CACHE_TTL)
+    if database is None:
+        database = fetch_schema_via_daemon(database_id) or client.databases.retrieve(database_id=database_id)
+        save_cached_schema(database_id, database)
+    return {name: unquote(prop["id"]) for name, prop in database["properties"].items()}
+
+
+def iter_pages(client, database_id, limit, filter_properties=None):
+    """Yield up to limit pages, following Notion's 100-per-request cursor.
+
+    Pages are yielded as each response arrives, so callers can print the
+    first batch before the next one is requested.
+    """
+    remaining = limit
+    cursor = None
+    while remaining > 0:
+        query_params = {"database_id": database_id, "page_size": min(remaining, 100)}
+        if filter_properties:
+            query_params["filter_properties"] = filter_properties
+        if cursor:
+            query_params["start_cursor"] = cursor
+        response = client.databases.query(**query_params)
+
+        results = response.get("results", [])[:remaining]
+        yield from results
+        remaining -= len(results)
+        if not response.get("has_more"):
+            return
+        cursor = response["next_cursor"]
+
+
+def extract_fields(props):
+    """Display strings for PROPERTY_FIELDS from one page's properties."""
+    values = {}
+    for key, prop_name, kind, default, fmt in PROPERTY_FIELDS:
+        value = props.get(prop_name, {}).get(kind)
+        values[key] = default if value is None else fmt(value)
+    return values
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='List practices from Notion database')
@@ -35,86 +114,45 @@ def main():
         sys.exit(1)
 
     print(f"Connecting to Notion database {database_id[:8]}...")
-    client = Client(auth=api_key)
+    client = FastJSONClient(auth=api_key)
 
     # Query database
     try:
-        response = client.databases.query(
-            database_id=database_id,
-            page_size=min(args.limit, 100)
-        )
-
-        practices = response.get("results", [])
-
-        if not practices:
+        # Only the listed properties; ones missing from the database are
+        # skipped (the page would not have them either)
+        ids = get_property_ids(client, database_id)
+        filter_ids = [ids[name] for name in LISTED_PROPERTIES if name in ids]
+        practices = iter_pages(client, database_id, args.limit, filter_ids)
+
+        first = next(practices, None)
+        if first is None:
             print("\n⚠️  No practices found in database")
             print("   Run the Google Maps scraper first: python main.py --test")
             return
 
-        print(f"\nFound {len(practices)} practices:\n")
+        print(f"\nPractices (up to {args.limit}):\n")
         print("=" * 100)
 
-        for i, page in enumerate(practices, 1):
+        count = 0
+        for count, page in enumerate(itertools.chain([first], practices), 1):
             props = page["properties"]
             page_id = page["id"]
 
-            # Extract fields
-            name = "Unknown"
-            if "Name" in props:
-                title = props["Name"].get("title", [])
-                if title:
-                    name = title[0].get("plain_text", "Unknown")
-
-            website = "No website"
-            if "Website" in props:
-                url = props["Website"].get("url")
-                if url:
-                    website = url
-
-            vet_count = "?"
-            if "Vet Count" in props:
-                count = props["Vet Count"].get("number")
-                if count is not None:
-                    vet_count = str(count)
-
-            rating = "?"
-            if "Rating" in props:
-                r = props["Rating"].get("number")
-                if r is not None:
-                    rating = f"{r:.1f}"
-
-            reviews = "?"
-            if "Review Count" in props:
-                rv = props["Review Count"].get("number")
-                if rv is not None:
-                    reviews = str(rv)
-
-            lead_score = "Not scored"
-            if "Lead Score" in props:
-                ls = props["Lead Score"].get("number")
-                if ls is not None:
-                    lead_score = f"{ls}/120"
-
-            enrichment_status = "?"
-            if "Enrichment Status" in props:
-                status = props["Enrichment Status"].get("select")
-                if status:
-                    enrichment_status = status.get("name", "?")
-
-            print(f"{i}. {name}")
+            v = extract_fields(props)
+
+            print(f"{count}. {v['name']}")
             print(f"   Page ID: {page_id}")
-            print(f"   Vets: {vet_count} | Rating: {rating}★ | Reviews: {reviews}")
-            print(f"   Enrichment: {enrichment_status} | Lead Score: {lead_score}")
-            print(f"   Website: {website}")
+            print(f"   Vets: {v['vet_count']} | Rating: {v['rating']}★ | Reviews: {v['reviews']}")
+            print(f"   Enrichment: {v['enrichment_status']} | Lead Score: {v['lead_score']}")
+            print(f"   Website: {v['website']}")
             print()
 
         print("=" * 100)
+        print(f"\nListed {count} practices")
         print(f"\nTo score a practice, use:")
         print(f"  python3 score_leads.py --practice-id <PAGE_ID>")
         print(f"\nExample:")
-        if practices:
-            first_id = practices[0]["id"]
-            print(f"  python3 score_leads.py --practice-id {first_id}")
+        print(f"  python3 score_leads.py --practice-id {first['id']}")
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
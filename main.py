@@ -9,6 +9,8 @@ Usage:
     python main.py                  # Full run (150 practices)
     python main.py --test           # Test mode (10 practices)
     python main.py --max-results 50 # Custom result limit
+    python main.py --cache-scrape   # Reuse an identical scrape from the last 24h
+    python main.py --ledger         # Skip practices unchanged since the last run
 
 References:
 - AC-FEAT-001-007: Test mode execution
@@ -17,38 +19,81 @@ References:
 - AC-FEAT-001-023: Structured logging
 """
 
+import functools
+import hashlib
+import json
 import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-
-import click
-from dotenv import load_dotenv
-
-# Load environment variables before importing config
-load_dotenv()
+from typing import TYPE_CHECKING, Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.config.config import VetScrapingConfig
-from src.utils.logging import setup_logging
-from src.scrapers.apify_client import ApifyClient
-from src.processing.data_filter import DataFilter
-from src.processing.initial_scorer import InitialScorer
-from src.integrations.notion_batch import NotionBatchUpserter
-from src.integrations.notion_schema import validate_notion_database, NotionSchemaError
+# Pipeline modules (config, Apify, Notion, ...) are imported where they are
+# used, so --help and argument errors don't pay for pydantic/httpx/notion_client
+if TYPE_CHECKING:
+    from src.config.config import VetScrapingConfig
 
 logger = logging.getLogger(__name__)
 
+# Raw Apify results from earlier runs, keyed by the scrape parameters
+SCRAPE_CACHE_DIR = Path(__file__).parent / ".cache" / "apify"
+SCRAPE_CACHE_TTL = 24 * 3600  # seconds
+
+# SQLite record of uploaded practices, used to skip unchanged ones on rerun
+LEDGER_PATH = Path(__file__).parent / ".cache" / "ledger.db"
+
 
 class PipelineError(Exception):
     """Raised when pipeline encounters unrecoverable error."""
     pass
 
 
-def validate_environment(config: VetScrapingConfig) -> None:
+def _scrape_cache_path(search_queries: list, max_results: int, location_query: str) -> Path:
+    """Cache file for one set of Apify scrape parameters."""
+    key = hashlib.sha256(
+        json.dumps([search_queries, max_results, location_query]).encode()
+    ).hexdigest()
+    return SCRAPE_CACHE_DIR / f"{key}.json"
+
+
+def _run_apify_scrape(
+    apify_client,
+    search_queries: list,
+    max_results: int,
+    location_query: str,
+    timeout: int
+) -> list:
+    """Run the Google Maps actor, wait for it, and return the raw dataset items."""
+    run_id = apify_client.run_google_maps_scraper(
+        search_queries=search_queries,
+        max_results=max_results,
+        location_query=location_query
+    )
+
+    logger.info(f"Apify actor started: run_id={run_id}")
+
+    # Wait for results with timeout
+    dataset_id = apify_client.wait_for_results(run_id=run_id, timeout=timeout)
+    return apify_client.fetch_items(dataset_id)
+
+
+def _load_cached_scrape(path: Path) -> Optional[list]:
+    """Raw Apify items from path if younger than SCRAPE_CACHE_TTL."""
+    from src.utils.fast_json import json_loads
+
+    try:
+        if time.time() - path.stat().st_mtime >= SCRAPE_CACHE_TTL:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def validate_environment(config: "VetScrapingConfig", force_schema_check: bool = False) -> None:
     """Validate environment and configuration before pipeline run.
 
     AC-FEAT-001-018: Missing environment variables.
@@ -56,10 +101,18 @@ def validate_environment(config: VetScrapingConfig) -> None:
 
     Args:
         config: Application configuration
+        force_schema_check: Fetch the Notion schema even if a validated copy
+            from the last SCHEMA_CACHE_TTL seconds is cached on disk
 
     Raises:
         PipelineError: If validation fails
     """
+    from src.integrations.notion_schema import (
+        SCHEMA_CACHE_TTL,
+        NotionSchemaError,
+        validate_notion_database,
+    )
+
     logger.info("Validating environment configuration...")
 
     # Validate API keys are set
@@ -78,7 +131,8 @@ def validate_environment(config: VetScrapingConfig) -> None:
         logger.info(f"Validating Notion database schema: {config.notion.database_id}")
         validate_notion_database(
             database_id=config.notion.database_id,
-            api_key=config.notion.api_key
+            api_key=config.notion.api_key,
+            cache_ttl=None if force_schema_check else SCHEMA_CACHE_TTL
         )
         logger.info("✓ Notion database schema validated successfully")
     except NotionSchemaError as e:
@@ -89,10 +143,20 @@ def validate_environment(config: VetScrapingConfig) -> None:
     logger.info("✓ Environment validation complete")
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env into the environment, once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
 def run_pipeline(
-    config: VetScrapingConfig,
+    config: "VetScrapingConfig",
     max_results: int,
-    test_mode: bool = False
+    test_mode: bool = False,
+    cache_scrape: bool = False,
+    use_ledger: bool = False
 ) -> dict:
     """Execute the complete Google Maps → Notion pipeline.
 
@@ -106,6 +170,14 @@ def run_pipeline(
         config: Application configuration
         max_results: Maximum practices to scrape
         test_mode: If True, enable test mode (10 practices, DEBUG logging)
+        cache_scrape: If True, reuse raw Apify results from a run with the
+            same parameters in the last SCRAPE_CACHE_TTL seconds (and save
+            fresh ones)
+        use_ledger: If True, skip Stages 2-4 for practices whose scraped data
+            is unchanged since their last upload (per the ledger at
+            LEDGER_PATH) and whose recorded page still exists in Notion, and
+            record successful uploads there. Skipped practices don't get
+            their "Last Scraped Date" refreshed.
 
     Returns:
         Dict with pipeline statistics:
@@ -113,6 +185,7 @@ def run_pipeline(
         - filtered: Number after filtering
         - uploaded: Number created in Notion
         - skipped: Number skipped (already exist)
+        - unchanged: Number skipped as unchanged since the last upload
         - failed: Number failed to upload
         - duration_seconds: Total execution time
         - cost_estimate: Estimated cost in USD
@@ -120,6 +193,12 @@ def run_pipeline(
     Raises:
         PipelineError: If pipeline fails unrecoverably
     """
+    from src.scrapers.apify_client import ApifyClient
+    from src.processing.data_filter import DataFilter
+    from src.processing.initial_scorer import InitialScorer
+    from src.integrations.notion_batch import NotionBatchUpserter
+    from src.state.ledger import Ledger, practice_hash
+
     start_time = time.time()
 
     # Apply test mode settings
@@ -137,29 +216,62 @@ def run_pipeline(
     logger.info("STAGE 1: Scraping Google Maps via Apify")
     logger.info("=" * 60)
 
+    # Stage 4's client is built up front so a Notion configuration error
+    # stops the run before an Apify run is started (and billed)
+    try:
+        upserter = NotionBatchUpserter(
+            api_key=config.notion.api_key,
+            database_id=config.notion.database_id,
+            batch_size=config.notion.batch_size,
+            rate_limit_delay=config.notion.rate_limit_delay,
+            max_concurrent_upserts=config.notion.max_concurrent_updates
+        )
+    except Exception as e:
+        logger.error(f"Notion setup failed: {e}", exc_info=True)
+        raise PipelineError(f"Notion setup failed: {e}") from e
+
     try:
         apify_client = ApifyClient(
             api_key=config.apify.api_key,
             actor_id=config.apify.actor_id
         )
 
-        # Run actor and get results
-        run_id = apify_client.run_google_maps_scraper(
-            search_queries=["veterinary clinic in Massachusetts"],
-            max_results=max_results,
-            location_query="Massachusetts, USA"
-        )
-
-        logger.info(f"Apify actor started: run_id={run_id}")
-
-        # Wait for results with timeout
-        raw_practices = apify_client.wait_for_results(
-            run_id=run_id,
-            timeout=config.apify.timeout_seconds
-        )
+        search_queries = ["veterinary clinic in Massachusetts"]
+        location_query = "Massachusetts, USA"
+        cache_path = _scrape_cache_path(search_queries, max_results, location_query)
+        items = _load_cached_scrape(cache_path) if cache_scrape else None
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            scrape = None
+            if items is not None:
+                logger.info(f"[cache hit] skipped Apify call, using {cache_path.name[:12]}...")
+            else:
+                scrape = executor.submit(
+                    _run_apify_scrape,
+                    apify_client,
+                    search_queries,
+                    max_results,
+                    location_query,
+                    config.apify.timeout_seconds
+                )
+
+            # While Apify runs, load the existing practices Stage 4
+            # de-duplicates against. Not fatal: upsert_batch() queries again,
+            # so report it now rather than as a scraping failure
+            try:
+                existing_pages = upserter.prefetch_existing_practices()
+            except Exception as e:
+                logger.error(f"Prefetching existing Notion practices failed: {e}", exc_info=True)
+                existing_pages = {}
+
+            if scrape is not None:
+                items = scrape.result()
+                if cache_scrape:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(json.dumps(items))
 
         # Parse and validate results
-        practices = apify_client.parse_results(raw_practices)
+        practices = apify_client.parse_items(items)
 
         logger.info(f"✓ Scraped {len(practices)} practices from Google Maps")
 
@@ -175,61 +287,86 @@ def run_pipeline(
             "filtered": 0,
             "uploaded": 0,
             "skipped": 0,
+            "unchanged": 0,
             "failed": 0,
             "duration_seconds": time.time() - start_time,
             "cost_estimate": 0.0
         }
 
-    # ===== Stage 2: Apply Hard Filters =====
+    # Practices uploaded before with identical scraped data need no re-work,
+    # as long as the page the ledger recorded still exists in Notion
+    hashes = {}
+    unchanged = 0
+    if use_ledger:
+        hashes = {p.place_id: practice_hash(p) for p in practices}
+        with Ledger(LEDGER_PATH) as ledger:
+            known = ledger.lookup(hashes)
+        live_page_ids = set(existing_pages.values())
+        changed = []
+        for p in practices:
+            h, notion_id = known.get(p.place_id, (None, None))
+            if h != hashes[p.place_id] or notion_id not in live_page_ids:
+                changed.append(p)
+        unchanged = len(practices) - len(changed)
+        if unchanged:
+            logger.info(f"Ledger: skipping {unchanged} practices unchanged since last upload")
+        if not changed:
+            logger.info("No new or changed practices to process")
+            return {
+                "scraped": len(practices),
+                "filtered": 0,
+                "uploaded": 0,
+                "skipped": 0,
+                "unchanged": unchanged,
+                "failed": 0,
+                "duration_seconds": time.time() - start_time,
+                "cost_estimate": len(practices) * 0.005  # $0.005 per practice
+            }
+    else:
+        changed = practices
+
+    # ===== Stages 2-3: Apply Hard Filters and Calculate Initial Scores =====
+    # One lazy pass: each practice is filtered and scored as it goes by,
+    # without an intermediate list of filtered practices
     logger.info("\n" + "=" * 60)
-    logger.info("STAGE 2: Applying Hard Filters")
+    logger.info("STAGES 2-3: Applying Hard Filters and Calculating Initial ICP Fit Scores")
     logger.info("=" * 60)
 
     try:
         data_filter = DataFilter()
+        scorer = InitialScorer()
 
-        filtered_practices = data_filter.apply_all_filters(practices, min_reviews=10)
+        tier_counts = {"Hot": 0, "Warm": 0, "Cold": 0}
+        scored_practices = []
+        for practice in scorer.iter_scored(data_filter.iter_filtered(changed, min_reviews=10)):
+            tier_counts[practice.priority_tier] += 1
+            scored_practices.append(practice)
 
-        logger.info(f"✓ Filtered to {len(filtered_practices)} qualifying practices")
-        logger.info(f"  Filter pass rate: {len(filtered_practices)/len(practices)*100:.1f}%")
+        logger.info(f"✓ Filtered to {len(scored_practices)} qualifying practices")
+        logger.info(f"  Filter pass rate: {len(scored_practices)/len(changed)*100:.1f}%")
 
     except Exception as e:
-        logger.error(f"Stage 2 failed: {e}", exc_info=True)
-        raise PipelineError(f"Filtering failed: {e}") from e
+        logger.error(f"Stages 2-3 failed: {e}", exc_info=True)
+        raise PipelineError(f"Filtering/scoring failed: {e}") from e
 
-    if not filtered_practices:
+    if not scored_practices:
         logger.warning("No practices passed filters")
         return {
             "scraped": len(practices),
             "filtered": 0,
             "uploaded": 0,
             "skipped": 0,
+            "unchanged": unchanged,
             "failed": 0,
             "duration_seconds": time.time() - start_time,
             "cost_estimate": len(practices) * 0.005  # $0.005 per practice
         }
 
-    # ===== Stage 3: Calculate Initial Scores =====
-    logger.info("\n" + "=" * 60)
-    logger.info("STAGE 3: Calculating Initial ICP Fit Scores")
-    logger.info("=" * 60)
-
-    try:
-        scorer = InitialScorer()
-
-        scored_practices = scorer.score_batch(filtered_practices)
-
-        # Calculate score distribution
-        hot = sum(1 for p in scored_practices if p.priority_tier == "Hot")
-        warm = sum(1 for p in scored_practices if p.priority_tier == "Warm")
-        cold = sum(1 for p in scored_practices if p.priority_tier == "Cold")
-
-        logger.info(f"✓ Scored {len(scored_practices)} practices")
-        logger.info(f"  Score distribution: {hot} Hot, {warm} Warm, {cold} Cold")
-
-    except Exception as e:
-        logger.error(f"Stage 3 failed: {e}", exc_info=True)
-        raise PipelineError(f"Scoring failed: {e}") from e
+    logger.info(f"✓ Scored {len(scored_practices)} practices")
+    logger.info(
+        f"  Score distribution: {tier_counts['Hot']} Hot, "
+        f"{tier_counts['Warm']} Warm, {tier_counts['Cold']} Cold"
+    )
 
     # ===== Stage 4: Batch Upload to Notion =====
     logger.info("\n" + "=" * 60)
@@ -237,13 +374,6 @@ def run_pipeline(
     logger.info("=" * 60)
 
     try:
-        upserter = NotionBatchUpserter(
-            api_key=config.notion.api_key,
-            database_id=config.notion.database_id,
-            batch_size=config.notion.batch_size,
-            rate_limit_delay=config.notion.rate_limit_delay
-        )
-
         upload_result = upserter.upsert_batch(scored_practices)
 
         logger.info(f"✓ Upload complete:")
@@ -256,6 +386,14 @@ def run_pipeline(
             for error in upload_result['errors'][:5]:  # Show first 5 errors
                 logger.warning(f"    - {error['place_id']}: {error['error']}")
 
+        if use_ledger and upload_result.get('page_ids'):
+            scores = {p.place_id: p.initial_score for p in scored_practices}
+            with Ledger(LEDGER_PATH) as ledger:
+                ledger.record(
+                    (place_id, hashes[place_id], scores[place_id], page_id)
+                    for place_id, page_id in upload_result['page_ids'].items()
+                )
+
     except Exception as e:
         logger.error(f"Stage 4 failed: {e}", exc_info=True)
         raise PipelineError(f"Notion upload failed: {e}") from e
@@ -270,9 +408,11 @@ def run_pipeline(
     logger.info(f"Duration: {duration:.1f}s")
     logger.info(f"Estimated cost: ${cost_estimate:.2f}")
     logger.info(f"Scraped: {len(practices)}")
-    logger.info(f"Filtered: {len(filtered_practices)}")
+    logger.info(f"Filtered: {len(scored_practices)}")
     logger.info(f"Uploaded: {upload_result['created']}")
     logger.info(f"Updated: {upload_result.get('updated', 0)}")
+    if use_ledger:
+        logger.info(f"Unchanged: {unchanged}")
     logger.info(f"Failed: {upload_result['failed']}")
 
     # AC-FEAT-001-019: Performance validation (<8 minutes)
@@ -285,34 +425,24 @@ def run_pipeline(
 
     return {
         "scraped": len(practices),
-        "filtered": len(filtered_practices),
+        "filtered": len(scored_practices),
         "uploaded": upload_result['created'],
         "updated": upload_result.get('updated', 0),
+        "unchanged": unchanged,
         "failed": upload_result['failed'],
         "duration_seconds": duration,
         "cost_estimate": cost_estimate
     }
 
 
-@click.command()
-@click.option(
-    '--test',
-    is_flag=True,
-    help='Run in test mode (10 practices, DEBUG logging)'
-)
-@click.option(
-    '--max-results',
-    type=int,
-    default=150,
-    help='Maximum practices to scrape (default: 150)'
-)
-@click.option(
-    '--log-level',
-    type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR'], case_sensitive=False),
-    default='INFO',
-    help='Logging level (default: INFO)'
-)
-def main(test: bool, max_results: int, log_level: str):
+def main(
+    test: bool = False,
+    max_results: int = 150,
+    log_level: str = 'INFO',
+    force_schema_check: bool = False,
+    cache_scrape: Optional[bool] = None,
+    ledger: bool = False
+):
     """FEAT-001: Google Maps → Notion Pipeline.
 
     Scrapes veterinary practices from Google Maps, applies filters,
@@ -330,11 +460,17 @@ def main(test: bool, max_results: int, log_level: str):
         python main.py --max-results 50
 
     """
+    from src.config.config import get_config
+    from src.utils.logging import setup_logging
+
+    # Load environment variables before building the config
+    _load_env()
+
     exit_code = 0
 
     try:
-        # Load configuration from environment
-        config = VetScrapingConfig()
+        # Load configuration from environment (built once per process)
+        config = get_config()
 
         # Override log level if specified
         if log_level:
@@ -355,14 +491,18 @@ def main(test: bool, max_results: int, log_level: str):
         logger.info(f"Max results: {max_results if not test else 10}")
         logger.info("=" * 60)
 
-        # Validate environment before running pipeline
-        validate_environment(config)
+        # Validate environment before running pipeline. Kept ahead of the
+        # scrape rather than overlapped with it: an Apify run can't be
+        # cancelled once started, and the check is usually a cache hit
+        validate_environment(config, force_schema_check=force_schema_check)
 
         # Run the pipeline
         result = run_pipeline(
             config=config,
             max_results=max_results,
-            test_mode=test
+            test_mode=test,
+            cache_scrape=test if cache_scrape is None else cache_scrape,
+            use_ledger=ledger
         )
 
         # Exit with success if no critical failures
@@ -396,5 +536,53 @@ def main(test: bool, max_results: int, log_level: str):
     sys.exit(exit_code)
 
 
+def _cli():
+    """Build the click command around main().
+
+    Only done when run as a script, so importing this module (e.g. for
+    run_pipeline) doesn't import click or build the parser.
+    """
+    import click
+
+    @click.command()
+    @click.option(
+        '--test',
+        is_flag=True,
+        help='Run in test mode (10 practices, DEBUG logging)'
+    )
+    @click.option(
+        '--max-results',
+        type=int,
+        default=150,
+        help='Maximum practices to scrape (default: 150)'
+    )
+    @click.option(
+        '--log-level',
+        type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR'], case_sensitive=False),
+        default='INFO',
+        help='Logging level (default: INFO)'
+    )
+    @click.option(
+        '--force-schema-check',
+        is_flag=True,
+        help='Fetch the Notion schema instead of using the copy validated in the last 24h'
+    )
+    @click.option(
+        '--cache-scrape/--no-cache-scrape',
+        default=None,
+        help='Reuse Apify results from an identical scrape in the last 24h (default: on with --test)'
+    )
+    @click.option(
+        '--ledger/--no-ledger',
+        default=False,
+        help='Skip practices unchanged since their last upload (default: off)'
+    )
+    @functools.wraps(main)
+    def cli(**kwargs):
+        main(**kwargs)
+
+    return cli
+
+
 if __name__ == '__main__':
-    main()
+    _cli()()
@@ -56,6 +56,7 @@ class NotionConfig(BaseSettings):
     database_id: str = Field(..., alias='NOTION_DATABASE_ID', min_length=32, max_length=32)
     batch_size: int = Field(default=10)
     rate_limit_delay: float = Field(default=0.35)
+    max_concurrent_updates: int = Field(default=3)  # In-flight page updates (Notion averages 3 req/s)
     update_existing: bool = Field(default=True)
 
     @field_validator('api_key')
@@ -8,7 +8,7 @@ Pipeline Flow:
 1. Query Notion for practices needing enrichment
 2. Scrape websites (5 concurrent, multi-page)
 3. Extract data with OpenAI (sequential, with budget checks)
-4. Update Notion with enrichment data
+4. Update Notion with enrichment data (bounded concurrent updates)
 5. Retry failed practices once
 6. Trigger scoring (optional FEAT-003 integration)
 
@@ -87,7 +87,8 @@ class EnrichmentOrchestrator:
         self.notion_client = NotionEnrichmentClient(
             api_key=config.notion.api_key,
             database_id=config.notion.database_id,
-            rate_limit_delay=config.notion.rate_limit_delay
+            rate_limit_delay=config.notion.rate_limit_delay,
+            max_concurrent_updates=config.notion.max_concurrent_updates
         )
 
         # Optional scoring callback
@@ -374,28 +375,24 @@ class EnrichmentOrchestrator:
             Updated list of EnrichmentResult objects (status may change to notion_failed)
         """
         start_time = time.time()
-        updated_results = []
 
-        for result in extraction_results:
-            # Skip if extraction failed
-            if result.status != "success":
-                updated_results.append(result)
-                continue
-
-            # Update Notion
-            success = self.notion_client.update_practice_enrichment(
-                page_id=result.practice_id,
-                extraction=result.extraction
-            )
+        # Only successful extractions are written; updates run concurrently
+        updates = [
+            (result.practice_id, result.extraction)
+            for result in extraction_results
+            if result.status == "success"
+        ]
+        outcomes = await asyncio.to_thread(
+            self.notion_client.update_practices_enrichment, updates
+        )
 
-            if success:
-                # Notion update successful - keep status as success
-                updated_results.append(result)
-            else:
+        updated_results = []
+        for result in extraction_results:
+            if result.status == "success" and not outcomes.get(result.practice_id, False):
                 # Notion update failed - change status
                 result.status = "notion_failed"
                 result.error_message = "Notion API update failed"
-                updated_results.append(result)
+            updated_results.append(result)
 
         elapsed = time.time() - start_time
         successful = sum(1 for r in updated_results if r.status == "success")
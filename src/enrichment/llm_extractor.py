@@ -11,6 +11,8 @@ Features:
 - Budget enforcement with hard abort at $1.00
 - Text truncation for cost control (8000 chars ~= 2000 tokens)
 - Temperature=0.1 for deterministic extraction
+- Identical prompts (e.g. multi-location practices sharing one website) are
+  extracted once per run via an xxh3 content-hash cache
 
 Usage:
     extractor = LLMExtractor(cost_tracker=tracker, config=openai_config)
@@ -22,9 +24,11 @@ Usage:
 """
 
 import asyncio
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional
 from pathlib import Path
 
+import xxhash
 from openai import AsyncOpenAI
 from pydantic import ValidationError
 
@@ -35,6 +39,11 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Whitespace runs and blank lines carry no extractable data but count against
+# the character budget and input tokens
+_SPACES_RE = re.compile(r"[ \t]+")
+_NEWLINES_RE = re.compile(r"\s*\n\s*")
+
 
 class LLMExtractor:
     """Extract structured data from website content using OpenAI.
@@ -47,6 +56,8 @@ class LLMExtractor:
         config: OpenAI configuration (model, temperature, etc.)
         client: Async OpenAI client
         extraction_prompt: System prompt for data extraction
+        extraction_cache: Successful extractions keyed by xxh3 hash of the
+            user message, so repeated content skips tokenization and the API
     """
 
     # Text truncation limit (8000 chars ~= 2000 tokens for cost control)
@@ -85,6 +96,8 @@ class LLMExtractor:
         # Initialize async OpenAI client
         self.client = AsyncOpenAI(api_key=config.api_key)
 
+        self.extraction_cache: Dict[int, VetPracticeExtraction] = {}
+
         logger.info(
             f"LLMExtractor initialized: model={config.model}, "
             f"temp={config.temperature}, budget=${cost_tracker.budget_limit:.2f}"
@@ -143,9 +156,10 @@ class LLMExtractor:
             "homepage": 5
         }
 
-        sorted_pages = sorted(
-            pages,
-            key=lambda p: page_priority.get(self._extract_page_type(p.url), 99)
+        # Classify each URL once; the type drives both the order and the budget
+        typed_pages = sorted(
+            ((self._extract_page_type(page.url), page) for page in pages),
+            key=lambda typed: page_priority.get(typed[0], 99)
         )
 
         # Build text with page-specific character budgets
@@ -160,8 +174,7 @@ class LLMExtractor:
         page_texts = []
         remaining_budget = self.MAX_TEXT_LENGTH
 
-        for page in sorted_pages:
-            page_type = self._extract_page_type(page.url)
+        for page_type, page in typed_pages:
             page_budget = page_budgets.get(page_type, 500)
 
             # Allocate budget proportionally if total exceeds limit
@@ -172,9 +185,10 @@ class LLMExtractor:
                 )
                 break
 
-            # Use allocated budget for this page
+            # Use allocated budget for this page (after collapsing whitespace)
             actual_budget = min(page_budget, remaining_budget)
-            page_content = page.content[:actual_budget]
+            compact_content = _NEWLINES_RE.sub("\n", _SPACES_RE.sub(" ", page.content)).strip()
+            page_content = compact_content[:actual_budget]
 
             page_type_display = page_type.upper()
             page_texts.append(
@@ -226,6 +240,16 @@ class LLMExtractor:
 
         # Build full prompt
         user_message = f"Practice Name: {practice_name}\n\nWebsite Content:\n{website_text}"
+
+        # Same practice + same content already extracted this run - skip
+        # token counting, budget check and the API call
+        content_hash = xxhash.xxh3_64_intdigest(user_message)
+        cached = self.extraction_cache.get(content_hash)
+        if cached is not None:
+            logger.info(f"{practice_name}: Identical content already extracted, reusing result")
+            # Each practice gets its own copy, so callers can't alter each other's results
+            return cached.model_copy(deep=True)
+
         full_prompt = f"{self.extraction_prompt}\n\n{user_message}"
 
         # Count tokens and check budget BEFORE API call
@@ -273,6 +297,8 @@ class LLMExtractor:
                 f"cost=${call_cost:.6f}"
             )
 
+            self.extraction_cache[content_hash] = extraction.model_copy(deep=True)
+
             # Log key extracted data for visibility
             logger.debug(
                 f"  Vet count: {extraction.vet_count_total} ({extraction.vet_count_confidence}), "
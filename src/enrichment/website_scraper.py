@@ -10,6 +10,7 @@ Features:
 - Concurrent practice processing (5 at once)
 - Individual page failure handling (doesn't fail entire practice)
 - Cache support for development iteration
+- Streaming variant that yields pages as they finish (scrape_multi_page_iter)
 
 Usage:
     scraper = WebsiteScraper(cache_enabled=True)
@@ -17,11 +18,14 @@ Usage:
     async with scraper:
         pages = await scraper.scrape_multi_page("https://example-vet.com")
         print(f"Scraped {len(pages)} pages")
+
+        async for page in scraper.scrape_multi_page_iter("https://example-vet.com"):
+            print(f"Scraped {page.url}")
 """
 
 import asyncio
 import time
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, BrowserConfig
 from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
 from crawl4ai.deep_crawling.filters import FilterChain, URLPatternFilter
@@ -46,6 +50,12 @@ class WebsiteScraper:
         max_pages: Maximum pages per practice (default: 5)
         page_timeout: Timeout per page in milliseconds (default: 30000 = 30s)
         url_patterns: URL patterns to match (default: about, team, staff, contact)
+        user_data_dir: Persistent browser profile directory (default: None = fresh
+            profile per run). Keeps cookies and the browser's HTTP cache between runs.
+
+    Cached pages (cache_enabled=True) live in Crawl4AI's SQLite cache under
+    ~/.crawl4ai (override with CRAWL4_AI_BASE_DIRECTORY), which persists
+    across runs.
     """
 
     # Default configuration (validated via spike testing)
@@ -66,7 +76,8 @@ class WebsiteScraper:
         max_depth: int = DEFAULT_MAX_DEPTH,
         max_pages: int = DEFAULT_MAX_PAGES,
         page_timeout: int = DEFAULT_PAGE_TIMEOUT,
-        url_patterns: Optional[List[str]] = None
+        url_patterns: Optional[List[str]] = None,
+        user_data_dir: Optional[str] = None
     ):
         """Initialize website scraper.
 
@@ -76,12 +87,14 @@ class WebsiteScraper:
             max_pages: Maximum pages to scrape per practice
             page_timeout: Timeout per page in milliseconds
             url_patterns: URL patterns to match (default: about, team, staff, contact)
+            user_data_dir: Persistent browser profile directory (None = fresh profile)
         """
         self.cache_enabled = cache_enabled
         self.max_depth = max_depth
         self.max_pages = max_pages
         self.page_timeout = page_timeout
         self.url_patterns = url_patterns or self.DEFAULT_URL_PATTERNS
+        self.user_data_dir = user_data_dir
 
         self._crawler: Optional[AsyncWebCrawler] = None
         self._config: Optional[CrawlerRunConfig] = None
@@ -109,24 +122,15 @@ class WebsiteScraper:
             headless=True,
             user_agent_mode="random",  # Rotate user agents
             viewport_width=1920,
-            viewport_height=1080
-        )
-
-        # Configure URL pattern filter
-        url_filter = URLPatternFilter(patterns=self.url_patterns)
-
-        # Configure BFS deep crawl strategy
-        strategy = BFSDeepCrawlStrategy(
-            max_depth=self.max_depth,
-            include_external=False,  # Stay within same domain
-            max_pages=self.max_pages,
-            filter_chain=FilterChain([url_filter])
+            viewport_height=1080,
+            use_persistent_context=self.user_data_dir is not None,
+            user_data_dir=self.user_data_dir
         )
 
         # Configure crawler with anti-bot and content extraction settings
         # Validated from Crawl4AI docs (Archon source: 21ece81541cd5527)
         self._config = CrawlerRunConfig(
-            deep_crawl_strategy=strategy,
+            deep_crawl_strategy=self._make_strategy(),
             scraping_strategy=LXMLWebScrapingStrategy(),
             cache_mode=CacheMode.ENABLED if self.cache_enabled else CacheMode.BYPASS,
             page_timeout=self.page_timeout,
@@ -150,6 +154,22 @@ class WebsiteScraper:
             f"anti-bot=enabled"
         )
 
+    def _make_strategy(self) -> BFSDeepCrawlStrategy:
+        """Fresh BFS deep crawl strategy for one site.
+
+        The strategy counts pages crawled and never resets the count, so
+        sharing one across sites would stop later crawls at max_pages.
+        """
+        # Configure URL pattern filter
+        url_filter = URLPatternFilter(patterns=self.url_patterns)
+
+        return BFSDeepCrawlStrategy(
+            max_depth=self.max_depth,
+            include_external=False,  # Stay within same domain
+            max_pages=self.max_pages,
+            filter_chain=FilterChain([url_filter])
+        )
+
     async def _teardown(self):
         """Cleanup crawler resources."""
         if self._crawler:
@@ -181,7 +201,8 @@ class WebsiteScraper:
 
         try:
             # Run deep crawl
-            results = await self._crawler.arun(url, config=self._config)
+            config = self._config.clone(deep_crawl_strategy=self._make_strategy())
+            results = await self._crawler.arun(url, config=config)
 
             elapsed = time.time() - start_time
             success_count = sum(1 for r in results if r.success)
@@ -273,6 +294,58 @@ class WebsiteScraper:
             logger.error(f"Failed to scrape {url}: {e}", exc_info=True)
             return []  # Return empty list on total failure
 
+    async def scrape_multi_page_iter(self, url: str) -> AsyncIterator[WebsiteData]:
+        """Scrape a practice website, yielding each page as soon as it is scraped.
+
+        Same crawl as scrape_multi_page(), but callers can start work on the
+        first pages while the rest are still loading. Failed and empty pages
+        are logged and skipped.
+
+        Args:
+            url: Practice website URL (e.g., "https://example-vet.com")
+
+        Yields:
+            WebsiteData for each successfully scraped page, in completion order
+
+        Raises:
+            RuntimeError: If scraper not initialized (use async context manager)
+        """
+        if not self._crawler or not self._config:
+            raise RuntimeError("WebsiteScraper not initialized. Use 'async with scraper:' context.")
+
+        logger.info(f"Starting streaming scrape for {url}")
+        start_time = time.time()
+        scraped = 0
+
+        # Same crawl, but results are yielded as each page completes
+        config = self._config.clone(deep_crawl_strategy=self._make_strategy(), stream=True)
+
+        try:
+            async for result in await self._crawler.arun(url, config=config):
+                if not result.success:
+                    logger.warning(f"  ✗ Failed to scrape {result.url}: {result.error_message}")
+                    continue
+                if not result.cleaned_html:
+                    continue
+
+                try:
+                    page_data = WebsiteData(
+                        url=result.url,
+                        title=result.metadata.get("title"),
+                        content=result.cleaned_html
+                    )
+                except ValueError:
+                    logger.warning(f"  ✗ {result.url} - empty content")
+                    continue
+
+                scraped += 1
+                yield page_data
+
+        except Exception as e:
+            logger.error(f"Failed to scrape {url}: {e}", exc_info=True)
+
+        logger.info(f"Scraped {url}: {scraped} pages in {time.time() - start_time:.1f}s")
+
     async def scrape_batch(self, urls: List[str], concurrency: int = 5) -> dict:
         """Scrape multiple practice websites concurrently.
 
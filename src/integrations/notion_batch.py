@@ -4,6 +4,8 @@ Handles batch uploading of practices to Notion with:
 - Within-batch de-duplication by Place ID
 - Cross-batch de-duplication (skip existing records)
 - Rate limiting (3.5s delay between batches)
+- Optional bounded concurrency for page creates/updates, paced to Notion's
+  3 req/s average
 - Retry logic for 429/5xx errors
 - Partial batch failure handling
 
@@ -18,9 +20,11 @@ References:
 
 import logging
 import time
-from typing import List, Set, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Set, Dict, Any, Tuple
+from urllib.parse import unquote
 
-from notion_client import Client, APIResponseError
+from notion_client import APIResponseError
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -31,6 +35,13 @@ from tenacity import (
 
 from src.models.apify_models import VeterinaryPractice
 from src.integrations.notion_mapper import NotionMapper
+from src.integrations.notion_schema import (
+    SCHEMA_CACHE_TTL,
+    load_cached_schema,
+    save_cached_schema,
+)
+from src.utils.fast_json import FastJSONClient as Client
+from src.utils.rate_limit import NOTION_REQUESTS_PER_SECOND, RequestSpacer
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +117,7 @@ class NotionBatchUpserter:
         database_id: str,
         batch_size: int = 10,
         rate_limit_delay: float = 3.5,
+        max_concurrent_upserts: int = 1,
     ):
         """Initialize NotionBatchUpserter.
 
@@ -114,18 +126,71 @@ class NotionBatchUpserter:
             database_id: Target Notion database ID
             batch_size: Number of records to process per batch (default: 10)
             rate_limit_delay: Seconds to wait between batches (default: 3.5s = 2.86 req/s)
+            max_concurrent_upserts: Page creates/updates in flight at once
+                (default: 1 = serial). Above 1, request starts are spaced to
+                NOTION_REQUESTS_PER_SECOND across all workers.
         """
         self.client = Client(auth=api_key)
         self.database_id = database_id
         self.batch_size = batch_size
         self.rate_limit_delay = rate_limit_delay
+        self.max_concurrent_upserts = max(1, max_concurrent_upserts)
         self.mapper = NotionMapper(database_id=database_id)
+        # Set by prefetch_existing_practices(), consumed by the next upsert_batch()
+        self._existing_practices: Optional[Dict[str, str]] = None
+        # Looked up once by _place_id_property_id()
+        self._place_id_prop_id: Optional[str] = None
+        # Serial calls are paced by their own round-trips (and the delays
+        # below); only overlapping calls need a shared spacer
+        self._spacer = RequestSpacer(
+            1.0 / NOTION_REQUESTS_PER_SECOND if self.max_concurrent_upserts > 1 else 0.0
+        )
 
         logger.info(
             f"NotionBatchUpserter initialized: database={database_id}, "
-            f"batch_size={batch_size}, rate_limit_delay={rate_limit_delay}s"
+            f"batch_size={batch_size}, rate_limit_delay={rate_limit_delay}s, "
+            f"max_concurrent_upserts={self.max_concurrent_upserts}"
         )
 
+    def _place_id_property_id(self) -> Optional[str]:
+        """Notion property ID of "Google Place ID", or None if unavailable.
+
+        Used with filter_properties so de-dup queries return only that
+        property instead of every property of every page. Read from the
+        shared schema cache (written by the startup schema check) when
+        fresh, and remembered for the life of the upserter.
+        """
+        if self._place_id_prop_id is not None:
+            return self._place_id_prop_id
+
+        try:
+            database = load_cached_schema(self.database_id, SCHEMA_CACHE_TTL)
+            if database is None:
+                database = self.client.databases.retrieve(database_id=self.database_id)
+                save_cached_schema(self.database_id, database)
+            # IDs come back URL-encoded; httpx encodes query params itself
+            self._place_id_prop_id = unquote(database["properties"]["Google Place ID"]["id"])
+        except Exception as e:
+            logger.debug("Could not look up Google Place ID property ID: %s", e)
+        return self._place_id_prop_id
+
+    def _iter_database_pages(self) -> Iterator[Dict[str, Any]]:
+        """Yield every page in the database, 100 per query.
+
+        Pages carry only the Google Place ID property when its ID is known.
+        """
+        query_params = {"database_id": self.database_id, "page_size": 100}
+        place_id_prop_id = self._place_id_property_id()
+        if place_id_prop_id:
+            query_params["filter_properties"] = [place_id_prop_id]
+
+        while True:
+            response = self.client.databases.query(**query_params)
+            yield from response.get("results", [])
+            if not response.get("has_more"):
+                return
+            query_params["start_cursor"] = response.get("next_cursor")
+
     def _query_existing_practices_with_page_ids(self) -> Dict[str, str]:
         """Query existing practices and return dict of place_id -> page_id.
 
@@ -137,12 +202,7 @@ class NotionBatchUpserter:
         existing_practices = {}
 
         try:
-            response = self.client.databases.query(
-                database_id=self.database_id,
-                page_size=100
-            )
-
-            for page in response.get("results", []):
+            for page in self._iter_database_pages():
                 properties = page.get("properties", {})
                 place_id_prop = properties.get("Google Place ID", {})
                 rich_text = place_id_prop.get("rich_text", [])
@@ -152,24 +212,6 @@ class NotionBatchUpserter:
                     if place_id:
                         existing_practices[place_id] = page["id"]
 
-            # Handle pagination
-            while response.get("has_more"):
-                response = self.client.databases.query(
-                    database_id=self.database_id,
-                    page_size=100,
-                    start_cursor=response.get("next_cursor")
-                )
-
-                for page in response.get("results", []):
-                    properties = page.get("properties", {})
-                    place_id_prop = properties.get("Google Place ID", {})
-                    rich_text = place_id_prop.get("rich_text", [])
-
-                    if rich_text and len(rich_text) > 0:
-                        place_id = rich_text[0].get("plain_text")
-                        if place_id:
-                            existing_practices[place_id] = page["id"]
-
             logger.info(f"Found {len(existing_practices)} existing practices in Notion")
             return existing_practices
 
@@ -177,6 +219,20 @@ class NotionBatchUpserter:
             logger.error(f"Failed to query existing practices: {e}")
             return {}
 
+    def prefetch_existing_practices(self) -> Dict[str, str]:
+        """Load the place_id -> page_id map now for the next upsert_batch().
+
+        Lets callers overlap the query with other work, e.g. waiting on the
+        Apify run. An empty result (including a failed query) is not kept,
+        so upsert_batch() queries again rather than trusting it.
+
+        Returns:
+            Dict mapping Google Place ID to Notion page ID (empty on failure)
+        """
+        existing_practices = self._query_existing_practices_with_page_ids()
+        self._existing_practices = existing_practices or None
+        return existing_practices
+
     def check_existing_place_ids(self) -> Set[str]:
         """Query Notion database for all existing Place IDs.
 
@@ -195,28 +251,16 @@ class NotionBatchUpserter:
         logger.info("Querying Notion for existing Place IDs...")
 
         existing_ids = set()
-        has_more = True
-        start_cursor = None
 
-        while has_more:
-            query_params = {"database_id": self.database_id, "page_size": 100}
-            if start_cursor:
-                query_params["start_cursor"] = start_cursor
-
-            response = self.client.databases.query(**query_params)
-
-            # Extract Place IDs from results
-            for result in response.get("results", []):
-                try:
-                    # Place ID is stored in "Google Place ID" rich_text property
-                    place_id_property = result["properties"]["Google Place ID"]
-                    place_id = place_id_property["rich_text"][0]["text"]["content"]
-                    existing_ids.add(place_id)
-                except (KeyError, IndexError) as e:
-                    logger.warning(f"Could not extract Place ID from result: {e}")
-
-            has_more = response.get("has_more", False)
-            start_cursor = response.get("next_cursor")
+        # Extract Place IDs from results
+        for result in self._iter_database_pages():
+            try:
+                # Place ID is stored in "Google Place ID" rich_text property
+                place_id_property = result["properties"]["Google Place ID"]
+                place_id = place_id_property["rich_text"][0]["text"]["content"]
+                existing_ids.add(place_id)
+            except (KeyError, IndexError) as e:
+                logger.warning(f"Could not extract Place ID from result: {e}")
 
         logger.info(f"Found {len(existing_ids)} existing Place IDs in Notion database")
         return existing_ids
@@ -264,7 +308,7 @@ class NotionBatchUpserter:
                         logger.warning(f"Server error ({status_code}) encountered on attempt {attempt}/{max_attempts}")
                     else:
                         # Non-retryable error
-                        logger.debug(f"Non-retryable error ({status_code}), not retrying")
+                        logger.debug("Non-retryable error (%s), not retrying", status_code)
                         raise
 
                 if should_retry and attempt < max_attempts:
@@ -283,6 +327,85 @@ class NotionBatchUpserter:
             code="max_retries"
         )
 
+    def _map_concurrently(self, fn: Callable, items: List) -> List:
+        """fn over items on up to max_concurrent_upserts threads, in order."""
+        if self.max_concurrent_upserts == 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        workers = min(self.max_concurrent_upserts, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items))
+
+    def _update_one(self, item: Tuple[VeterinaryPractice, str]) -> Dict[str, Any]:
+        """Refresh Last Scraped Date on an existing page.
+
+        Returns:
+            {"place_id", "page_id"} on success, else an error detail (with an
+            "error" key) for the result's "errors"
+        """
+        practice, page_id = item
+        from datetime import datetime, timezone
+
+        try:
+            self._spacer.wait()
+            # Partial update: only Last Scraped Date
+            self.client.pages.update(
+                page_id=page_id,
+                properties={
+                    "Last Scraped Date": {
+                        "date": {"start": datetime.now(timezone.utc).isoformat()}
+                    }
+                }
+            )
+            logger.debug("Updated timestamp for practice: %s", practice.place_id)
+            return {"place_id": practice.place_id, "page_id": page_id}
+
+        except Exception as e:
+            logger.error(f"Failed to update practice {practice.place_id}: {e}")
+            return {"place_id": practice.place_id, "error": str(e)}
+
+        finally:
+            # Serial rate limiting; concurrent updates are paced by the spacer
+            if self.max_concurrent_upserts == 1:
+                time.sleep(self.rate_limit_delay)
+
+    def _upsert_one(self, practice: VeterinaryPractice) -> Dict[str, Any]:
+        """Create the Notion page for a new practice.
+
+        Returns:
+            {"place_id", "page_id"} on success, else an error detail (with an
+            "error" key) for the result's "errors"
+        """
+        try:
+            payload = self.mapper.create_page_payload(practice)
+            self._spacer.wait()
+            page = self._create_page_with_retry(payload)
+            logger.debug("Created page: %s (%s)", practice.place_id, practice.practice_name)
+            return {"place_id": practice.place_id, "page_id": page.get("id")}
+
+        except APIResponseError as e:
+            # AC-FEAT-001-017: Continue processing despite individual failures
+            logger.error(
+                f"Failed to create page for {practice.place_id} "
+                f"({practice.practice_name}): {e}"
+            )
+            return {
+                "place_id": practice.place_id,
+                "practice_name": practice.practice_name,
+                "error": str(e),
+            }
+
+        except Exception as e:
+            # Catch any unexpected errors
+            logger.error(
+                f"Unexpected error for {practice.place_id}: {e}",
+                exc_info=True
+            )
+            return {
+                "place_id": practice.place_id,
+                "practice_name": practice.practice_name,
+                "error": f"Unexpected error: {str(e)}",
+            }
+
     def upsert_batch(self, practices: List[VeterinaryPractice]) -> Dict[str, Any]:
         """Batch upsert practices to Notion with de-duplication and error handling.
 
@@ -303,6 +426,8 @@ class NotionBatchUpserter:
             - skipped: Number of practices skipped (already exist)
             - failed: Number of practices that failed to upload
             - errors: List of error details (place_id, error message)
+            - page_ids: Place ID -> Notion page ID for every practice
+              created or updated
 
         Example:
             >>> result = upserter.upsert_batch(practices)
@@ -312,15 +437,18 @@ class NotionBatchUpserter:
         """
         if not practices:
             logger.info("No practices to upload")
-            return {"created": 0, "skipped": 0, "failed": 0, "errors": []}
+            return {"created": 0, "skipped": 0, "failed": 0, "errors": [], "page_ids": {}}
 
         logger.info(f"Starting batch upsert for {len(practices)} practices...")
 
         # Step 1: De-duplicate within batch
         unique_practices = deduplicate_by_place_id(practices)
 
-        # Step 2: Query existing Place IDs and their page IDs
-        existing_practices = self._query_existing_practices_with_page_ids()
+        # Step 2: Query existing Place IDs and their page IDs (unless prefetched)
+        existing_practices = self._existing_practices
+        self._existing_practices = None  # One-shot: pages are about to change
+        if existing_practices is None:
+            existing_practices = self._query_existing_practices_with_page_ids()
 
         # Step 3: Separate new vs existing practices
         new_practices = []
@@ -339,35 +467,18 @@ class NotionBatchUpserter:
 
         if not new_practices and not existing_to_update:
             logger.info("No practices to process")
-            return {"created": 0, "updated": 0, "failed": 0, "errors": []}
+            return {"created": 0, "updated": 0, "failed": 0, "errors": [], "page_ids": {}}
 
         # Step 4: Update existing practices with new timestamp
-        updated_count = 0
-        failed_count = 0
         errors = []
-        from datetime import datetime, timezone
-
-        for practice, page_id in existing_to_update:
-            try:
-                # Partial update: only Last Scraped Date
-                self.client.pages.update(
-                    page_id=page_id,
-                    properties={
-                        "Last Scraped Date": {
-                            "date": {"start": datetime.now(timezone.utc).isoformat()}
-                        }
-                    }
-                )
-                updated_count += 1
-                logger.debug(f"Updated timestamp for practice: {practice.place_id}")
-
-            except Exception as e:
-                logger.error(f"Failed to update practice {practice.place_id}: {e}")
-                failed_count += 1
-                errors.append({"place_id": practice.place_id, "error": str(e)})
-
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
+        page_ids = {}
+        for outcome in self._map_concurrently(self._update_one, existing_to_update):
+            if "error" in outcome:
+                errors.append(outcome)
+            else:
+                page_ids[outcome["place_id"]] = outcome["page_id"]
+        failed_count = len(errors)
+        updated_count = len(existing_to_update) - failed_count
 
         if updated_count > 0:
             logger.info(f"Updated {updated_count} existing practices")
@@ -387,45 +498,20 @@ class NotionBatchUpserter:
                 f"({len(batch)} practices)..."
             )
 
-            # Process each practice in batch
-            for practice in batch:
-                try:
-                    payload = self.mapper.create_page_payload(practice)
-                    self._create_page_with_retry(payload)
-                    created_count += 1
-                    logger.debug(f"Created page: {practice.place_id} ({practice.practice_name})")
-
-                except APIResponseError as e:
-                    # AC-FEAT-001-017: Continue processing despite individual failures
-                    failed_count += 1
-                    error_detail = {
-                        "place_id": practice.place_id,
-                        "practice_name": practice.practice_name,
-                        "error": str(e),
-                    }
-                    errors.append(error_detail)
-                    logger.error(
-                        f"Failed to create page for {practice.place_id} "
-                        f"({practice.practice_name}): {e}"
-                    )
-
-                except Exception as e:
-                    # Catch any unexpected errors
-                    failed_count += 1
-                    error_detail = {
-                        "place_id": practice.place_id,
-                        "practice_name": practice.practice_name,
-                        "error": f"Unexpected error: {str(e)}",
-                    }
-                    errors.append(error_detail)
-                    logger.error(
-                        f"Unexpected error for {practice.place_id}: {e}",
-                        exc_info=True
-                    )
+            # Process each practice in batch (concurrently if configured)
+            batch_errors = []
+            for outcome in self._map_concurrently(self._upsert_one, batch):
+                if "error" in outcome:
+                    batch_errors.append(outcome)
+                else:
+                    page_ids[outcome["place_id"]] = outcome["page_id"]
+            created_count += len(batch) - len(batch_errors)
+            failed_count += len(batch_errors)
+            errors.extend(batch_errors)
 
             # Rate limiting between batches (but not after last batch)
             if batch_num < total_batches - 1:
-                logger.debug(f"Rate limiting: sleeping {self.rate_limit_delay}s...")
+                logger.debug("Rate limiting: sleeping %ss...", self.rate_limit_delay)
                 time.sleep(self.rate_limit_delay)
 
         # Summary
@@ -439,4 +525,5 @@ class NotionBatchUpserter:
             "updated": updated_count,
             "failed": failed_count,
             "errors": errors,
+            "page_ids": page_ids,
         }
@@ -7,8 +7,9 @@ while preserving sales workflow fields through partial updates.
 Features:
 - Query practices needing enrichment (new OR stale >30 days)
 - Partial updates (enrichment fields only, sales fields preserved automatically)
-- Batch processing with rate limiting
-- Retry logic for API errors
+- Batch processing with rate limiting (bounded concurrent page updates,
+  paced by one shared RequestSpacer)
+- Retry logic for API errors (429s wait for the server's Retry-After)
 
 Usage:
     client = NotionEnrichmentClient(api_key=api_key, database_id=database_id)
@@ -24,7 +25,9 @@ Usage:
 """
 
 import logging
-from typing import List, Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 
 from notion_client import Client, APIResponseError
@@ -37,6 +40,7 @@ from tenacity import (
 
 from src.models.enrichment_models import VetPracticeExtraction
 from src.utils.logging import get_logger
+from src.utils.rate_limit import RequestSpacer, retry_after_seconds
 
 logger = get_logger(__name__)
 
@@ -47,17 +51,21 @@ class NotionEnrichmentClient:
     Attributes:
         client: Notion SDK client
         database_id: Notion database ID
-        rate_limit_delay: Delay between API calls (seconds)
+        rate_limit_delay: Minimum spacing between page updates (seconds),
+            shared by all concurrent updates
     """
 
     # Notion API rate limit: 3 requests/second
     DEFAULT_RATE_LIMIT_DELAY = 0.35  # 350ms between calls
+    DEFAULT_MAX_CONCURRENT_UPDATES = 3  # In-flight pages.update calls
+    MAX_RATE_LIMIT_ATTEMPTS = 5  # pages.update attempts while rate limited
 
     def __init__(
         self,
         api_key: str,
         database_id: str,
-        rate_limit_delay: float = DEFAULT_RATE_LIMIT_DELAY
+        rate_limit_delay: float = DEFAULT_RATE_LIMIT_DELAY,
+        max_concurrent_updates: int = DEFAULT_MAX_CONCURRENT_UPDATES
     ):
         """Initialize Notion enrichment client.
 
@@ -65,10 +73,13 @@ class NotionEnrichmentClient:
             api_key: Notion integration API key
             database_id: Notion database ID (32 chars)
             rate_limit_delay: Delay between API calls in seconds
+            max_concurrent_updates: Maximum page updates in flight at once
         """
         self.client = Client(auth=api_key)
         self.database_id = database_id
         self.rate_limit_delay = rate_limit_delay
+        self.max_concurrent_updates = max(1, max_concurrent_updates)
+        self._spacer = RequestSpacer(rate_limit_delay)
 
         logger.info(
             f"NotionEnrichmentClient initialized: database={database_id[:8]}..., "
@@ -190,12 +201,26 @@ class NotionEnrichmentClient:
             logger.error(f"Unexpected error querying practices: {e}", exc_info=True)
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type(APIResponseError),
-        reraise=True
-    )
+    def _update_page(self, page_id: str, properties: Dict) -> Dict:
+        """pages.update paced by the shared spacer, retrying 429 rate_limited.
+
+        A rate-limited attempt sleeps for the server's Retry-After (else an
+        exponential back-off); other errors are raised immediately.
+        """
+        for attempt in range(1, self.MAX_RATE_LIMIT_ATTEMPTS + 1):
+            self._spacer.wait()
+            try:
+                return self.client.pages.update(page_id=page_id, properties=properties)
+            except APIResponseError as e:
+                if e.code != "rate_limited" or attempt == self.MAX_RATE_LIMIT_ATTEMPTS:
+                    raise
+                wait = retry_after_seconds(e, default=2 ** (attempt - 1))
+                logger.warning(
+                    f"Rate limited updating page {page_id[:8]} "
+                    f"(attempt {attempt}/{self.MAX_RATE_LIMIT_ATTEMPTS}), retrying in {wait:g}s"
+                )
+                time.sleep(wait)
+
     def update_practice_enrichment(
         self,
         page_id: str,
@@ -302,10 +327,7 @@ class NotionEnrichmentClient:
 
         # Update page with partial update (sales fields preserved automatically)
         try:
-            self.client.pages.update(
-                page_id=page_id,
-                properties=properties
-            )
+            self._update_page(page_id, properties)
 
             logger.debug(f"Successfully updated page {page_id[:8]}")
             return True
@@ -321,12 +343,44 @@ class NotionEnrichmentClient:
             )
             return False
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type(APIResponseError),
-        reraise=True
-    )
+    def update_practices_enrichment(
+        self,
+        updates: List[Tuple[str, VetPracticeExtraction]]
+    ) -> Dict[str, bool]:
+        """Update many practices concurrently with bounded parallelism.
+
+        Each update is an independent partial update, so pages are written
+        through a thread pool capped at max_concurrent_updates instead of one
+        round-trip at a time.
+
+        Args:
+            updates: List of (page_id, extraction) pairs
+
+        Returns:
+            Mapping of page_id -> True if that update succeeded
+        """
+        if not updates:
+            return {}
+
+        logger.debug(
+            f"Updating {len(updates)} pages "
+            f"({self.max_concurrent_updates} concurrent)..."
+        )
+
+        def _update_one(update: Tuple[str, VetPracticeExtraction]) -> bool:
+            page_id, extraction = update
+            try:
+                return self.update_practice_enrichment(page_id=page_id, extraction=extraction)
+            except Exception as e:
+                logger.error(f"Failed to update page {page_id[:8]}: {e}")
+                return False
+
+        workers = min(self.max_concurrent_updates, len(updates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_update_one, updates))
+
+        return {page_id: ok for (page_id, _), ok in zip(updates, outcomes)}
+
     def mark_enrichment_failed(
         self,
         page_id: str,
@@ -354,10 +408,7 @@ class NotionEnrichmentClient:
         }
 
         try:
-            self.client.pages.update(
-                page_id=page_id,
-                properties=properties
-            )
+            self._update_page(page_id, properties)
 
             logger.debug(f"Successfully marked page {page_id[:8]} as failed")
             return True
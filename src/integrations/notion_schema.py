@@ -2,12 +2,24 @@
 
 Validates that a Notion database has all required properties for veterinary practice leads.
 Helps catch configuration errors before attempting to upload data.
+
+Can also be run as a combined CLI that fetches the schema once and runs
+several checks against it:
+
+    python -m src.integrations.notion_schema check debug
 """
 
+import functools
+import hashlib
+import json
 import logging
-from typing import Dict, List, Set
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
-from notion_client import Client
+from src.utils.fast_json import FastJSONClient as Client
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +44,183 @@ REQUIRED_PROPERTIES = {
     "Status": "select",
 }
 
+# Required properties for FEAT-003 lead scoring (fields read and written)
+SCORING_REQUIRED_PROPERTIES = {
+    # Fields we READ
+    "Name": "title",
+    "Website": "url",
+    "Google Rating": "number",  # Database has "Google Rating" not "Rating"
+    "Google Review Count": "number",  # Database has "Google Review Count" not "Review Count"
+    "Has Multiple Locations": "checkbox",  # Not "Multiple Locations"
+    "Vet Count": "number",
+    "Vet Count Confidence": "select",
+    "24/7 Emergency Services": "checkbox",  # Not "Emergency 24/7"
+    "Online Booking": "checkbox",
+    "Patient Portal": "checkbox",
+    "Telemedicine": "checkbox",
+    "Specialty Services": "multi_select",
+    "Decision Maker Name": "rich_text",
+    "Decision Maker Email": "email",
+    "Enrichment Status": "select",
+    # Fields we WRITE
+    "Lead Score": "number",
+    "Priority Tier": "select",
+    "Score Breakdown": "rich_text",
+    "Confidence Flags": "multi_select",
+    "Scoring Status": "select",
+}
+
+# Database objects are cached here between runs, one file per database.
+# This is the one schema cache: validate_notion_database, the listing and
+# FEAT-003 scripts and the spikes all read and write it
+SCHEMA_CACHE_DIR = Path.home() / ".cache" / "us-vet-scraping"
+SCHEMA_CACHE_TTL = 24 * 3600  # seconds
+
+# Named property sets for the combined CLI
+SCHEMA_CHECKS = {
+    "check": SCORING_REQUIRED_PROPERTIES,
+    "debug": REQUIRED_PROPERTIES,
+}
+
+
+class SchemaDiff(NamedTuple):
+    """Result of comparing required properties against a database schema.
+
+    Attributes:
+        existing: Required property names present with the expected type
+        missing: Required property names absent from the database
+        mismatches: (name, expected_type, actual_type) for wrong-typed properties
+    """
+
+    existing: Set[str]
+    missing: Set[str]
+    mismatches: List[Tuple[str, str, str]]
+
+
+def diff_schema(required: Dict[str, str], properties: Dict[str, Dict]) -> SchemaDiff:
+    """Diff required property types against a Notion properties dict.
+
+    Args:
+        required: Mapping of property name -> expected Notion type
+        properties: "properties" dict from a Notion databases.retrieve response
+
+    Returns:
+        SchemaDiff with existing, missing and mismatched properties
+
+    Example:
+        >>> diff = diff_schema({"Name": "title"}, {"Name": {"type": "title"}})
+        >>> diff.missing
+        set()
+    """
+    present = required.keys() & properties.keys()
+    missing = required.keys() - present
+    mismatches = [
+        (name, required[name], properties[name].get("type"))
+        for name in required
+        if name in present and properties[name].get("type") != required[name]
+    ]
+    existing = present - {name for name, _, _ in mismatches}
+    return SchemaDiff(existing=existing, missing=missing, mismatches=mismatches)
+
+
+@functools.lru_cache(maxsize=8)
+def fetch_schema(database_id: str, api_key: str) -> Dict[str, any]:
+    """Retrieve a database object once per (database_id, api_key).
+
+    Repeated checks against the same database in one process reuse the
+    cached response instead of issuing another HTTPS round-trip. The client
+    is closed after the call, so cache entries hold only the response.
 
-def validate_notion_database(database_id: str, api_key: str) -> Dict[str, any]:
+    Args:
+        database_id: Notion database ID
+        api_key: Notion integration API key
+
+    Returns:
+        Database object from Notion API with properties
+    """
+    client = Client(auth=api_key)
+    try:
+        return client.databases.retrieve(database_id=database_id)
+    finally:
+        client.close()
+
+
+def _schema_cache_path(database_id: str) -> Path:
+    """Cache file for one database's schema."""
+    key = hashlib.sha1(database_id.encode()).hexdigest()
+    return SCHEMA_CACHE_DIR / f"schema-{key}.json"
+
+
+def load_cached_schema(database_id: str, max_age: float) -> Optional[Dict[str, any]]:
+    """Return the cached database object if it is younger than max_age seconds."""
+    path = _schema_cache_path(database_id)
+    try:
+        if time.time() - path.stat().st_mtime >= max_age:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_schema(database_id: str, database: Dict[str, any]) -> None:
+    """Write a database object to the on-disk cache (best effort)."""
+    path = _schema_cache_path(database_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(database))
+    except OSError as e:
+        logger.debug(f"Could not write schema cache {path}: {e}")
+
+
+def clear_cached_schema(database_id: str) -> None:
+    """Drop a database's cached schema, e.g. after changing its properties."""
+    _schema_cache_path(database_id).unlink(missing_ok=True)
+
+
+def _check_required_properties(database: Dict[str, any]) -> None:
+    """Raise NotionSchemaError unless every REQUIRED_PROPERTIES entry matches."""
+    diff = diff_schema(REQUIRED_PROPERTIES, database.get("properties", {}))
+
+    # Check for missing properties
+    missing = diff.missing
+    if missing:
+        logger.error(f"Missing required properties: {missing}")
+        raise NotionSchemaError(
+            f"Notion database is missing required properties: {sorted(missing)}. "
+            f"Please add these properties to the database schema."
+        )
+
+    # Check property types match
+    type_mismatches = [
+        f"'{prop_name}': expected {expected_type}, got {actual_type}"
+        for prop_name, expected_type, actual_type in diff.mismatches
+    ]
+
+    if type_mismatches:
+        logger.error(f"Property type mismatches: {type_mismatches}")
+        raise NotionSchemaError(
+            f"Notion database has property type mismatches: {type_mismatches}. "
+            f"Please update the property types in the database schema."
+        )
+
+
+def validate_notion_database(
+    database_id: str,
+    api_key: str,
+    cache_ttl: Optional[float] = None,
+) -> Dict[str, any]:
     """Validate that Notion database has all required properties.
 
+    With cache_ttl, a schema that validated within the last cache_ttl
+    seconds is checked from disk without calling Notion. A cached schema
+    that no longer passes (e.g. REQUIRED_PROPERTIES grew) is re-fetched
+    before failing.
+
     Args:
         database_id: Notion database ID (32-char hex or UUID format)
         api_key: Notion integration API key (secret_* or ntn_* format)
+        cache_ttl: Maximum age in seconds of a cached schema to trust
+            (default: None = always fetch)
 
     Returns:
         Database object from Notion API with properties
@@ -54,10 +236,23 @@ def validate_notion_database(database_id: str, api_key: str) -> Dict[str, any]:
     """
     logger.info(f"Validating Notion database schema: {database_id}")
 
+    if cache_ttl:
+        database = load_cached_schema(database_id, cache_ttl)
+        if database is not None:
+            try:
+                _check_required_properties(database)
+            except NotionSchemaError:
+                logger.info("Cached schema no longer validates, re-fetching from Notion")
+            else:
+                logger.info(
+                    f"Notion database validated from cache: "
+                    f"{len(database.get('properties', {}))} properties"
+                )
+                return database
+
     # Initialize Notion client
     try:
-        client = Client(auth=api_key)
-        database = client.databases.retrieve(database_id=database_id)
+        database = fetch_schema(database_id, api_key)
     except Exception as e:
         logger.error(f"Failed to retrieve Notion database: {e}")
         raise NotionSchemaError(
@@ -65,41 +260,14 @@ def validate_notion_database(database_id: str, api_key: str) -> Dict[str, any]:
             f"Check API key and database ID. Error: {e}"
         ) from e
 
-    # Extract existing properties
-    existing_properties = database.get("properties", {})
-    existing_names = set(existing_properties.keys())
-    required_names = set(REQUIRED_PROPERTIES.keys())
-
-    # Check for missing properties
-    missing = required_names - existing_names
-    if missing:
-        logger.error(f"Missing required properties: {missing}")
-        raise NotionSchemaError(
-            f"Notion database is missing required properties: {sorted(missing)}. "
-            f"Please add these properties to the database schema."
-        )
-
-    # Check property types match
-    type_mismatches = []
-    for prop_name, expected_type in REQUIRED_PROPERTIES.items():
-        actual_prop = existing_properties[prop_name]
-        actual_type = actual_prop.get("type")
+    _check_required_properties(database)
 
-        if actual_type != expected_type:
-            type_mismatches.append(
-                f"'{prop_name}': expected {expected_type}, got {actual_type}"
-            )
-
-    if type_mismatches:
-        logger.error(f"Property type mismatches: {type_mismatches}")
-        raise NotionSchemaError(
-            f"Notion database has property type mismatches: {type_mismatches}. "
-            f"Please update the property types in the database schema."
-        )
-
-    # Validation passed
+    # Validation passed (cached schemas are re-checked on load regardless)
+    if cache_ttl:
+        save_cached_schema(database_id, database)
     logger.info(
-        f"Notion database validated successfully: {len(existing_names)} properties found"
+        f"Notion database validated successfully: "
+        f"{len(database.get('properties', {}))} properties found"
     )
     return database
 
@@ -125,3 +293,52 @@ def get_property_details(database: Dict[str, any]) -> List[Dict[str, str]]:
     return [
         {"name": name, "type": prop.get("type")} for name, prop in properties.items()
     ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run one or more named schema checks against a single fetched schema.
+
+    Args:
+        argv: Check names from SCHEMA_CHECKS (default: all)
+
+    Returns:
+        Process exit code (0 if every check passes)
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    names = list(argv) if argv else list(SCHEMA_CHECKS)
+    unknown = [name for name in names if name not in SCHEMA_CHECKS]
+    if unknown:
+        print(f"Unknown check(s): {unknown}. Choose from {sorted(SCHEMA_CHECKS)}")
+        return 2
+
+    api_key = os.getenv("NOTION_API_KEY")
+    database_id = os.getenv("NOTION_DATABASE_ID")
+    if not api_key or not database_id:
+        print("NOTION_API_KEY and NOTION_DATABASE_ID must be set")
+        return 2
+
+    from src.integrations.notion_schema_daemon import fetch_schema_via_daemon
+
+    database = fetch_schema_via_daemon(database_id) or fetch_schema(database_id, api_key)
+    properties = database.get("properties", {})
+
+    failed = False
+    for name in names:
+        diff = diff_schema(SCHEMA_CHECKS[name], properties)
+        ok = not diff.missing and not diff.mismatches
+        failed = failed or not ok
+        print(f"[{name}] {'OK' if ok else 'FAILED'}: "
+              f"{len(diff.existing)} ok, {len(diff.missing)} missing, "
+              f"{len(diff.mismatches)} mismatched")
+        for prop_name in sorted(diff.missing):
+            print(f"  missing: {prop_name} ({SCHEMA_CHECKS[name][prop_name]})")
+        for prop_name, expected, actual in diff.mismatches:
+            print(f"  mismatch: {prop_name} (expected {expected}, got {actual})")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,182 @@
+"""Long-lived Notion schema fetcher shared by the schema check scripts.
+
+Keeps one Notion client (and its pooled HTTPS connection) alive behind a Unix
+domain socket so repeated schema checks skip client construction and the TLS
+handshake. Scripts call fetch_schema_via_daemon() first and fall back to a
+direct fetch when no daemon is running.
+
+Usage:
+    python -m src.integrations.notion_schema_daemon        # serve
+    NOTION_SCHEMA_SOCKET=/path/to.sock python -m ...        # custom socket
+
+The default socket lives in a 0700 directory under $XDG_RUNTIME_DIR (or
+~/.cache/us-vet-scraping/daemon), and clients only trust a socket owned by, and a
+peer running as, the current user.
+
+Protocol: one JSON object per line. Request {"db_id": "..."}; response
+{"ok": true, "schema": {...}} or {"ok": false, "error": "..."}.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.integrations.notion_schema import SCHEMA_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = "notion-schema.sock"
+
+
+def get_socket_path() -> str:
+    """Socket path from NOTION_SCHEMA_SOCKET, or the per-user default.
+
+    The default is $XDG_RUNTIME_DIR/us-vet-scraping/notion-schema.sock, or
+    a daemon/ directory in the shared cache when XDG_RUNTIME_DIR is unset.
+    """
+    custom = os.getenv("NOTION_SCHEMA_SOCKET")
+    if custom:
+        return custom
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    base = Path(runtime_dir) / "us-vet-scraping" if runtime_dir else SCHEMA_CACHE_DIR / "daemon"
+    return str(base / SOCKET_NAME)
+
+
+def _is_own_socket(socket_path: str) -> bool:
+    """True if socket_path is a socket owned by the current user."""
+    try:
+        st = os.lstat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """UID of the process on the other end, where the platform exposes it."""
+    if hasattr(socket, "SO_PEERCRED"):
+        creds = sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        return struct.unpack("3i", creds)[1]
+    if hasattr(os, "getpeereid"):
+        return os.getpeereid(sock.fileno())[0]
+    return None
+
+
+def fetch_schema_via_daemon(
+    database_id: str, socket_path: Optional[str] = None, timeout: float = 30.0
+) -> Optional[Dict[str, Any]]:
+    """Ask a running daemon for a database schema.
+
+    Args:
+        database_id: Notion database ID
+        socket_path: Daemon socket (default: get_socket_path())
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Database object from Notion API, or None if no daemon is reachable
+        or the daemon could not fetch the schema
+    """
+    socket_path = socket_path or get_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+    if not _is_own_socket(socket_path):
+        logger.warning(f"Ignoring Notion schema socket not owned by this user: {socket_path}")
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            peer_uid = _peer_uid(sock)
+            if peer_uid is not None and peer_uid != os.getuid():
+                logger.warning(f"Ignoring Notion schema daemon running as uid {peer_uid}")
+                return None
+            sock.sendall(json.dumps({"db_id": database_id}).encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                response = json.loads(reader.readline() or b"{}")
+    except (OSError, ValueError) as e:
+        logger.debug(f"Notion schema daemon unavailable: {e}")
+        return None
+
+    if not response.get("ok"):
+        logger.debug(f"Notion schema daemon error: {response.get('error')}")
+        return None
+    return response["schema"]
+
+
+class _SchemaRequestHandler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited schema requests on one connection."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                schema = self.server.client.databases.retrieve(
+                    database_id=request["db_id"]
+                )
+                response = {"ok": True, "schema": schema}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SchemaDaemon(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server holding a single shared Notion client."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, client: Any):
+        self.client = client
+        # Responses contain workspace schema - keep the directory and socket
+        # private from the moment the socket exists
+        os.makedirs(os.path.dirname(socket_path) or ".", mode=0o700, exist_ok=True)
+        if os.path.lexists(socket_path):
+            os.unlink(socket_path)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _SchemaRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+
+def serve(api_key: str, socket_path: Optional[str] = None) -> None:
+    """Run the daemon until interrupted.
+
+    Args:
+        api_key: Notion integration API key
+        socket_path: Socket to listen on (default: get_socket_path())
+    """
+    from src.utils.fast_json import FastJSONClient
+
+    socket_path = socket_path or get_socket_path()
+    server = SchemaDaemon(socket_path, FastJSONClient(auth=api_key))
+    logger.info(f"Notion schema daemon listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    api_key = os.getenv("NOTION_API_KEY")
+    if not api_key:
+        print("NOTION_API_KEY must be set")
+        sys.exit(2)
+    serve(api_key)
@@ -8,12 +8,51 @@ Applies quality filters to exclude:
 """
 
 import logging
-from typing import List
+from typing import Iterable, Iterator, List
 from src.models.apify_models import ApifyGoogleMapsResult
 
 logger = logging.getLogger(__name__)
 
 
+def _has_website(practice: ApifyGoogleMapsResult) -> bool:
+    """Website present (not None, not empty)."""
+    return practice.website is not None and practice.website != ""
+
+
+def _has_min_reviews(practice: ApifyGoogleMapsResult, min_reviews: int) -> bool:
+    """Review count known and at least min_reviews."""
+    return (
+        practice.google_review_count is not None
+        and practice.google_review_count >= min_reviews
+    )
+
+
+def _is_open(practice: ApifyGoogleMapsResult) -> bool:
+    """Not permanently closed (temporarily closed practices are kept)."""
+    return not practice.permanently_closed
+
+
+def _log_website_excluded(excluded_count: int) -> None:
+    if excluded_count > 0:
+        logger.info(
+            f"Website filter: excluded {excluded_count} practices without websites"
+        )
+
+
+def _log_reviews_excluded(excluded_count: int, min_reviews: int) -> None:
+    if excluded_count > 0:
+        logger.info(
+            f"Review filter: excluded {excluded_count} practices with <{min_reviews} reviews"
+        )
+
+
+def _log_status_excluded(excluded_count: int) -> None:
+    if excluded_count > 0:
+        logger.info(
+            f"Status filter: excluded {excluded_count} permanently closed practices"
+        )
+
+
 class DataFilter:
     """
     Filter service for veterinary practice data quality.
@@ -36,18 +75,8 @@ class DataFilter:
         Returns:
             Filtered list with only practices that have websites
         """
-        filtered = [
-            p
-            for p in practices
-            if p.website is not None and p.website != ""
-        ]
-
-        excluded_count = len(practices) - len(filtered)
-        if excluded_count > 0:
-            logger.info(
-                f"Website filter: excluded {excluded_count} practices without websites"
-            )
-
+        filtered = [p for p in practices if _has_website(p)]
+        _log_website_excluded(len(practices) - len(filtered))
         return filtered
 
     def filter_min_reviews(
@@ -65,19 +94,8 @@ class DataFilter:
         Returns:
             Filtered list with only practices meeting review threshold
         """
-        filtered = [
-            p
-            for p in practices
-            if p.google_review_count is not None
-            and p.google_review_count >= min_reviews
-        ]
-
-        excluded_count = len(practices) - len(filtered)
-        if excluded_count > 0:
-            logger.info(
-                f"Review filter: excluded {excluded_count} practices with <{min_reviews} reviews"
-            )
-
+        filtered = [p for p in practices if _has_min_reviews(p, min_reviews)]
+        _log_reviews_excluded(len(practices) - len(filtered), min_reviews)
         return filtered
 
     def filter_is_open(
@@ -94,15 +112,44 @@ class DataFilter:
         Returns:
             Filtered list excluding permanently closed practices
         """
-        filtered = [p for p in practices if not p.permanently_closed]
+        filtered = [p for p in practices if _is_open(p)]
+        _log_status_excluded(len(practices) - len(filtered))
+        return filtered
 
-        excluded_count = len(practices) - len(filtered)
-        if excluded_count > 0:
-            logger.info(
-                f"Status filter: excluded {excluded_count} permanently closed practices"
-            )
+    def iter_filtered(
+        self,
+        practices: Iterable[ApifyGoogleMapsResult],
+        min_reviews: int = 10,
+    ) -> Iterator[ApifyGoogleMapsResult]:
+        """
+        Lazily yield practices passing all quality checks, in one pass.
 
-        return filtered
+        Same checks, in the same order, as apply_all_filters, but no
+        intermediate lists are built. Each practice is counted against the
+        first check it fails, and the per-filter exclusions are logged once
+        the input is exhausted.
+
+        Args:
+            practices: Iterable of ApifyGoogleMapsResult objects
+            min_reviews: Minimum review count (default: 10)
+
+        Yields:
+            Practices with a website, enough reviews and not permanently closed
+        """
+        no_website = too_few_reviews = closed = 0
+        for p in practices:
+            if not _has_website(p):
+                no_website += 1
+            elif not _has_min_reviews(p, min_reviews):
+                too_few_reviews += 1
+            elif not _is_open(p):
+                closed += 1
+            else:
+                yield p
+
+        _log_website_excluded(no_website)
+        _log_reviews_excluded(too_few_reviews, min_reviews)
+        _log_status_excluded(closed)
 
     def apply_all_filters(
         self,
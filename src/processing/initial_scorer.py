@@ -21,7 +21,7 @@ Total: 0-25 points (higher = better ICP fit)
 """
 
 import logging
-from typing import List
+from typing import Iterable, Iterator, List
 from datetime import datetime, timezone
 from src.models.apify_models import ApifyGoogleMapsResult
 from src.models.apify_models import VeterinaryPractice
@@ -52,9 +52,10 @@ class InitialScorer:
 
         total_score = review_score + rating_score
 
+        # Called once per practice: %-style args are only formatted if DEBUG is on
         logger.debug(
-            f"Scored practice {practice.place_id}: {total_score} pts "
-            f"(reviews={review_score}, rating={rating_score})"
+            "Scored practice %s: %d pts (reviews=%d, rating=%d)",
+            practice.place_id, total_score, review_score, rating_score,
         )
 
         return total_score
@@ -124,14 +125,40 @@ class InitialScorer:
         Returns:
             List of VeterinaryPractice objects with initial_score added
         """
-        scored_practices = []
+        scored_practices = list(self.iter_scored(practices))
 
+        logger.info(
+            f"Batch scoring complete: {len(scored_practices)} practices scored",
+            extra={
+                "count": len(scored_practices),
+                "avg_score": sum(p.initial_score for p in scored_practices)
+                / len(scored_practices)
+                if scored_practices
+                else 0,
+            },
+        )
+
+        return scored_practices
+
+    def iter_scored(
+        self, practices: Iterable[ApifyGoogleMapsResult]
+    ) -> Iterator[VeterinaryPractice]:
+        """
+        Lazily score practices, yielding each VeterinaryPractice as it is built.
+
+        Args:
+            practices: Iterable of ApifyGoogleMapsResult objects (e.g. from
+                DataFilter.iter_filtered)
+
+        Yields:
+            VeterinaryPractice objects with initial_score and priority_tier set
+        """
         for practice in practices:
             score = self.calculate_baseline_score(practice)
 
             # Convert to VeterinaryPractice with score
             now = datetime.now(timezone.utc).isoformat()
-            scored_practice = VeterinaryPractice(
+            yield VeterinaryPractice(
                 place_id=practice.place_id,
                 practice_name=practice.practice_name,
                 address=practice.address,
@@ -150,21 +177,6 @@ class InitialScorer:
                 operating_hours=practice.opening_hours or [],
             )
 
-            scored_practices.append(scored_practice)
-
-        logger.info(
-            f"Batch scoring complete: {len(scored_practices)} practices scored",
-            extra={
-                "count": len(scored_practices),
-                "avg_score": sum(p.initial_score for p in scored_practices)
-                / len(scored_practices)
-                if scored_practices
-                else 0,
-            },
-        )
-
-        return scored_practices
-
     def _determine_priority_tier(self, score: int) -> str:
         """
         Determine priority tier based on score.
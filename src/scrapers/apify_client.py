@@ -17,6 +17,7 @@ from tenacity import (
 )
 
 from src.models.apify_models import ApifyGoogleMapsResult
+from src.utils.fast_json import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -171,32 +172,56 @@ class ApifyClient:
             # Still running, wait before next poll
             time.sleep(poll_interval)
 
-    def parse_results(self, dataset_id: str) -> List[ApifyGoogleMapsResult]:
+    def fetch_items(self, dataset_id: str) -> List[Dict[str, Any]]:
         """
-        Parse Apify dataset into validated Pydantic models (AC-FEAT-001-001, AC-FEAT-001-016).
+        Download an Apify dataset's raw items, without validation.
 
         Args:
             dataset_id: Apify dataset ID from wait_for_results()
 
+        Returns:
+            List of raw result dicts, as parse_items() accepts them
+        """
+        client = self._get_apify_client()
+
+        logger.info(f"Fetching Apify dataset: {dataset_id}")
+
+        # One JSON download, decoded with orjson when available
+        return json_loads(client.dataset(dataset_id).get_items_as_bytes(item_format="json"))
+
+    def parse_items(self, items: List[Dict[str, Any]]) -> List[ApifyGoogleMapsResult]:
+        """
+        Validate raw Apify items into Pydantic models (AC-FEAT-001-001, AC-FEAT-001-016).
+
+        Args:
+            items: Raw result dicts (from fetch_items() or a cached copy)
+
         Returns:
             List of ApifyGoogleMapsResult Pydantic models
 
         Raises:
             ValidationError: If any record fails validation
         """
-        client = self._get_apify_client()
-
-        logger.info(f"Parsing Apify dataset: {dataset_id}")
-
-        results = []
-        for item in client.dataset(dataset_id).iterate_items():
-            # Validate with Pydantic model
-            result = ApifyGoogleMapsResult(**item)
-            results.append(result)
+        results = [ApifyGoogleMapsResult(**item) for item in items]
 
         logger.info(
             f"Parsed {len(results)} practices from Apify",
-            extra={"dataset_id": dataset_id, "count": len(results)},
+            extra={"count": len(results)},
         )
 
         return results
+
+    def parse_results(self, dataset_id: str) -> List[ApifyGoogleMapsResult]:
+        """
+        Parse Apify dataset into validated Pydantic models (AC-FEAT-001-001, AC-FEAT-001-016).
+
+        Args:
+            dataset_id: Apify dataset ID from wait_for_results()
+
+        Returns:
+            List of ApifyGoogleMapsResult Pydantic models
+
+        Raises:
+            ValidationError: If any record fails validation
+        """
+        return self.parse_items(self.fetch_items(dataset_id))
@@ -0,0 +1,4 @@
+"""Local pipeline state carried between runs."""
+from src.state.ledger import Ledger, practice_hash
+
+__all__ = ["Ledger", "practice_hash"]
@@ -0,0 +1,87 @@
+"""
+SQLite ledger of practices already uploaded to Notion (FEAT-001).
+
+Records, per Google Place ID, a hash of the scraped Apify data together with
+the initial score and Notion page ID from the last successful upload. A rerun
+can then skip scoring and uploading practices whose scraped data is unchanged.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+DEFAULT_LEDGER_PATH = Path(".cache") / "ledger.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS practices (
+    place_id TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    score INTEGER,
+    notion_id TEXT,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+def practice_hash(practice: BaseModel) -> str:
+    """Stable SHA-1 of a practice's fields, used to detect changed data."""
+    return hashlib.sha1(
+        json.dumps(practice.model_dump(mode="json"), sort_keys=True).encode()
+    ).hexdigest()
+
+
+class Ledger:
+    """
+    Place ID -> last uploaded state, stored in one SQLite table.
+
+    Usage:
+        with Ledger(path) as ledger:
+            known = ledger.lookup(place_ids)
+            ledger.record([(place_id, hash, score, notion_id), ...])
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_LEDGER_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute(_SCHEMA)
+        self.conn.commit()
+
+    def lookup(self, place_ids: Iterable[str]) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Return place_id -> (hash, notion_id) for the given IDs that are recorded."""
+        place_ids = list(place_ids)
+        known = {}
+        # Stay under SQLite's default limit on bound parameters per statement
+        for start in range(0, len(place_ids), 500):
+            chunk = place_ids[start:start + 500]
+            rows = self.conn.execute(
+                "SELECT place_id, hash, notion_id FROM practices "
+                f"WHERE place_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            known.update((place_id, (h, notion_id)) for place_id, h, notion_id in rows)
+        return known
+
+    def record(self, rows: Iterable[Tuple[str, str, Optional[int], Optional[str]]]) -> None:
+        """Insert or replace (place_id, hash, score, notion_id) rows in one transaction."""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO practices "
+                "(place_id, hash, score, notion_id, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(*row, now) for row in rows],
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "Ledger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
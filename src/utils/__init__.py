@@ -1,5 +1,5 @@
 """Utility modules for US Vet Scraping application."""
 
-from .logging import setup_logging, get_logger
+from .logging import setup_logging, get_logger, stop_logging
 
-__all__ = ['setup_logging', 'get_logger']
+__all__ = ['setup_logging', 'get_logger', 'stop_logging']
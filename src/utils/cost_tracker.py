@@ -24,9 +24,17 @@ Usage:
     summary = tracker.get_summary()
 """
 
-import tiktoken
+import functools
 from typing import Optional
 
+import tiktoken
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str) -> "tiktoken.Encoding":
+    """Load a tiktoken encoding once per process (shared by all trackers)."""
+    return tiktoken.get_encoding(encoding_name)
+
 
 class CostLimitExceeded(Exception):
     """Raised when cumulative cost exceeds budget limit.
@@ -95,8 +103,10 @@ class CostTracker:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
 
-        # Initialize tiktoken encoder
-        self._encoding = tiktoken.get_encoding(self.ENCODING_NAME)
+    @property
+    def _encoding(self) -> "tiktoken.Encoding":
+        """tiktoken encoder, loaded lazily on first token count."""
+        return _get_encoding(self.ENCODING_NAME)
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text using tiktoken.
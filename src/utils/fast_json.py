@@ -0,0 +1,58 @@
+"""
+Fast JSON decoding for large API payloads.
+
+Notion query/retrieve responses nest every property's full value (and, for
+databases, every select option), and Apify datasets carry the full Google
+Maps record per practice. orjson decodes these several times faster than the
+stdlib json module; when orjson is not installed, json is used instead.
+
+Usage:
+    from src.utils.fast_json import AsyncFastJSONClient, FastJSONClient, json_loads
+
+    client = FastJSONClient(auth=api_key)  # drop-in notion_client.Client
+    async_client = AsyncFastJSONClient(auth=api_key)  # ... AsyncClient
+    items = json_loads(raw_bytes)
+"""
+
+import json
+import logging
+from typing import Any, Union
+
+from notion_client import AsyncClient, Client
+
+try:
+    import orjson
+except ImportError:  # optional - stdlib json is the fallback
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON bytes or text (raises ValueError on invalid input)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _FastJSONParseMixin:
+    """Decodes successful responses with json_loads.
+
+    Error responses keep notion_client's own handling (APIResponseError etc.).
+    Shared by the sync and async clients, which parse responses identically.
+    """
+
+    def _parse_response(self, response):
+        if not response.is_success:
+            return super()._parse_response(response)
+        body = json_loads(response.content)
+        # notion_client logs every body at DEBUG; only pay for it when enabled
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"=> {body}")
+        return body
+
+
+class FastJSONClient(_FastJSONParseMixin, Client):
+    """notion_client.Client that decodes successful responses with json_loads."""
+
+
+class AsyncFastJSONClient(_FastJSONParseMixin, AsyncClient):
+    """notion_client.AsyncClient that decodes successful responses with json_loads."""
@@ -2,13 +2,52 @@
 Simple logging setup for US Vet Scraping application.
 
 Provides basic console and file logging with optional debug mode.
+
+The handlers sit on the root logger, so records from every module logger
+(src.*, __main__) reach them. The root logger only enqueues records; a
+background QueueListener thread writes them, so logging calls in hot loops
+(and from the Stage 4 upload threads) don't block on stdout or file I/O.
+The message itself is still formatted on the calling thread, by
+QueueHandler.prepare().
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from pathlib import Path
 
+# Background thread writing queued records, the root handler feeding it,
+# and the root level to restore; all replaced by each setup_logging()
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_saved_root_level: Optional[int] = None
+
+
+def stop_logging() -> None:
+    """Flush queued records, stop the background log writer, and undo
+    setup_logging()'s changes to the root logger.
+
+    Registered with atexit; call it directly before reading a log file
+    that must be complete.
+    """
+    global _listener, _queue_handler, _saved_root_level
+    if _queue_handler is not None:
+        root = logging.getLogger()
+        root.removeHandler(_queue_handler)
+        root.setLevel(_saved_root_level)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
 
 def setup_logging(
     log_level: str = 'INFO',
@@ -18,24 +57,42 @@ def setup_logging(
     """
     Set up basic application logging.
 
+    Installs a queue handler on the root logger, so every module logger
+    is covered; the console and file handlers run on a background
+    QueueListener.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (None = console only)
         test_mode: Whether to enable test mode (forces DEBUG level)
 
     Returns:
-        Configured logger instance
+        The application's 'vet_scraping' logger
     """
+    global _listener, _queue_handler, _saved_root_level
+
     # Override log level in test mode
     if test_mode:
         log_level = 'DEBUG'
 
-    # Get logger
-    logger = logging.getLogger('vet_scraping')
-    logger.setLevel(getattr(logging, log_level.upper()))
+    # Remove the previous queue handler and writer thread to avoid duplicates;
+    # handlers installed by others (e.g. pytest) are left in place
+    stop_logging()
 
-    # Remove existing handlers to avoid duplicates
+    level = getattr(logging, log_level.upper())
+    root = logging.getLogger()
+    _saved_root_level = root.level
+    root.setLevel(level)
+    # Per-request httpx lines would drown out the pipeline's own output
+    logging.getLogger('httpx').setLevel(max(level, logging.WARNING))
+
+    # Application logger propagates to the root handler like any other
+    logger = logging.getLogger('vet_scraping')
+    logger.setLevel(level)
     logger.handlers.clear()
+    logger.propagate = True
+
+    handlers = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -45,7 +102,7 @@ def setup_logging(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler (if specified)
     if log_file:
@@ -59,10 +116,13 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
-    # Prevent propagation to root logger
-    logger.propagate = False
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _queue_handler = QueueHandler(log_queue)
+    root.addHandler(_queue_handler)
 
     return logger
 
@@ -0,0 +1,52 @@
+"""
+Client-side pacing for the Notion API.
+
+Notion allows an average of 3 requests/second per integration and answers
+bursts with 429 rate_limited plus a Retry-After header. RequestSpacer keeps
+concurrent workers under one shared rate; retry_after_seconds reads the
+server's back-off hint from a rate-limited error.
+
+Usage:
+    spacer = RequestSpacer(1.0 / NOTION_REQUESTS_PER_SECOND)
+
+    spacer.wait()  # before each request, from any thread
+    client.pages.update(...)
+"""
+
+import threading
+import time
+
+# Notion API rate limit: 3 requests/second averaged per integration
+NOTION_REQUESTS_PER_SECOND = 3.0
+
+
+class RequestSpacer:
+    """Thread-safe pacing: successive wait() calls return >= interval apart.
+
+    Each caller reserves the next free slot under the lock and sleeps
+    outside it, so workers queue up behind one shared rate.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def retry_after_seconds(error: Exception, default: float) -> float:
+    """Seconds to wait from an API error's Retry-After header, else default."""
+    headers = getattr(error, "headers", None)
+    try:
+        return float(headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return default
@@ -38,7 +38,7 @@ def integration_logger(tmp_path: Path):
     Returns:
         Logger instance configured with file and console output
     """
-    from src.utils.logging import setup_logging
+    from src.utils.logging import setup_logging, stop_logging
 
     log_file = tmp_path / "integration_test.log"
     logger = setup_logging(
@@ -46,7 +46,8 @@ def integration_logger(tmp_path: Path):
         log_file=str(log_file),
         test_mode=True
     )
-    return logger
+    yield logger
+    stop_logging()
 
 
 @pytest.fixture
@@ -4,6 +4,8 @@ Unit tests for ApifyClient (FEAT-001).
 Tests scraping, result parsing, error handling, and retry logic.
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 from datetime import datetime
@@ -134,7 +136,7 @@ class TestApifyClient:
         with patch("src.scrapers.apify_client.ApifyClient._get_apify_client") as mock_get_client:
             mock_client = Mock()
             mock_dataset = Mock()
-            mock_dataset.iterate_items.return_value = iter(valid_practices_data)
+            mock_dataset.get_items_as_bytes.return_value = json.dumps(valid_practices_data).encode()
             mock_client.dataset.return_value = mock_dataset
             mock_get_client.return_value = mock_client
 
@@ -152,13 +154,32 @@ class TestApifyClient:
             assert results[0].practice_name == "Test Vet Clinic 0"
             assert results[0].address == "0 Test St, Test City, CA 90001"
 
+    def test_parse_items_accepts_json_round_trip(self, valid_practices_data):
+        """Raw items re-read from a JSON cache parse like a fresh download."""
+        # Given: Raw items as fetch_items returns them
+        with patch("src.scrapers.apify_client.ApifyClient._get_apify_client") as mock_get_client:
+            mock_client = Mock()
+            mock_client.dataset.return_value.get_items_as_bytes.return_value = (
+                json.dumps(valid_practices_data).encode()
+            )
+            mock_get_client.return_value = mock_client
+
+            apify_client = ApifyClient(api_key="apify_api_test123")
+            items = apify_client.fetch_items("dataset_test456")
+
+        # When: Parsing a JSON round-tripped copy
+        results = apify_client.parse_items(json.loads(json.dumps(items)))
+
+        # Then: Same models as parsing the originals
+        assert results == apify_client.parse_items(valid_practices_data)
+
     def test_parse_results_invalid_data(self, invalid_practice_data):
         """AC-FEAT-001-016: Handle invalid data with validation errors."""
         # Given: Dataset with invalid practice (missing Place ID)
         with patch("src.scrapers.apify_client.ApifyClient._get_apify_client") as mock_get_client:
             mock_client = Mock()
             mock_dataset = Mock()
-            mock_dataset.iterate_items.return_value = iter([invalid_practice_data])
+            mock_dataset.get_items_as_bytes.return_value = json.dumps([invalid_practice_data]).encode()
             mock_client.dataset.return_value = mock_dataset
             mock_get_client.return_value = mock_client
 
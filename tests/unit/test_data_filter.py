@@ -4,6 +4,8 @@ Unit tests for DataFilter (FEAT-001).
 Tests filtering logic for website, reviews, and open status.
 """
 
+import logging
+
 import pytest
 from src.processing.data_filter import DataFilter
 from src.models.apify_models import ApifyGoogleMapsResult
@@ -110,6 +112,37 @@ class TestDataFilter:
             assert practice.google_review_count >= 10
             assert not practice.permanently_closed
 
+    def test_iter_filtered_matches_apply_all_filters(self, mixed_quality_practices):
+        """iter_filtered yields the same practices as apply_all_filters, lazily."""
+        # Given: 20 practices with various quality issues
+        filter_service = DataFilter()
+
+        # When: Filtering lazily
+        filtered = filter_service.iter_filtered(mixed_quality_practices)
+
+        # Then: Nothing is evaluated until consumed, then the results match
+        assert not isinstance(filtered, list)
+        assert list(filtered) == filter_service.apply_all_filters(mixed_quality_practices)
+
+    def test_iter_filtered_logs_rejection_counts(self, mixed_quality_practices, caplog):
+        """iter_filtered logs the same per-filter exclusions as apply_all_filters."""
+        filter_service = DataFilter()
+        logger_name = "src.processing.data_filter"
+
+        def exclusion_messages():
+            return [r.getMessage() for r in caplog.records if "filter: excluded" in r.getMessage()]
+
+        with caplog.at_level(logging.INFO, logger=logger_name):
+            filter_service.apply_all_filters(mixed_quality_practices)
+        expected = exclusion_messages()
+        caplog.clear()
+
+        with caplog.at_level(logging.INFO, logger=logger_name):
+            list(filter_service.iter_filtered(mixed_quality_practices))
+
+        assert expected
+        assert exclusion_messages() == expected
+
 
 # Fixtures for test data
 @pytest.fixture
@@ -175,3 +175,30 @@ class TestInitialScorer:
         for i, practice in enumerate(scored_practices):
             assert practice.place_id == f"ChIJ{i}"
             assert practice.google_review_count == 10 + i * 10
+
+    def test_iter_scored_yields_same_as_score_batch(self):
+        """iter_scored yields one VeterinaryPractice per input, as score_batch does."""
+        # Given: Practices across all three tiers
+        practices = [
+            ApifyGoogleMapsResult(
+                place_id=f"ChIJ{i}",
+                practice_name=f"Vet {i}",
+                address=f"{i} St",
+                website=f"https://vet{i}.com",
+                google_review_count=reviews,
+                google_rating=rating,
+                permanently_closed=False,
+            )
+            for i, (reviews, rating) in enumerate([(200, 4.8), (60, 4.2), (10, 3.0)])
+        ]
+
+        scorer = InitialScorer()
+
+        # When: Scoring lazily
+        scored = list(scorer.iter_scored(iter(practices)))
+
+        # Then: Scores and tiers match batch scoring
+        batch = scorer.score_batch(practices)
+        assert [p.place_id for p in scored] == ["ChIJ0", "ChIJ1", "ChIJ2"]
+        assert [p.initial_score for p in scored] == [p.initial_score for p in batch]
+        assert [p.priority_tier for p in scored] == ["Hot", "Warm", "Cold"]
@@ -0,0 +1,57 @@
+"""
+Unit tests for the uploaded-practice Ledger (FEAT-001).
+
+Tests hashing of scraped practices and SQLite lookup/record round trips.
+"""
+
+from src.models.apify_models import ApifyGoogleMapsResult
+from src.state.ledger import Ledger, practice_hash
+
+
+def _practice(place_id="ChIJ1", review_count=20):
+    return ApifyGoogleMapsResult(
+        place_id=place_id,
+        practice_name="Test Vet",
+        address="123 Main St, Boston, MA 02101",
+        website="https://testvet.com",
+        google_review_count=review_count,
+    )
+
+
+class TestPracticeHash:
+    """Test change detection hashing."""
+
+    def test_same_data_same_hash(self):
+        assert practice_hash(_practice()) == practice_hash(_practice())
+
+    def test_changed_data_changes_hash(self):
+        assert practice_hash(_practice(review_count=20)) != practice_hash(_practice(review_count=21))
+
+
+class TestLedger:
+    """Test Ledger storage."""
+
+    def test_lookup_unknown_is_empty(self, tmp_path):
+        with Ledger(tmp_path / "ledger.db") as ledger:
+            assert ledger.lookup(["ChIJ1"]) == {}
+
+    def test_record_then_lookup(self, tmp_path):
+        path = tmp_path / "state" / "ledger.db"
+        with Ledger(path) as ledger:
+            ledger.record([("ChIJ1", "h1", 18, "page-1"), ("ChIJ2", "h2", 9, "page-2")])
+
+        # Persisted across connections
+        with Ledger(path) as ledger:
+            assert ledger.lookup(["ChIJ1", "ChIJ3"]) == {"ChIJ1": ("h1", "page-1")}
+
+    def test_record_replaces_existing_row(self, tmp_path):
+        with Ledger(tmp_path / "ledger.db") as ledger:
+            ledger.record([("ChIJ1", "h1", 18, "page-1")])
+            ledger.record([("ChIJ1", "h2", 20, "page-1")])
+            assert ledger.lookup(["ChIJ1"]) == {"ChIJ1": ("h2", "page-1")}
+
+    def test_lookup_many_ids(self, tmp_path):
+        rows = [(f"ChIJ{i}", f"h{i}", 10, f"page-{i}") for i in range(1200)]
+        with Ledger(tmp_path / "ledger.db") as ledger:
+            ledger.record(rows)
+            assert len(ledger.lookup(row[0] for row in rows)) == 1200
@@ -5,6 +5,8 @@ Tests extraction of vet count, decision makers, services, technology indicators,
 personalization context, and error handling for rate limits.
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 # TODO: Import LLMExtractor, VetPracticeExtraction, CostTracker
 # from src.enrichment.llm_extractor import LLMExtractor
@@ -12,6 +14,20 @@ import pytest
 # from src.utils.cost_tracker import CostTracker
 
 
+@pytest.fixture
+def extractor(tmp_path):
+    """LLMExtractor with a stub prompt, mocked cost tracker and no network."""
+    from src.enrichment.llm_extractor import LLMExtractor
+
+    prompt_file = tmp_path / "prompt.txt"
+    prompt_file.write_text("Extract practice data.")
+    config = MagicMock(api_key="sk-test", model="gpt-4o-mini", temperature=0.1)
+    cost_tracker = MagicMock(budget_limit=1.0)
+    cost_tracker.count_tokens.return_value = 100
+    cost_tracker.track_call.return_value = 0.0001
+    return LLMExtractor(cost_tracker=cost_tracker, config=config, prompt_file=str(prompt_file))
+
+
 class TestStructuredOutputExtraction:
     """Test OpenAI structured output extraction."""
 
@@ -216,3 +232,73 @@ class TestTextTruncation:
         # TODO: Call extract_practice_data()
         # TODO: Verify input text to OpenAI is ≤8000 characters
         pass
+
+
+class TestPrepareWebsiteText:
+    """Test whitespace collapsing and per-page character budgets."""
+
+    def test_collapses_whitespace_before_budgeting(self, extractor):
+        """
+        Given: A team page padded with spaces, tabs and blank lines
+        When: _prepare_website_text() builds the extraction input
+        Then: Runs of spaces become one space, blank lines are dropped, and
+              the padding doesn't use up the page's budget
+        """
+        from src.models.enrichment_models import WebsiteData
+
+        content = "Dr. Smith  \t Owner\n\n\n   \nDr. Jones" + " " * 5000 + "\nDr. Lee"
+        pages = [WebsiteData(url="https://vet.example/team", content=content)]
+
+        text = extractor._prepare_website_text(pages)
+
+        assert text == "=== TEAM PAGE ===\nDr. Smith Owner\nDr. Jones\nDr. Lee\n"
+
+    def test_page_budget_applies_to_collapsed_text(self, extractor):
+        """
+        Given: A homepage (2000-char budget) and a contact page (500-char budget)
+        When: _prepare_website_text() builds the extraction input
+        Then: Each page is cut to its budget counted in collapsed characters
+        """
+        from src.models.enrichment_models import WebsiteData
+
+        pages = [
+            WebsiteData(url="https://vet.example/", content="word   " * 1000),
+            WebsiteData(url="https://vet.example/contact", content="x" * 800),
+        ]
+
+        text = extractor._prepare_website_text(pages)
+
+        contact, homepage = text.split("\n=== HOMEPAGE PAGE ===\n")
+        assert contact == "=== CONTACT PAGE ===\n" + "x" * 500 + "\n"
+        assert homepage == "word " * 400 + "\n"
+
+
+class TestExtractionCache:
+    """Test reuse of extractions for identical practice content."""
+
+    @pytest.mark.asyncio
+    async def test_identical_content_calls_api_once(self, extractor):
+        """
+        Given: Two practices with the same name and website content
+        When: extract_practice_data() is called for each
+        Then: OpenAI is called once, and the second call returns an equal
+              but separate copy of the first result
+        """
+        from src.models.enrichment_models import VetPracticeExtraction, WebsiteData
+
+        extraction = VetPracticeExtraction(vet_count_total=3, vet_count_confidence="high")
+        response = MagicMock()
+        response.choices[0].message.parsed = extraction
+        response.usage.prompt_tokens = 100
+        response.usage.completion_tokens = 50
+        extractor.client.beta.chat.completions.parse = AsyncMock(return_value=response)
+        pages = [WebsiteData(url="https://vet.example/team", content="Dr. A, Dr. B, Dr. C")]
+
+        first = await extractor.extract_practice_data("Example Vet", pages)
+        second = await extractor.extract_practice_data("Example Vet", pages)
+
+        assert extractor.client.beta.chat.completions.parse.await_count == 1
+        assert second == first
+        first.vet_count_total = 99
+        assert second.vet_count_total == 3
+        assert second is not first
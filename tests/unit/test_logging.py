@@ -77,6 +77,48 @@ class TestFileLogging:
         # TODO: Write logs to file, verify plain text format
         pass
 
+    def test_queued_records_reach_file(self, tmp_path):
+        """
+        Test that records logged via the queue are written by the listener.
+
+        Given logging is set up with a log file
+        When messages are logged and the background writer is stopped
+        Then every message is in the file, in order
+        """
+        from src.utils.logging import setup_logging, stop_logging
+
+        log_file = tmp_path / "run.log"
+        logger = setup_logging(log_level="INFO", log_file=str(log_file))
+        for i in range(50):
+            logger.info("message %d", i)
+        logger.debug("hidden")
+        stop_logging()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 50
+        assert lines[0].endswith("message 0")
+        assert lines[-1].endswith("message 49")
+
+    def test_module_logger_records_reach_listener(self, tmp_path):
+        """
+        Test that pipeline module loggers are routed through the queue.
+
+        Given logging is set up with a log file
+        When a src.* module logger (via get_logger(__name__)) logs a message
+        Then the background writer puts it in the file
+        """
+        from src.utils.logging import get_logger, setup_logging, stop_logging
+
+        log_file = tmp_path / "run.log"
+        setup_logging(log_level="INFO", log_file=str(log_file))
+        get_logger("src.integrations.notion_batch").info("uploaded %d pages", 3)
+        stop_logging()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert "src.integrations.notion_batch" in lines[0]
+        assert lines[0].endswith("uploaded 3 pages")
+
 
 class TestTestModeLogging:
     """Test test mode debug logging."""
@@ -19,9 +19,16 @@ from unittest.mock import Mock, patch, call, MagicMock
 from notion_client import APIResponseError
 
 from src.models.apify_models import VeterinaryPractice
+from src.integrations import notion_schema
 from src.integrations.notion_batch import NotionBatchUpserter, deduplicate_by_place_id
 
 
+@pytest.fixture(autouse=True)
+def isolated_schema_cache(tmp_path, monkeypatch):
+    """Keep the shared schema cache out of the user's home directory."""
+    monkeypatch.setattr(notion_schema, "SCHEMA_CACHE_DIR", tmp_path / "schema-cache")
+
+
 @pytest.fixture
 def sample_practices():
     """Create 10 unique VeterinaryPractice instances for testing."""
@@ -428,6 +435,169 @@ class TestRetryOn429:
         assert actual_calls == 3, f"Expected 3 calls, got {actual_calls}"
 
 
+class TestConcurrentUpserts:
+    """Test bounded concurrent page creation with shared pacing."""
+
+    @patch('src.integrations.notion_batch.Client')
+    def test_upsert_batch_concurrent_creates_all_pages(self, mock_notion_client):
+        """
+        Given 9 new practices and max_concurrent_upserts=3
+        When upsert_batch is called
+        Then all pages are created with at most 3 requests in flight
+        """
+        import threading
+
+        practices = [
+            VeterinaryPractice(
+                place_id=f"ChIJPlace{i:03d}",
+                practice_name=f"Vet {i}",
+                address=f"{i} Main St",
+                initial_score=20,
+            )
+            for i in range(9)
+        ]
+
+        mock_client_instance = mock_notion_client.return_value
+        mock_client_instance.databases.query.return_value = {"results": [], "has_more": False}
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def slow_create(**kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["now"] -= 1
+            return {"id": "page_123"}
+
+        mock_client_instance.pages.create.side_effect = slow_create
+
+        upserter = NotionBatchUpserter(
+            api_key="test_key",
+            database_id="test_db",
+            batch_size=10,
+            max_concurrent_upserts=3
+        )
+        upserter._spacer.interval = 0  # Pacing is covered below
+
+        result = upserter.upsert_batch(practices)
+
+        assert result["created"] == 9
+        assert result["failed"] == 0
+        assert 1 < in_flight["peak"] <= 3
+
+    @patch('src.utils.rate_limit.time.monotonic', return_value=100.0)
+    @patch('src.utils.rate_limit.time.sleep')
+    def test_request_spacer_queues_callers_at_shared_rate(self, mock_sleep, mock_monotonic):
+        """Back-to-back callers each wait one more interval than the last."""
+        from src.utils.rate_limit import RequestSpacer
+
+        spacer = RequestSpacer(0.5)
+        for _ in range(3):
+            spacer.wait()
+
+        assert mock_sleep.call_args_list == [call(0.5), call(1.0)]
+
+
+class TestPrefetchExistingPractices:
+    """Test loading existing practices ahead of upsert_batch."""
+
+    @patch('src.integrations.notion_batch.Client')
+    @patch('time.sleep')
+    def test_upsert_batch_uses_prefetched_practices_once(self, mock_sleep, mock_notion_client):
+        """
+        Given existing practices prefetched before upsert_batch
+        When upsert_batch is called twice
+        Then the first call reuses the prefetch and the second queries again
+        """
+        mock_client_instance = mock_notion_client.return_value
+        mock_client_instance.databases.query.return_value = {
+            "results": [
+                {
+                    "id": "page_existing",
+                    "properties": {"Google Place ID": {"rich_text": [{"plain_text": "ChIJPlace000"}]}},
+                }
+            ],
+            "has_more": False,
+        }
+        mock_client_instance.pages.create.return_value = {"id": "page_123"}
+
+        practices = [
+            VeterinaryPractice(
+                place_id=f"ChIJPlace{i:03d}",
+                practice_name=f"Vet {i}",
+                address=f"{i} Main St",
+                initial_score=20,
+            )
+            for i in range(2)
+        ]
+
+        upserter = NotionBatchUpserter(api_key="test_key", database_id="test_db")
+        assert upserter.prefetch_existing_practices() == {"ChIJPlace000": "page_existing"}
+        assert mock_client_instance.databases.query.call_count == 1
+
+        result = upserter.upsert_batch(practices)
+
+        assert result["created"] == 1
+        assert result["updated"] == 1
+        assert mock_client_instance.databases.query.call_count == 1
+
+        upserter.upsert_batch(practices)
+        assert mock_client_instance.databases.query.call_count == 2
+
+
+    @patch('src.integrations.notion_batch.Client')
+    def test_existing_practice_query_fetches_only_place_id(self, mock_notion_client):
+        """De-dup queries ask Notion for the Google Place ID property alone."""
+        mock_client_instance = mock_notion_client.return_value
+        mock_client_instance.databases.retrieve.return_value = {
+            "properties": {"Google Place ID": {"id": "a%3Bb", "type": "rich_text"}}
+        }
+        mock_client_instance.databases.query.return_value = {"results": [], "has_more": False}
+
+        upserter = NotionBatchUpserter(api_key="test_key", database_id="test_db")
+        upserter._query_existing_practices_with_page_ids()
+
+        mock_client_instance.databases.query.assert_called_once_with(
+            database_id="test_db", page_size=100, filter_properties=["a;b"]
+        )
+
+    @patch('src.integrations.notion_batch.Client')
+    def test_place_id_property_id_looked_up_once(self, mock_notion_client):
+        """Repeated de-dup queries don't retrieve the database schema again."""
+        mock_client_instance = mock_notion_client.return_value
+        mock_client_instance.databases.retrieve.return_value = {
+            "properties": {"Google Place ID": {"id": "a%3Bb", "type": "rich_text"}}
+        }
+        mock_client_instance.databases.query.return_value = {"results": [], "has_more": False}
+
+        upserter = NotionBatchUpserter(api_key="test_key", database_id="test_db")
+        upserter._query_existing_practices_with_page_ids()
+        upserter._query_existing_practices_with_page_ids()
+
+        assert mock_client_instance.databases.retrieve.call_count == 1
+        assert mock_client_instance.databases.query.call_count == 2
+
+    @patch('src.integrations.notion_batch.Client')
+    def test_place_id_property_id_read_from_schema_cache(self, mock_notion_client):
+        """A fresh cached schema (e.g. from the startup check) avoids retrieve."""
+        notion_schema.save_cached_schema(
+            "test_db", {"properties": {"Google Place ID": {"id": "x%3Ay", "type": "rich_text"}}}
+        )
+        mock_client_instance = mock_notion_client.return_value
+        mock_client_instance.databases.query.return_value = {"results": [], "has_more": False}
+
+        upserter = NotionBatchUpserter(api_key="test_key", database_id="test_db")
+        upserter._query_existing_practices_with_page_ids()
+
+        mock_client_instance.databases.retrieve.assert_not_called()
+        mock_client_instance.databases.query.assert_called_once_with(
+            database_id="test_db", page_size=100, filter_properties=["x:y"]
+        )
+
+
 class TestPartialBatchFailure:
     """Test handling of partial batch failures (AC-FEAT-001-017)."""
 
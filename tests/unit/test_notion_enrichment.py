@@ -0,0 +1,103 @@
+"""
+Unit tests for NotionEnrichmentClient (FEAT-002).
+
+Tests concurrent enrichment updates.
+"""
+
+from unittest.mock import patch
+
+import httpx
+from notion_client import APIResponseError
+
+from src.integrations.notion_enrichment import NotionEnrichmentClient
+from src.models.enrichment_models import VetPracticeExtraction
+
+
+@patch("src.integrations.notion_enrichment.Client")
+def make_client(mock_client_cls, **kwargs):
+    """Build a NotionEnrichmentClient backed by a mocked Notion SDK client."""
+    return NotionEnrichmentClient(
+        api_key="secret_test", database_id="a" * 32, **kwargs
+    )
+
+
+def make_api_error(status, code, headers=None):
+    """APIResponseError as notion_client raises it for an error response."""
+    response = httpx.Response(status, headers=headers or {})
+    return APIResponseError(response, message=code, code=code)
+
+
+def make_extraction():
+    """Minimal valid extraction."""
+    return VetPracticeExtraction(vet_count_total=3, vet_count_confidence="high")
+
+
+class TestUpdatePracticesEnrichment:
+    """Test batch enrichment updates."""
+
+    def test_updates_all_pages(self):
+        """Every page in the batch gets one pages.update call."""
+        # Given: A client and 6 pending updates
+        client = make_client(max_concurrent_updates=3)
+        updates = [(f"page-{i}", make_extraction()) for i in range(6)]
+
+        # When: Updating in batch
+        outcomes = client.update_practices_enrichment(updates)
+
+        # Then: All pages updated successfully
+        assert outcomes == {f"page-{i}": True for i in range(6)}
+        assert client.client.pages.update.call_count == 6
+
+    def test_failed_page_does_not_fail_batch(self):
+        """A failing update is reported per page; others still succeed."""
+        client = make_client()
+
+        def update(page_id, properties):
+            if page_id == "page-1":
+                raise RuntimeError("boom")
+            return {"id": page_id}
+
+        client.client.pages.update.side_effect = update
+        updates = [(f"page-{i}", make_extraction()) for i in range(3)]
+
+        outcomes = client.update_practices_enrichment(updates)
+
+        assert outcomes == {"page-0": True, "page-1": False, "page-2": True}
+
+    def test_empty_batch(self):
+        """No updates means no API calls."""
+        client = make_client()
+
+        assert client.update_practices_enrichment([]) == {}
+        client.client.pages.update.assert_not_called()
+
+
+class TestRateLimitRetry:
+    """Test 429 handling on page updates."""
+
+    @patch("src.integrations.notion_enrichment.time.sleep")
+    def test_rate_limited_update_waits_retry_after_then_succeeds(self, mock_sleep):
+        """A 429 is retried after the server's Retry-After."""
+        client = make_client(rate_limit_delay=0)
+        client.client.pages.update.side_effect = [
+            make_api_error(429, "rate_limited", {"Retry-After": "2"}),
+            {"id": "page-0"},
+        ]
+
+        outcomes = client.update_practices_enrichment([("page-0", make_extraction())])
+
+        assert outcomes == {"page-0": True}
+        assert client.client.pages.update.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("src.integrations.notion_enrichment.time.sleep")
+    def test_validation_error_is_not_retried(self, mock_sleep):
+        """Non-rate-limit API errors fail the page on the first attempt."""
+        client = make_client(rate_limit_delay=0)
+        client.client.pages.update.side_effect = make_api_error(400, "validation_error")
+
+        outcomes = client.update_practices_enrichment([("page-0", make_extraction())])
+
+        assert outcomes == {"page-0": False}
+        assert client.client.pages.update.call_count == 1
+        mock_sleep.assert_not_called()
@@ -0,0 +1,136 @@
+"""
+Unit tests for Notion schema diffing (FEAT-001).
+
+Tests diff_schema set logic shared by the schema check scripts.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from src.integrations import notion_schema
+from src.integrations.notion_schema import (
+    REQUIRED_PROPERTIES,
+    diff_schema,
+    fetch_schema,
+    validate_notion_database,
+    SchemaDiff,
+)
+
+
+class TestDiffSchema:
+    """Test diff_schema helper."""
+
+    def test_diff_schema_classifies_properties(self):
+        """Existing, missing and mismatched properties are separated."""
+        # Given: Required fields and a schema with one of each outcome
+        required = {"Name": "title", "Website": "url", "Phone": "phone_number"}
+        properties = {
+            "Name": {"type": "title"},
+            "Website": {"type": "rich_text"},
+            "Unrelated": {"type": "number"},
+        }
+
+        # When: Diffing
+        diff = diff_schema(required, properties)
+
+        # Then: Each field lands in exactly one bucket
+        assert isinstance(diff, SchemaDiff)
+        assert diff.existing == {"Name"}
+        assert diff.missing == {"Phone"}
+        assert diff.mismatches == [("Website", "url", "rich_text")]
+
+    def test_diff_schema_complete(self):
+        """A complete schema has no missing or mismatched fields."""
+        required = {"Name": "title", "Lead Score": "number"}
+        properties = {"Name": {"type": "title"}, "Lead Score": {"type": "number"}}
+
+        diff = diff_schema(required, properties)
+
+        assert diff.existing == {"Name", "Lead Score"}
+        assert not diff.missing
+        assert not diff.mismatches
+
+
+class TestFetchSchema:
+    """Test fetch_schema memoization."""
+
+    def test_fetch_schema_hits_api_once_per_database(self):
+        """Repeated fetches for the same database reuse the cached response."""
+        client = MagicMock()
+        client.databases.retrieve.return_value = {"properties": {}}
+
+        with patch.object(notion_schema, "Client", return_value=client) as client_cls:
+            first = fetch_schema("db-1", "secret_x")
+            second = fetch_schema("db-1", "secret_x")
+
+        assert first is second
+        client_cls.assert_called_once_with(auth="secret_x")
+        client.databases.retrieve.assert_called_once_with(database_id="db-1")
+        # The client is not kept alive by the cache
+        client.close.assert_called_once()
+
+    def test_fetch_schema_keys_on_api_key(self):
+        """A different API key for the same database is fetched separately."""
+        client = MagicMock()
+        client.databases.retrieve.return_value = {"properties": {}}
+
+        with patch.object(notion_schema, "Client", return_value=client):
+            fetch_schema("db-2", "secret_a")
+            fetch_schema("db-2", "secret_b")
+
+        assert client.databases.retrieve.call_count == 2
+
+
+class TestSchemaDiskCache:
+    """Test the on-disk cache used by validate_notion_database."""
+
+    VALID = {"properties": {name: {"type": kind} for name, kind in REQUIRED_PROPERTIES.items()}}
+
+    def _client(self, database):
+        client = MagicMock()
+        client.databases.retrieve.return_value = database
+        return client
+
+    def test_validated_schema_is_reused_within_ttl(self, tmp_path, monkeypatch):
+        """A second validation within the TTL does not call Notion."""
+        monkeypatch.setattr(notion_schema, "SCHEMA_CACHE_DIR", tmp_path)
+        client = self._client(self.VALID)
+
+        with patch.object(notion_schema, "Client", return_value=client):
+            validate_notion_database("db-cache-1", "secret_x", cache_ttl=60)
+            cached = validate_notion_database("db-cache-1", "secret_x", cache_ttl=60)
+
+        assert cached == self.VALID
+        client.databases.retrieve.assert_called_once()
+
+    def test_no_ttl_always_fetches(self, tmp_path, monkeypatch):
+        """Without cache_ttl nothing is read from or written to disk."""
+        monkeypatch.setattr(notion_schema, "SCHEMA_CACHE_DIR", tmp_path)
+        client = self._client(self.VALID)
+
+        with patch.object(notion_schema, "Client", return_value=client):
+            validate_notion_database("db-cache-2", "secret_x")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cached_schema_that_fails_is_refetched(self, tmp_path, monkeypatch):
+        """A stale cached schema missing properties triggers a fresh fetch."""
+        monkeypatch.setattr(notion_schema, "SCHEMA_CACHE_DIR", tmp_path)
+        notion_schema.save_cached_schema("db-cache-3", {"properties": {}})
+        client = self._client(self.VALID)
+
+        with patch.object(notion_schema, "Client", return_value=client):
+            database = validate_notion_database("db-cache-3", "secret_x", cache_ttl=60)
+
+        assert database == self.VALID
+        client.databases.retrieve.assert_called_once()
+
+    def test_clear_cached_schema(self, tmp_path, monkeypatch):
+        """Clearing drops the cached schema so the next load misses."""
+        monkeypatch.setattr(notion_schema, "SCHEMA_CACHE_DIR", tmp_path)
+        notion_schema.save_cached_schema("db-cache-4", self.VALID)
+        assert notion_schema.load_cached_schema("db-cache-4", 60) == self.VALID
+
+        notion_schema.clear_cached_schema("db-cache-4")
+        notion_schema.clear_cached_schema("db-cache-4")  # already gone: no error
+
+        assert notion_schema.load_cached_schema("db-cache-4", 60) is None
@@ -0,0 +1,130 @@
+"""
+Unit tests for the Notion schema daemon.
+
+Tests the Unix-socket round trip, the no-daemon fallback, and that clients
+only trust sockets owned by the current user.
+"""
+
+import os
+import stat
+import tempfile
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.integrations import notion_schema_daemon
+from src.integrations.notion_schema_daemon import (
+    SchemaDaemon,
+    fetch_schema_via_daemon,
+    get_socket_path,
+)
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (AF_UNIX paths are length-limited)."""
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmp:
+        yield os.path.join(tmp, "schema.sock")
+
+
+class TestSchemaDaemon:
+    """Test daemon request handling."""
+
+    def test_fetch_via_daemon_returns_schema(self, socket_path):
+        """Daemon answers schema requests using its shared client."""
+        # Given: A daemon serving a mocked Notion client
+        client = MagicMock()
+        client.databases.retrieve.return_value = {"properties": {"Name": {"type": "title"}}}
+        server = SchemaDaemon(socket_path, client)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            # When: Requesting a schema twice
+            first = fetch_schema_via_daemon("db-1", socket_path=socket_path)
+            second = fetch_schema_via_daemon("db-1", socket_path=socket_path)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Then: Both requests are served by the same client
+        assert first == {"properties": {"Name": {"type": "title"}}}
+        assert second == first
+        assert client.databases.retrieve.call_count == 2
+
+    def test_fetch_via_daemon_reports_errors_as_none(self, socket_path):
+        """Errors inside the daemon fall back to a direct fetch (None)."""
+        client = MagicMock()
+        client.databases.retrieve.side_effect = RuntimeError("unauthorized")
+        server = SchemaDaemon(socket_path, client)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            assert fetch_schema_via_daemon("db-1", socket_path=socket_path) is None
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_fetch_without_daemon_returns_none(self, socket_path):
+        """No socket means no daemon."""
+        assert fetch_schema_via_daemon("db-1", socket_path=socket_path) is None
+
+    def test_socket_is_private(self, socket_path):
+        """The socket is created owner-only, not chmod-ed after binding."""
+        server = SchemaDaemon(socket_path, MagicMock())
+        try:
+            assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+        finally:
+            server.server_close()
+
+    def test_rejects_socket_owned_by_another_user(self, socket_path, monkeypatch):
+        """A socket planted by another user is never connected to."""
+        client = MagicMock()
+        server = SchemaDaemon(socket_path, client)
+        try:
+            other_uid = os.getuid() + 1
+            monkeypatch.setattr(notion_schema_daemon.os, "getuid", lambda: other_uid)
+            assert fetch_schema_via_daemon("db-1", socket_path=socket_path) is None
+        finally:
+            server.server_close()
+        client.databases.retrieve.assert_not_called()
+
+    def test_rejects_daemon_running_as_another_user(self, socket_path, monkeypatch):
+        """The peer's UID is checked before the response is trusted."""
+        client = MagicMock()
+        client.databases.retrieve.return_value = {"properties": {}}
+        server = SchemaDaemon(socket_path, client)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            monkeypatch.setattr(notion_schema_daemon, "_peer_uid", lambda sock: os.getuid() + 1)
+            assert fetch_schema_via_daemon("db-1", socket_path=socket_path) is None
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestGetSocketPath:
+    """Test default socket location."""
+
+    def test_prefers_env_override(self, monkeypatch):
+        """NOTION_SCHEMA_SOCKET wins over the defaults."""
+        monkeypatch.setenv("NOTION_SCHEMA_SOCKET", "/custom/schema.sock")
+        assert get_socket_path() == "/custom/schema.sock"
+
+    def test_uses_xdg_runtime_dir(self, monkeypatch):
+        """The per-user runtime directory is the first default."""
+        monkeypatch.delenv("NOTION_SCHEMA_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+        assert get_socket_path() == "/run/user/1000/us-vet-scraping/notion-schema.sock"
+
+    def test_falls_back_to_cache_dir(self, monkeypatch):
+        """Without XDG_RUNTIME_DIR the socket stays out of /tmp."""
+        monkeypatch.delenv("NOTION_SCHEMA_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        path = get_socket_path()
+        assert path.endswith(os.path.join(".cache", "us-vet-scraping", "daemon", "notion-schema.sock"))
+        assert not path.startswith("/tmp")
@@ -7,6 +7,7 @@ and error handling for website timeouts and connection failures.
 
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 # TODO: Import WebsiteScraper, WebsiteData, BFSDeepCrawlStrategy, URLPatternFilter
 # from src.enrichment.website_scraper import WebsiteScraper
 # from src.models.website_data import WebsiteData
@@ -160,3 +161,87 @@ class TestCaching:
         # TODO: Scrape same URL twice
         # TODO: Verify AsyncWebCrawler.arun called only once (second is cache hit)
         pass
+
+
+def _crawl_result(url, success=True, html="<p>content</p>"):
+    """Minimal stand-in for a Crawl4AI CrawlResult."""
+    return SimpleNamespace(
+        url=url, success=success, cleaned_html=html,
+        metadata={"title": url}, error_message=None if success else "timeout"
+    )
+
+
+class _FakeCrawler:
+    """AsyncWebCrawler stand-in that streams canned results.
+
+    Records each call's deep crawl strategy and, like Crawl4AI, counts the
+    pages it yields on that strategy.
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.strategies = []
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def arun(self, url, config):
+        strategy = config.deep_crawl_strategy
+        self.strategies.append((strategy, strategy._pages_crawled))
+
+        async def stream():
+            for result in self.results:
+                strategy._pages_crawled += 1
+                yield result
+
+        return stream()
+
+
+class TestStreamingScrape:
+    """Test scrape_multi_page_iter() streaming pages as they finish."""
+
+    @pytest.fixture
+    def scraper(self):
+        from crawl4ai import CrawlerRunConfig
+        from src.enrichment.website_scraper import WebsiteScraper
+
+        scraper = WebsiteScraper(cache_enabled=False, max_pages=3)
+        scraper._config = CrawlerRunConfig(deep_crawl_strategy=scraper._make_strategy())
+        return scraper
+
+    @pytest.mark.asyncio
+    async def test_skips_failed_and_empty_pages(self, scraper):
+        """
+        Given: A crawl with one good page, one failed page and one empty page
+        When: scrape_multi_page_iter() is consumed
+        Then: Only the good page is yielded
+        """
+        scraper._crawler = _FakeCrawler([
+            _crawl_result("https://vet.example/"),
+            _crawl_result("https://vet.example/team", success=False),
+            _crawl_result("https://vet.example/about", html=""),
+        ])
+
+        pages = [page async for page in scraper.scrape_multi_page_iter("https://vet.example/")]
+
+        assert [page.url for page in pages] == ["https://vet.example/"]
+
+    @pytest.mark.asyncio
+    async def test_second_call_uses_fresh_strategy(self, scraper):
+        """
+        Given: A crawl that reaches max_pages
+        When: scrape_multi_page_iter() is called again
+        Then: The second call gets a new strategy with no pages counted and
+              still yields its pages
+        """
+        scraper._crawler = _FakeCrawler([
+            _crawl_result(f"https://vet.example/page-{i}") for i in range(3)
+        ])
+
+        first = [page async for page in scraper.scrape_multi_page_iter("https://vet.example/")]
+        second = [page async for page in scraper.scrape_multi_page_iter("https://vet.example/")]
+
+        assert len(first) == len(second) == 3
+        (first_strategy, first_count), (second_strategy, second_count) = scraper._crawler.strategies
+        assert second_strategy is not first_strategy
+        assert first_count == second_count == 0
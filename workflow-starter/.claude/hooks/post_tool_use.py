@@ -10,9 +10,15 @@ Runs after Edit/Write tool usage to automatically:
 Supports: prettier, black, rustfmt, gofmt, and more
 """
 
+import functools
+import hashlib
 import json
+import os
+import re
+import shutil
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # File extension to formatter mapping
@@ -54,22 +60,138 @@ SKIP_FORMATTING = {
     '.dockerignore',
 }
 
+# Single extension -> (formatter, args) lookup; None means "never format"
+_EXT_DISPATCH = {ext: None for ext in SKIP_FORMATTING} | FORMATTERS
+
+# Skip-list fast path for str.endswith
+_SKIP_EXT_TUPLE = tuple(SKIP_FORMATTING)
+
+# Lockfiles (package-lock.json, pnpm-lock.json, ...) are never formatted
+_LOCKFILE_RE = re.compile(r'lock', re.IGNORECASE)
+
+# Upper bound on concurrent formatter processes
+MAX_FORMAT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Fire-and-forget formatting (POST_TOOL_USE_ASYNC=0 waits for results, e.g. in CI)
+ASYNC_FORMATTING = os.environ.get("POST_TOOL_USE_ASYNC", "1") != "0"
+
+# Formatter availability cache, invalidated whenever $PATH changes
+FORMATTER_CACHE_FILE = Path(__file__).resolve().parent.parent / "formatter-cache.json"
+
+# Post-format content hashes; files whose content still matches are skipped
+FORMAT_HASH_CACHE_FILE = Path(__file__).resolve().parent.parent / "format-hash-cache.json"
+
+# argv[1] of the detached child that formats a batch and records its hashes
+FORMAT_AND_RECORD_FLAG = "--format-and-record"
+
+def _path_hash():
+    """Hash of the current $PATH, used to key the formatter cache"""
+    return hashlib.blake2b(os.environ.get("PATH", "").encode()).hexdigest()
+
+def _load_formatter_cache():
+    """Load cached formatter availability for the current $PATH"""
+    try:
+        with open(FORMATTER_CACHE_FILE) as f:
+            cache = json.load(f)
+        if cache.get("path_hash") == _path_hash():
+            return cache.get("formatters", {})
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {}
+
+def _save_formatter_cache(formatters):
+    """Persist formatter availability for the current $PATH"""
+    try:
+        with open(FORMATTER_CACHE_FILE, 'w') as f:
+            json.dump({"path_hash": _path_hash(), "formatters": formatters}, f)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=None)
 def check_formatter_available(formatter):
-    """Check if a formatter is installed"""
+    """Check if a formatter is installed (memoized in-process and on disk)"""
+    cache = _load_formatter_cache()
+    if formatter in cache:
+        return cache[formatter]
+
+    available = shutil.which(formatter) is not None
+    cache[formatter] = available
+    _save_formatter_cache(cache)
+    return available
+
+def file_content_hash(file_path):
+    """blake2b digest of a file's content, or None if it can't be read"""
     try:
-        result = subprocess.run(
-            ['which', formatter],
-            capture_output=True,
-            timeout=2
-        )
-        return result.returncode == 0
-    except:
-        return False
+        with open(file_path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
 
-def run_formatter(file_path, formatter, args):
-    """Run formatter on a file"""
+def load_format_hash_cache():
+    """Load the path -> post-format content hash cache"""
+    try:
+        with open(FORMAT_HASH_CACHE_FILE) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_format_hash_cache(cache):
+    """Persist the path -> post-format content hash cache
+
+    Written to a temp file and renamed, so a concurrent hook never reads a
+    half-written cache.
+    """
+    tmp_file = FORMAT_HASH_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
     try:
-        cmd = [formatter] + args + [str(file_path)]
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, FORMAT_HASH_CACHE_FILE)
+    except OSError:
+        pass
+
+def record_format_hashes(file_paths):
+    """Store the current content hash of freshly formatted files"""
+    cache = load_format_hash_cache()
+    for file_path in file_paths:
+        content_hash = file_content_hash(file_path)
+        if content_hash is not None:
+            cache[os.path.abspath(file_path)] = content_hash
+    save_format_hash_cache(cache)
+
+def format_and_record(job):
+    """Detached-child entry point: format one batch, then record its hashes"""
+    result = run_formatter(job["files"], job["formatter"], job["args"], async_mode=False)
+    if result.get("success"):
+        record_format_hashes(result["files"])
+
+def run_formatter(file_paths, formatter, args, async_mode=None):
+    """Run formatter on one or more files in a single invocation
+
+    In async mode a detached copy of this hook runs the formatter and
+    records the post-format hashes; the result is not awaited, so
+    "success" is None.
+    """
+    if isinstance(file_paths, (str, Path)):
+        file_paths = [file_paths]
+    files = [str(p) for p in file_paths]
+    if async_mode is None:
+        async_mode = ASYNC_FORMATTING
+
+    try:
+        cmd = [formatter] + args + files
+
+        if async_mode:
+            job = {"formatter": formatter, "args": list(args), "files": files}
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__),
+                 FORMAT_AND_RECORD_FLAG, json.dumps(job)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+            return {"success": None, "formatter": formatter, "files": files, "mode": "async"}
+
         result = subprocess.run(
             cmd,
             capture_output=True,
@@ -78,69 +200,96 @@ def run_formatter(file_path, formatter, args):
         )
 
         if result.returncode == 0:
-            return {"success": True, "formatter": formatter}
+            return {"success": True, "formatter": formatter, "files": files}
         else:
             return {
                 "success": False,
                 "formatter": formatter,
+                "files": files,
                 "error": result.stderr.strip() if result.stderr else "Unknown error"
             }
     except subprocess.TimeoutExpired:
         return {
             "success": False,
             "formatter": formatter,
+            "files": files,
             "error": "Formatter timed out (30s)"
         }
     except Exception as e:
         return {
             "success": False,
             "formatter": formatter,
+            "files": files,
             "error": str(e)
         }
 
+def run_formatters(jobs):
+    """Run formatter jobs concurrently, batching files that share a formatter
+
+    Args:
+        jobs: List of (file_path, formatter, args) tuples
+
+    Returns:
+        List of run_formatter results, one per formatter invocation
+    """
+    batches = {}
+    for file_path, formatter, args in jobs:
+        batches.setdefault((formatter, tuple(args)), []).append(file_path)
+
+    # Spawning is non-blocking in async mode, so no pool is needed
+    if len(batches) == 1 or ASYNC_FORMATTING:
+        return [
+            run_formatter(files, formatter, list(args))
+            for (formatter, args), files in batches.items()
+        ]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_FORMAT_WORKERS, len(batches))) as executor:
+        return list(executor.map(
+            lambda item: run_formatter(item[1], item[0][0], list(item[0][1])),
+            batches.items()
+        ))
+
 def should_format_file(file_path):
     """Determine if a file should be formatted"""
-    path = Path(file_path)
+    # Skip files in skip list
+    if file_path.lower().endswith(_SKIP_EXT_TUPLE):
+        return False, None
+
+    # Get file extension without building a Path
+    dot = file_path.rfind('.')
+    ext = file_path[dot:].lower() if dot != -1 else ''
 
-    # Skip non-existent files
-    if not path.exists():
+    # Skip files without a formatter (also rejects dots in directory names)
+    entry = _EXT_DISPATCH.get(ext)
+    if entry is None:
         return False, None
 
-    # Skip directories
-    if path.is_dir():
+    # Special case: .json files - skip package-lock.json etc.
+    if ext == '.json' and _LOCKFILE_RE.search(os.path.basename(file_path)):
         return False, None
 
-    # Get file extension
-    ext = path.suffix.lower()
+    path = Path(file_path)
 
-    # Skip files in skip list
-    if ext in SKIP_FORMATTING:
+    # Skip non-existent files and directories
+    if not path.is_file():
         return False, None
 
-    # Special case: .json files - check if they're config files
-    if ext == '.json':
-        # Skip package-lock.json, yarn.lock, etc.
-        if 'lock' in path.name.lower():
-            return False, None
-
-    # Check if we have a formatter for this extension
-    if ext in FORMATTERS:
-        formatter, args = FORMATTERS[ext]
+    formatter, args = entry
 
-        # Check if formatter is available
-        if check_formatter_available(formatter):
-            return True, (formatter, args)
-        else:
-            return False, {'not_installed': formatter}
+    # Check if formatter is available
+    if check_formatter_available(formatter):
+        return True, (formatter, args)
+    else:
+        return False, {'not_installed': formatter}
 
-    return False, None
+def is_docs_file(file_path):
+    """Cheap check for files under a docs/ directory"""
+    return 'docs/' in file_path or 'docs\\' in file_path
 
 def update_docs_index(file_path):
     """Update docs/README.md when documentation changes"""
-    path = Path(file_path)
-
-    # Only process files in docs/ directory
-    if 'docs/' not in str(path):
+    # Only process files in docs/ directory (plain string test, no Path/stat)
+    if not is_docs_file(file_path):
         return None
 
     # Find project root
@@ -158,9 +307,24 @@ def update_docs_index(file_path):
 
     return None
 
+def collect_file_paths(params):
+    """Collect edited file paths from hook params (single file or batch)"""
+    file_paths = []
+    if params.get("file_path"):
+        file_paths.append(params["file_path"])
+    for file_path in params.get("file_paths", []) or []:
+        if file_path and file_path not in file_paths:
+            file_paths.append(file_path)
+    return file_paths
+
 def main():
     """Main hook execution"""
     try:
+        # Detached formatter child spawned by run_formatter in async mode
+        if len(sys.argv) > 2 and sys.argv[1] == FORMAT_AND_RECORD_FLAG:
+            format_and_record(json.loads(sys.argv[2]))
+            sys.exit(0)
+
         # Read JSON input from stdin
         input_data = json.load(sys.stdin)
 
@@ -173,37 +337,74 @@ def main():
             # Silent pass for other tools
             sys.exit(0)
 
-        # Get the file path that was modified
-        file_path = params.get("file_path", "")
-        if not file_path:
+        # Get the file path(s) that were modified
+        file_paths = collect_file_paths(params)
+        if not file_paths:
             sys.exit(0)
 
         results = {
             "hook": "PostToolUse",
             "tool": tool_name,
-            "file": file_path,
+            "file": file_paths[0],
             "actions": []
         }
-
-        # Check if file should be formatted
-        should_format, formatter_info = should_format_file(file_path)
-
-        if should_format and isinstance(formatter_info, tuple):
-            formatter, args = formatter_info
-            format_result = run_formatter(file_path, formatter, args)
-            results["actions"].append({
-                "type": "format",
-                "result": format_result
-            })
-        elif should_format and isinstance(formatter_info, dict) and 'not_installed' in formatter_info:
-            # Formatter not installed - silent skip
-            results["actions"].append({
-                "type": "format_skipped",
-                "reason": f"{formatter_info['not_installed']} not installed"
-            })
+        if len(file_paths) > 1:
+            results["files"] = file_paths
+
+        # Check which files should be formatted
+        format_jobs = []
+        hash_cache = load_format_hash_cache()
+        for file_path in file_paths:
+            should_format, formatter_info = should_format_file(file_path)
+
+            if should_format and isinstance(formatter_info, tuple):
+                formatter, args = formatter_info
+
+                # Content unchanged since we last formatted it - skip
+                # (an unreadable file has no hash and is never a hit)
+                content_hash = file_content_hash(file_path)
+                if content_hash is not None and hash_cache.get(os.path.abspath(file_path)) == content_hash:
+                    results["actions"].append({
+                        "type": "format",
+                        "result": {"success": True, "formatter": formatter,
+                                   "files": [file_path], "cached": True}
+                    })
+                    continue
+
+                format_jobs.append((file_path, formatter, args))
+            elif should_format and isinstance(formatter_info, dict) and 'not_installed' in formatter_info:
+                # Formatter not installed - silent skip
+                results["actions"].append({
+                    "type": "format_skipped",
+                    "reason": f"{formatter_info['not_installed']} not installed"
+                })
+
+        # Fast path: nothing to format and no docs touched
+        docs_paths = [file_path for file_path in file_paths if is_docs_file(file_path)]
+        if not format_jobs and not docs_paths and not results["actions"]:
+            sys.exit(0)
 
         # Check if docs index needs updating
-        docs_update = update_docs_index(file_path)
+        docs_update = None
+        for file_path in docs_paths:
+            docs_update = update_docs_index(file_path)
+            if docs_update:
+                break
+
+        if format_jobs:
+            formatted = []
+            for format_result in run_formatters(format_jobs):
+                results["actions"].append({
+                    "type": "format",
+                    "result": format_result
+                })
+                if format_result.get("success"):
+                    formatted.extend(format_result["files"])
+
+            # Async batches record their own hashes once the formatter exits
+            if formatted:
+                record_format_hashes(formatted)
+
         if docs_update:
             results["actions"].append({
                 "type": "docs_index",